@@ -1,26 +1,29 @@
-from .client import AdeskClient
-from .exceptions import (
-    AdeskAPIError,
-    AdeskAuthError,
-    AdeskBadRequestError,
-    AdeskNotFoundError,
-    AdeskPaymentRequiredError,
-    AdeskRateLimitError,
-    AdeskServerError
-)
-from .models import (
-    Project, TransactionCategory, BankAccount, Commitment, LegalEntity,
-    Transfer, Operation, Contractor, Requisite, Product, Unit, Tag, Webhook,
-    CustomReportGroup, CustomReportEntry, CustomReportValue, CustomReportValueList,
-    CustomReportDebtEntry
-    # BaseModel and other nested/helper models are not typically exported at top level
-    # unless specifically desired for direct use by the SDK user.
-)
+# Public names are imported lazily on first access (see adesk/_lazy.py), so that
+# `import adesk` does not load every resource and model module, nor `requests`.
+from ._lazy import lazy_attributes
 
 __version__ = '0.1.0'
 
 __all__ = [
     'AdeskClient',
+    'RateLimiter',
+    'BulkResult',
+    'OperationImporter',
+    'ImportJournal',
+    'IdempotentCreator',
+    'MemoryIdempotencyStore',
+    'SQLiteIdempotencyStore',
+    'Outbox',
+    'LocalMirror',
+    'WebhookApplier',
+    'WebhookEvent',
+    'WebhookReceiver',
+    'WebhookBuffer',
+    'Reconciler',
+    'ReferenceRegistry',
+    'Aggregation',
+    'BalanceIndex',
+    'CashFlowForecast',
     # Exceptions
     'AdeskAPIError',
     'AdeskAuthError',
@@ -29,6 +32,8 @@ __all__ = [
     'AdeskPaymentRequiredError',
     'AdeskRateLimitError',
     'AdeskServerError',
+    'AdeskBulkError',
+    'AdeskOutcomeUnknownError',
     # Version
     '__version__',
     # Exported Models
@@ -51,3 +56,31 @@ __all__ = [
     'CustomReportValueList',
     'CustomReportDebtEntry',
 ]
+
+_LAZY_ATTRIBUTES = {
+    'AdeskClient': '.client',
+    'RateLimiter': '.rate_limit',
+    'BulkResult': '.bulk',
+    'OperationImporter': '.importer',
+    'ImportJournal': '.importer',
+    'IdempotentCreator': '.idempotency',
+    'MemoryIdempotencyStore': '.idempotency',
+    'SQLiteIdempotencyStore': '.idempotency',
+    'Outbox': '.outbox',
+    'LocalMirror': '.mirror',
+    'WebhookApplier': '.webhook_sync',
+    'WebhookEvent': '.webhook_sync',
+    'WebhookReceiver': '.webhook_server',
+    'WebhookBuffer': '.webhook_buffer',
+    'Reconciler': '.reconcile',
+    'ReferenceRegistry': '.registry',
+    'Aggregation': '.aggregate',
+    'BalanceIndex': '.balances',
+    'CashFlowForecast': '.forecast',
+}
+_LAZY_ATTRIBUTES.update({name: '.exceptions' for name in __all__ if name.startswith('Adesk') and name != 'AdeskClient'})
+# BaseModel and other nested/helper models are not typically exported at top level
+# unless specifically desired for direct use by the SDK user.
+_LAZY_ATTRIBUTES.update({name: '.models' for name in __all__ if name not in _LAZY_ATTRIBUTES and name != '__version__'})
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
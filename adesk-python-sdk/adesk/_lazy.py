@@ -0,0 +1,35 @@
+# adesk/_lazy.py
+import importlib
+import sys
+
+
+def lazy_attributes(package, attributes):
+    """
+    Builds module-level `__getattr__` and `__dir__` functions (PEP 562) that import
+    public names of a package only when they are first accessed.
+
+    Keeps `import adesk` cheap for short-lived processes: submodules (and their
+    dependencies, such as `requests`) are loaded on demand, and each resolved name
+    is cached in the package namespace so later lookups are plain attribute reads.
+
+    Args:
+        package (str): The `__name__` of the package.
+        attributes (dict[str, str]): Maps each public name to the relative module
+                                     defining it (e.g., `{"AdeskClient": ".client"}`).
+
+    Returns:
+        tuple: The `(__getattr__, __dir__)` functions to assign in the package.
+    """
+    def __getattr__(name):
+        try:
+            module_name = attributes[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,275 @@
+# adesk/aggregate.py
+from datetime import date, timedelta
+
+from .mirror import LocalMirror, _import_pandas, _ref_id, _to_date
+
+# Dimension -> column of `LocalMirror` tables and `list_frame` DataFrames.
+DIMENSIONS = {
+    "category": "category_id",
+    "project": "project_id",
+    "contractor": "contractor_id",
+    "bank_account": "bank_account_id",
+    "legal_entity": "legal_entity_id",
+    "business_unit": "business_unit_id",
+    "type": "type",
+}
+
+
+def _legal_entity(data):
+    bank_account = data.get("bankAccount")
+    if data.get("legalEntity") is None and isinstance(bank_account, dict):
+        return _ref_id(bank_account.get("legalEntity"))
+    return _ref_id(data.get("legalEntity"))
+
+
+# Dimension -> value of raw operation data.
+_GETTERS = {
+    "category": lambda data: _ref_id(data.get("category")),
+    "project": lambda data: _ref_id(data.get("project")),
+    "contractor": lambda data: _ref_id(data.get("contractor")),
+    "bank_account": lambda data: _ref_id(data.get("bankAccount")),
+    "legal_entity": _legal_entity,
+    "business_unit": lambda data: _ref_id(data.get("businessUnit") or data.get("business_unit")),
+    "type": lambda data: data.get("type"),
+}
+
+
+def _week(day):
+    first = date(int(day[:4]), int(day[5:7]), int(day[8:10]))
+    return (first - timedelta(days=first.weekday())).isoformat()
+
+
+# Period -> label of a YYYY-MM-DD date: the day, the week's Monday, "2024-03", "2024-Q1" or "2024".
+PERIODS = {
+    "day": lambda day: day,
+    "week": _week,
+    "month": lambda day: day[:7],
+    "quarter": lambda day: f"{day[:4]}-Q{(int(day[5:7]) + 2) // 3}",
+    "year": lambda day: day[:4],
+}
+
+# The same labels computed by SQLite from a date column ({0}).
+_SQL_PERIODS = {
+    "day": "{0}",
+    "week": "date({0}, '-' || ((CAST(strftime('%w', {0}) AS INTEGER) + 6) % 7) || ' days')",
+    "month": "substr({0}, 1, 7)",
+    "quarter": "substr({0}, 1, 4) || '-Q' || ((CAST(substr({0}, 6, 2) AS INTEGER) + 2) / 3)",
+    "year": "substr({0}, 1, 4)",
+}
+
+
+def _sort_key(key):
+    return tuple((value is not None, value) for value in key)
+
+
+class Aggregation:
+    """
+    Operation count, income and outcome per group, as returned by `aggregate`.
+
+    Attributes:
+        keys (tuple[str]): Names of the parts of a group key: "period" (if bucketed by time)
+                           followed by the dimensions.
+        groups (dict): `{key: (count, income, outcome)}`, with `key` a tuple in `keys` order.
+    """
+    def __init__(self, keys, groups):
+        self.keys = tuple(keys)
+        self.groups = groups
+
+    def __len__(self):
+        return len(self.groups)
+
+    @property
+    def total(self):
+        """dict: Count, income, outcome and net (income - outcome) over all groups."""
+        return self._measures(self.rollup().groups.get((), (0, 0.0, 0.0)))
+
+    def rows(self):
+        """
+        Returns the groups as dicts, sorted by key (None first).
+
+        Returns:
+            list[dict]: The key parts by name, and "count", "income", "outcome" and "net".
+        """
+        rows = []
+        for key in sorted(self.groups, key=_sort_key):
+            row = dict(zip(self.keys, key))
+            row.update(self._measures(self.groups[key]))
+            rows.append(row)
+        return rows
+
+    def rollup(self, *keys):
+        """
+        Aggregates further, to a subset of the keys (e.g., from category and month to month).
+
+        Args:
+            *keys (str): The key parts to keep; none gives a single group with key `()`.
+
+        Returns:
+            Aggregation: The coarser aggregation.
+        """
+        unknown = [name for name in keys if name not in self.keys]
+        if unknown:
+            raise ValueError(f"Not a key of this aggregation: {', '.join(unknown)}")
+        positions = [self.keys.index(name) for name in keys]
+        groups = {}
+        for key, (count, income, outcome) in self.groups.items():
+            coarse = tuple(key[position] for position in positions)
+            totals = groups.get(coarse, (0, 0.0, 0.0))
+            groups[coarse] = (totals[0] + count, totals[1] + income, totals[2] + outcome)
+        return Aggregation(keys, groups)
+
+    def pivot(self, index, columns, value="net"):
+        """
+        Returns one measure as a table: `{index value: {column value: measure}}`.
+
+        Args:
+            index (str): Key part whose values are the rows (e.g., "category").
+            columns (str): Key part whose values are the columns (e.g., "period").
+            value (str, optional): "count", "income", "outcome" or "net". Defaults to "net".
+
+        Returns:
+            dict: The table; combinations without operations are missing.
+        """
+        if value not in ("count", "income", "outcome", "net"):
+            raise ValueError(f"Unknown measure: {value!r}")
+        table = {}
+        for row in self.rollup(index, columns).rows():
+            table.setdefault(row[index], {})[row[columns]] = row[value]
+        return table
+
+    def to_frame(self):
+        """Returns `rows()` as a pandas DataFrame. Requires pandas."""
+        pandas = _import_pandas("Aggregation.to_frame")
+        return pandas.DataFrame(self.rows(), columns=list(self.keys) + ["count", "income", "outcome", "net"])
+
+    @staticmethod
+    def _measures(totals):
+        count, income, outcome = totals
+        return {"count": count, "income": round(income, 2), "outcome": round(outcome, 2),
+                "net": round(income - outcome, 2)}
+
+    def __repr__(self):
+        return f"<Aggregation(keys={self.keys}, groups={len(self.groups)})>"
+
+
+def aggregate(source, by=(), period=None, **filters):
+    """
+    Groups operations and sums their amounts, without per-operation Python objects where possible.
+
+    The source may be:
+
+    - a `LocalMirror`: the grouping runs in SQLite, and `filters` (the filters of
+      `LocalMirror.list_all`) select the operations;
+    - a pandas DataFrame from `LocalMirror.list_frame`: vectorized pandas group-by;
+    - any iterable of `Operation` objects or raw operation dicts (e.g., `Operations.list_all()`
+      or an export): one pass with a hash table of groups.
+
+    Args:
+        source (LocalMirror | pandas.DataFrame | iterable): The operations.
+        by (str | iterable[str], optional): Dimensions to group by: "category", "project",
+                                            "contractor", "bank_account", "legal_entity",
+                                            "business_unit" and/or "type".
+        period (str, optional): Also group by time: "day", "week", "month", "quarter" or "year".
+        **filters: `LocalMirror.list_all` filters; only for a mirror source.
+
+    Returns:
+        Aggregation: Count, income (type 1) and outcome (type 2) per group.
+
+    Raises:
+        ValueError: If a dimension or period is unknown, or filters are given for another source.
+
+    Example:
+        by_month = aggregate(mirror, by="category", period="month", range_start="2024-01-01")
+        by_month.pivot("category", "period")
+    """
+    by = (by,) if isinstance(by, str) else tuple(by)
+    unknown = [name for name in by if name not in DIMENSIONS]
+    if unknown:
+        raise ValueError(f"Unknown dimension: {', '.join(unknown)}. Known: {', '.join(DIMENSIONS)}.")
+    if period is not None and period not in PERIODS:
+        raise ValueError(f"Unknown period: {period!r}. Known: {', '.join(PERIODS)}.")
+    keys = (("period",) if period else ()) + by
+
+    if isinstance(source, LocalMirror): # Not duck-typed: DataFrames have a `_where` method too.
+        groups = _from_mirror(source, by, period, filters)
+    elif filters:
+        raise ValueError("Filters are only supported when aggregating a LocalMirror.")
+    elif hasattr(source, "groupby") and hasattr(source, "columns"):
+        groups = _from_frame(source, keys, by, period)
+    else:
+        groups = _from_operations(source, by, period)
+    return Aggregation(keys, groups)
+
+
+def _from_mirror(mirror, by, period, filters):
+    where, args, date_column = mirror._where(**filters)
+    expressions = ([_SQL_PERIODS[period].format(date_column)] if period else []) + [DIMENSIONS[name] for name in by]
+    sql = (f"SELECT {''.join(expression + ', ' for expression in expressions)}COUNT(*), "
+           f"TOTAL(CASE WHEN type = 1 THEN amount END), TOTAL(CASE WHEN type = 2 THEN amount END) "
+           f"FROM operations{where}")
+    if expressions:
+        sql += f" GROUP BY {', '.join(str(position) for position in range(1, len(expressions) + 1))}"
+    size = len(expressions)
+    return {tuple(row[:size]): tuple(row[size:]) for row in mirror._query(sql, args) if row[size]}
+
+
+def _from_frame(frame, keys, by, period):
+    amount = frame["amount"].fillna(0.0)
+    data = {name: frame[DIMENSIONS[name]] for name in by}
+    if period:
+        data["period"] = _frame_periods(frame["date"], period)
+    data.update(count=1, income=amount.where(frame["type"] == 1, 0.0), outcome=amount.where(frame["type"] == 2, 0.0))
+    table = frame.__class__(data, index=frame.index)
+    if not keys:
+        return {(): (len(table), float(table["income"].sum()), float(table["outcome"].sum()))} if len(table) else {}
+    grouped = table.groupby(list(keys), dropna=False, sort=False)[["count", "income", "outcome"]].sum()
+    groups = {}
+    for key, count, income, outcome in grouped.itertuples(name=None):
+        key = key if isinstance(key, tuple) else (key,)
+        groups[tuple(_scalar(value) for value in key)] = (int(count), float(income), float(outcome))
+    return groups
+
+
+def _frame_periods(dates, period):
+    if period == "week":
+        pandas = _import_pandas("aggregate")
+        days = pandas.to_datetime(dates)
+        return (days - pandas.to_timedelta(days.dt.weekday, unit="D")).dt.strftime("%Y-%m-%d")
+    if period == "quarter":
+        return dates.str[:4] + "-Q" + ((dates.str[5:7].astype(int) + 2) // 3).astype(str)
+    return dates.str[:{"day": 10, "month": 7, "year": 4}[period]]
+
+
+def _scalar(value):
+    """Converts a pandas group key part to a plain value (NaN to None, 5.0 to 5)."""
+    if value is None or value != value:
+        return None
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _from_operations(operations, by, period):
+    getters = [_GETTERS[name] for name in by]
+    label = PERIODS[period] if period else None
+    labels = {} # Raw date -> period label, computed once per distinct date.
+    groups = {}
+    for operation in operations:
+        data = getattr(operation, "_data", operation)
+        key = tuple(getter(data) for getter in getters)
+        if label is not None:
+            raw = data.get("dateIso") or data.get("date")
+            bucket = labels.get(raw)
+            if bucket is None:
+                bucket = labels[raw] = label(_to_date(raw).isoformat())
+            key = (bucket,) + key
+        totals = groups.get(key)
+        if totals is None:
+            totals = groups[key] = [0, 0.0, 0.0]
+        totals[0] += 1
+        kind = data.get("type")
+        if kind == 1 or kind == 2:
+            totals[kind] += float(data.get("amount") or 0.0)
+    return {key: tuple(totals) for key, totals in groups.items()}
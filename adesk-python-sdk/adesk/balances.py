@@ -0,0 +1,252 @@
+# adesk/balances.py
+import threading
+from datetime import timedelta
+
+from .mirror import _ref_id, _to_date
+
+
+class _Fenwick:
+    """Binary indexed tree over per-day amounts: point updates and prefix sums in O(log n)."""
+    def __init__(self, values):
+        self.tree = [0.0] + list(values)
+        size = len(self.tree)
+        for i in range(1, size): # O(n) construction
+            parent = i + (i & -i)
+            if parent < size:
+                self.tree[parent] += self.tree[i]
+
+    def __len__(self):
+        return len(self.tree) - 1
+
+    def add(self, index, delta):
+        i = index + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index):
+        """Sum of the values at positions 0 to `index`."""
+        total, i = 0.0, min(index + 1, len(self.tree) - 1)
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+
+class _Account:
+    """Per-account state: opening balance, per-day movements and their prefix-sum tree."""
+    def __init__(self, initial_amount=0.0, initial_date=None):
+        self.initial_amount = initial_amount
+        self.initial_date = initial_date # ordinal; movements before it are not counted
+        self.days = {} # ordinal -> net movement of the day
+        self.base = None
+        self.tree = _Fenwick([])
+
+    def move(self, day, delta):
+        self.days[day] = self.days.get(day, 0.0) + delta
+        if self.initial_date is not None and day < self.initial_date:
+            return
+        if self.base is None or day < self.base or day - self.base >= len(self.tree):
+            self.rebuild()
+        else:
+            self.tree.add(day - self.base, delta)
+
+    def rebuild(self):
+        counted = [day for day in self.days if self.initial_date is None or day >= self.initial_date]
+        if self.initial_date is not None:
+            self.base = self.initial_date
+        elif counted:
+            self.base = min(counted)
+        else:
+            self.base = None
+            self.tree = _Fenwick([])
+            return
+        span = max(counted, default=self.base) - self.base + 1
+        values = [0.0] * (span * 2) # Room to grow without rebuilding on every new day.
+        for day in counted:
+            values[day - self.base] += self.days[day]
+        self.tree = _Fenwick(values)
+
+    def balance(self, day=None):
+        if self.initial_date is not None and day is not None and day < self.initial_date:
+            return None
+        if self.base is None or (day is not None and day < self.base):
+            return round(self.initial_amount, 2)
+        index = len(self.tree) - 1 if day is None else day - self.base
+        return round(self.initial_amount + self.tree.prefix(index), 2)
+
+
+def _float(value):
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class BalanceIndex:
+    """
+    Balances of bank accounts at any date, from their opening balance and operations.
+
+    Each account keeps its net movement per day in a prefix-sum tree (a
+    Fenwick tree) indexed by days since its `initial_amount_date`, so the
+    balance at a date and each point of a balance series take O(log n)
+    instead of re-summing every operation. Adding or removing an operation
+    updates one day in O(log n) as well.
+
+    Incomes (type 1) add to the balance and outcomes (type 2) subtract. The
+    amount in the account's currency, `bank_account_amount`, is used when
+    the operation has one (multi-currency accounts), otherwise `amount`.
+    Planned operations are skipped unless `include_planned` is set.
+
+    Example:
+        balances = BalanceIndex.from_client(client, mirror=mirror)
+        balances.balance(3, on="2024-03-31")
+        balances.series(3, "2024-01-01", "2024-03-31", step="month")
+        receiver.on("transaction_*", lambda event: balances.add(event.objects))
+    """
+    def __init__(self, bank_accounts=(), operations=(), include_planned=False):
+        """
+        Initializes the BalanceIndex.
+
+        Args:
+            bank_accounts (iterable[BankAccount], optional): Accounts with their opening balances.
+            operations (iterable[Operation | dict], optional): Operations to index.
+            include_planned (bool, optional): Count planned operations too. Defaults to False.
+        """
+        self.include_planned = include_planned
+        self._accounts = {}
+        self._operations = {} # operation ID -> (account ID, day, delta) counted for it
+        self._lock = threading.Lock()
+        self.set_accounts(bank_accounts)
+        self.add(operations)
+
+    @classmethod
+    def from_client(cls, client, mirror=None, include_planned=False, page_size=1000):
+        """
+        Builds an index of all bank accounts, with the operations of `mirror`, or of the API
+        (page by page) if no mirror is given.
+
+        Returns:
+            BalanceIndex: The index.
+        """
+        operations = mirror.list_all() if mirror is not None else client.operations.iter_all(page_size=page_size)
+        return cls(client.bank_accounts.list_all(), operations, include_planned=include_planned)
+
+    def set_accounts(self, bank_accounts):
+        """Sets or updates the opening balance and date of accounts."""
+        with self._lock:
+            for bank_account in bank_accounts:
+                account = self._account(bank_account.id)
+                account.initial_amount = _float(bank_account.initial_amount) or 0.0
+                initial_date = bank_account.initial_amount_date
+                account.initial_date = _to_date(initial_date).toordinal() if initial_date else None
+                account.rebuild()
+
+    def add(self, operations):
+        """
+        Adds operations, or replaces the ones already added (by ID).
+
+        Args:
+            operations (iterable[Operation | dict]): Operation models or raw operation data.
+
+        Returns:
+            int: Number of operations that count towards a balance.
+        """
+        counted = 0
+        with self._lock:
+            for operation in operations:
+                data = getattr(operation, "_data", operation)
+                self._discard(data.get("id"))
+                entry = self._entry(data)
+                if entry is None:
+                    continue
+                account_id, day, delta = entry
+                self._account(account_id).move(day, delta)
+                if data.get("id") is not None:
+                    self._operations[data["id"]] = entry
+                counted += 1
+        return counted
+
+    def remove(self, ids):
+        """
+        Removes operations by ID.
+
+        Returns:
+            int: Number of operations removed.
+        """
+        with self._lock:
+            return sum(self._discard(operation_id) for operation_id in ids)
+
+    def balance(self, bank_account_id, on=None):
+        """
+        Returns the balance of an account at the end of a day.
+
+        Args:
+            bank_account_id (int): The account.
+            on (str | date, optional): The day (YYYY-MM-DD or DD.MM.YYYY). Defaults to after
+                                       the last operation.
+
+        Returns:
+            float | None: The balance, or None for days before the account's opening date.
+        """
+        account = self._accounts.get(bank_account_id)
+        if account is None:
+            return None
+        with self._lock:
+            return account.balance(_to_date(on).toordinal() if on is not None else None)
+
+    def balances(self, on=None):
+        """Returns `{bank_account_id: balance}` of all accounts at the end of a day; see `balance`."""
+        return {bank_account_id: self.balance(bank_account_id, on) for bank_account_id in list(self._accounts)}
+
+    def series(self, bank_account_id, range_start, range_end, step="day"):
+        """
+        Returns the balance of an account at the end of each day, week or month of a period.
+
+        Args:
+            bank_account_id (int): The account.
+            range_start (str | date): First day of the period.
+            range_end (str | date): Last day of the period (always the last point).
+            step (str, optional): "day", "week" (ending on Sundays) or "month". Defaults to "day".
+
+        Returns:
+            list[tuple[str, float | None]]: `(YYYY-MM-DD, balance)` pairs.
+        """
+        if step not in ("day", "week", "month"):
+            raise ValueError(f"Unknown step: {step!r}")
+        first, last = _to_date(range_start), _to_date(range_end)
+        points, day = [], first
+        while day <= last:
+            following = day + timedelta(days=1)
+            if (step == "day" or (step == "week" and day.weekday() == 6)
+                    or (step == "month" and following.day == 1) or day == last):
+                points.append((day.isoformat(), self.balance(bank_account_id, day)))
+            day = following
+        return points
+
+    def _account(self, bank_account_id):
+        account = self._accounts.get(bank_account_id)
+        if account is None:
+            account = self._accounts[bank_account_id] = _Account()
+        return account
+
+    def _entry(self, data):
+        if data.get("isPlanned") and not self.include_planned:
+            return None
+        account_id = _ref_id(data.get("bankAccount"))
+        sign = {1: 1.0, 2: -1.0}.get(data.get("type"))
+        amount = _float(data.get("bankAccountAmount"))
+        if amount is None:
+            amount = _float(data.get("amount"))
+        raw_date = data.get("dateIso") or data.get("date")
+        if account_id is None or sign is None or amount is None or not raw_date:
+            return None
+        return account_id, _to_date(raw_date).toordinal(), sign * amount
+
+    def _discard(self, operation_id):
+        entry = self._operations.pop(operation_id, None)
+        if entry is None:
+            return False
+        account_id, day, delta = entry
+        self._accounts[account_id].move(day, -delta)
+        return True
@@ -1,4 +1,5 @@
 from adesk_python_sdk.adesk.models import BankAccount
+from adesk_python_sdk.adesk.batch_get import MissCache, fetch_many
 
 class BankAccounts:
     """
@@ -13,6 +14,7 @@ class BankAccounts:
             client (AdeskClient): The AdeskClient instance to use for API calls.
         """
         self.client = client
+        self._misses = MissCache()
 
     def create(self, name, currency, legal_entity, number=None, bank_name=None, initial_amount=None, 
                initial_amount_date=None, type=None, bank_code=None, correspondent_account=None, 
@@ -166,6 +168,16 @@ class BankAccounts:
         account_data = response.get("bankAccount") if response else None
         return BankAccount(account_data) if account_data else None
 
+    def get_many(self, bank_account_ids, cache=None, concurrency=4):
+        """
+        Retrieves many bank accounts as `{id: BankAccount}`: from `cache` and `client.registry`
+        first, then with concurrent `get` calls. See `batch_get.fetch_many`.
+        """
+        registry = self.client.registry
+        return fetch_many(bank_account_ids, self.get, lookups=[lambda ids: registry.cached("bank_accounts", ids)],
+                          list_all=lambda: registry.all("bank_accounts"), cache=cache,
+                          misses=self._misses, concurrency=concurrency)
+
     def list_all(self, start=None, length=None, reduced=None, with_sum_amount=None, 
                  bank_account_type=None, status=None):
         """
@@ -0,0 +1,116 @@
+# adesk/batch_get.py
+import threading
+import time
+
+from .bulk import run_bulk
+from .exceptions import AdeskBulkError, AdeskNotFoundError
+
+
+class MissCache:
+    """
+    IDs recently found not to exist, so repeated lookups of them do not call
+    the API again. An ID is forgotten `ttl` seconds after it was added.
+    """
+    def __init__(self, ttl=300.0, clock=time.monotonic):
+        """
+        Initializes the MissCache.
+
+        Args:
+            ttl (float, optional): Seconds an ID is remembered as missing. Defaults to 300.
+            clock (callable, optional): Time source. Defaults to `time.monotonic`.
+        """
+        self.ttl = ttl
+        self.clock = clock
+        self._expires = {}
+        self._lock = threading.Lock()
+
+    def add(self, object_id):
+        """Remembers that `object_id` does not exist."""
+        with self._lock:
+            self._expires[object_id] = self.clock() + self.ttl
+
+    def discard(self, object_id):
+        """Forgets `object_id` (e.g., after creating an object with that ID)."""
+        with self._lock:
+            self._expires.pop(object_id, None)
+
+    def clear(self):
+        """Forgets all IDs."""
+        with self._lock:
+            self._expires.clear()
+
+    def __contains__(self, object_id):
+        with self._lock:
+            expires = self._expires.get(object_id)
+            if expires is not None and self.clock() >= expires:
+                del self._expires[object_id]
+                expires = None
+        return expires is not None
+
+    def __len__(self):
+        return len(self._expires)
+
+
+def fetch_many(ids, get_one, lookups=(), list_all=None, cache=None, misses=None, concurrency=4,
+               list_threshold=2):
+    """
+    Resolves many IDs to objects with as few requests as possible.
+
+    The IDs are looked up, in this order, in `cache`, in each of `lookups`
+    (e.g., the reference registry or a `LocalMirror`), in the result of
+    `list_all` (called once, only if at least `list_threshold` IDs are still
+    missing), and finally with concurrent `get_one` calls. IDs in `misses` are
+    skipped; IDs that `get_one` reports as not found are added to it.
+
+    Args:
+        ids (iterable): The IDs; duplicates and None are ignored.
+        get_one (callable): `get_one(id)` returns the object or None (or raises `AdeskNotFoundError`).
+        lookups (iterable[callable], optional): Each called as `lookup(ids)`, returning `{id: object}`
+                                                for the IDs it can answer without a request.
+        list_all (callable, optional): Returns a list of objects that may cover many IDs at once.
+        cache (dict, optional): `{id: object}` read first and updated with the objects found.
+        misses (MissCache, optional): IDs known not to exist.
+        concurrency (int, optional): Number of concurrent `get_one` calls. Defaults to 4.
+        list_threshold (int, optional): Minimum number of missing IDs for `list_all` to be used. Defaults to 2.
+
+    Returns:
+        dict: `{id: object}` for the IDs found; IDs that do not exist are left out.
+
+    Raises:
+        AdeskBulkError: If some `get_one` calls failed (other than with not found); `results`
+                        holds the objects found, `failures` the `(id, exception)` pairs.
+    """
+    wanted = list(dict.fromkeys(object_id for object_id in ids if object_id is not None))
+    found = {}
+    if cache is not None:
+        found.update((object_id, cache[object_id]) for object_id in wanted if object_id in cache)
+    remaining = [object_id for object_id in wanted
+                 if object_id not in found and (misses is None or object_id not in misses)]
+
+    for lookup in lookups:
+        if not remaining:
+            break
+        found.update((object_id, obj) for object_id, obj in lookup(remaining).items() if obj is not None)
+        remaining = [object_id for object_id in remaining if object_id not in found]
+
+    if list_all is not None and len(remaining) >= list_threshold:
+        listed = {obj.id: obj for obj in list_all() or []}
+        found.update((object_id, listed[object_id]) for object_id in remaining if object_id in listed)
+        remaining = [object_id for object_id in remaining if object_id not in found]
+
+    failures = []
+    for outcome in run_bulk(get_one, remaining, concurrency):
+        if outcome.ok and outcome.result is not None:
+            found[outcome.item] = outcome.result
+        elif outcome.ok or isinstance(outcome.error, AdeskNotFoundError):
+            if misses is not None:
+                misses.add(outcome.item)
+        else:
+            failures.append((outcome.item, outcome.error))
+
+    if cache is not None:
+        cache.update(found)
+    if failures:
+        raise AdeskBulkError(f"{len(failures)} of {len(wanted)} objects could not be fetched.",
+                             results=found, failures=failures)
+    return found
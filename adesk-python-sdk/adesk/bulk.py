@@ -0,0 +1,83 @@
+# adesk/bulk.py
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BulkResult:
+    """
+    Outcome of one item of a bulk operation.
+
+    Attributes:
+        index (int): Position of the item in the input.
+        item: The input item (row dict, object, `(id, changes)` pair, ...).
+        result: What the call returned for the item (e.g., the created `Operation`), if it succeeded.
+        error (Exception): The exception raised for the item, if it failed.
+    """
+    def __init__(self, index, item, result=None, error=None):
+        self.index = index
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        """bool: True if the call for this item succeeded."""
+        return self.error is None
+
+    def __repr__(self):
+        outcome = f"result={self.result!r}" if self.ok else f"error={self.error!r}"
+        return f"<BulkResult(index={self.index}, {outcome})>"
+
+
+def run_bulk(func, items, concurrency=4, on_result=None):
+    """
+    Calls `func(item)` for every item over a bounded pool of threads and yields
+    the outcomes in input order.
+
+    Failures do not stop the run: the exception is reported in the item's
+    `BulkResult` and the remaining items are still processed. `items` may be
+    any iterable, including a generator over a large file; it is consumed
+    lazily, with at most `2 * concurrency` items in flight or waiting to be
+    yielded. Requests still go through the client's rate limiter, if any.
+
+    Args:
+        func (callable): Called with each item, from a worker thread.
+        items (iterable): The items to process.
+        concurrency (int, optional): Number of worker threads. Defaults to 4.
+        on_result (callable, optional): Called with each `BulkResult`, in input order,
+                                        before it is yielded (e.g., to report progress).
+
+    Yields:
+        BulkResult: The outcome of each item, in input order.
+
+    Raises:
+        ValueError: If `concurrency` is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    def call(index, item):
+        try:
+            return BulkResult(index, item, result=func(item))
+        except Exception as e:
+            return BulkResult(index, item, error=e)
+
+    def emit(future):
+        bulk_result = future.result()
+        if on_result is not None:
+            on_result(bulk_result)
+        return bulk_result
+
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        try:
+            for index, item in enumerate(items):
+                pending.append(pool.submit(call, index, item))
+                if len(pending) >= 2 * concurrency:
+                    yield emit(pending.popleft())
+            while pending:
+                yield emit(pending.popleft())
+        finally:
+            # The caller stopped iterating early: drop what has not started yet.
+            for future in pending:
+                future.cancel()
@@ -1,22 +1,9 @@
-import requests
-from .transactions import TransactionCategories
-from .projects import Projects
-from .commitments import Commitments
-from .legal_entities import LegalEntities
-from .bank_accounts import BankAccounts
-from .transfers import Transfers
-from .operations import Operations
-from .contractors import Contractors
-from .requisites import Requisites
-from .warehouse import Warehouse
-from .tags import Tags
-from .custom_reports import (
-    CustomReportGroups,
-    CustomReportEntries,
-    CustomReportValues,
-    CustomReportDebtEntries
-)
-from .webhooks import Webhooks
+import importlib
+import threading
+
+from .transports.base import ExecutorAsyncTransport, TransportError
+from .transports.requests_transport import RequestsTransport
+from .rate_limit import RateLimiter
 from .exceptions import (
     AdeskAPIError,
     AdeskAuthError,
@@ -24,15 +11,66 @@ from .exceptions import (
     AdeskPaymentRequiredError,
     AdeskBadRequestError,
     AdeskNotFoundError,
-    AdeskServerError
+    AdeskServerError,
+    error_for_status
 )
 
 
+class _Resource:
+    """
+    Lazily constructed resource attribute (e.g., `client.projects`).
+
+    The resource module is imported and the resource object is built on first
+    access, then stored in the instance `__dict__`, which shadows this (non-data)
+    descriptor: later lookups are plain attribute reads. Creating a client thus
+    costs neither the import of every resource and model module nor the
+    construction of every resource object.
+
+    Safe to use from several threads: once created, a resource is read without
+    any locking; only the first access takes a lock, so that concurrent first
+    accesses share a single resource object.
+    """
+    _lock = threading.Lock()
+
+    def __init__(self, module, class_name):
+        """
+        Initializes the _Resource.
+
+        Args:
+            module (str): The resource module, relative to the `adesk` package (e.g., ".projects").
+            class_name (str): The name of the resource class in that module.
+        """
+        self.module = module
+        self.class_name = class_name
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with self._lock:
+            # Another thread may have created the resource while we were waiting.
+            resource = instance.__dict__.get(self.name)
+            if resource is None:
+                resource_class = getattr(importlib.import_module(self.module, __package__), self.class_name)
+                resource = instance._make_resource(resource_class)
+                instance.__dict__[self.name] = resource
+        return resource
+
+
 class ApiV2Namespace:
     """
     Provides a namespace for accessing Adesk API v2 resources.
     All v2 resources are accessed via an instance of this class, typically `client.v2`.
+    Resources are created on first access.
     """
+    custom_report_groups = _Resource(".custom_reports", "CustomReportGroups")
+    custom_report_entries = _Resource(".custom_reports", "CustomReportEntries")
+    custom_report_values = _Resource(".custom_reports", "CustomReportValues")
+    custom_report_debt_entries = _Resource(".custom_reports", "CustomReportDebtEntries")
+
     def __init__(self, client):
         """
         Initializes the ApiV2Namespace.
@@ -40,10 +78,11 @@ class ApiV2Namespace:
         Args:
             client (AdeskClient): The AdeskClient instance to use for API calls.
         """
-        self.custom_report_groups = CustomReportGroups(client)
-        self.custom_report_entries = CustomReportEntries(client)
-        self.custom_report_values = CustomReportValues(client)
-        self.custom_report_debt_entries = CustomReportDebtEntries(client)
+        self.client = client
+
+    def _make_resource(self, resource_class):
+        return resource_class(self.client)
+
 
 class AdeskClient:
     """
@@ -53,8 +92,34 @@ class AdeskClient:
     commitments, etc. V1 resources are accessed directly as attributes of the client
     instance (e.g., `client.projects`), while V2 resources are accessed via the
     `v2` attribute (e.g., `client.v2.custom_report_groups`).
+    Resources are created (and their modules imported) on first access.
+
+    Thread safety:
+        A single client can be shared by all threads of a process. After
+        construction the client holds no mutable per-request state: requests
+        are built from copies of the caller's parameters, resources are created
+        once (under a lock taken only on first access) and all requests go
+        through `transport`, which must itself be thread-safe. All transports
+        shipped with the SDK are; `RequestsTransport.with_session()` keeps one
+        `requests.Session` per thread over a shared connection pool.
     """
-    def __init__(self, api_token, base_url="https://api.adesk.ru/v1/", base_url_v2="https://api.adesk.ru/v2/"):
+    transaction_categories = _Resource(".transactions", "TransactionCategories")
+    projects = _Resource(".projects", "Projects")
+    commitments = _Resource(".commitments", "Commitments")
+    legal_entities = _Resource(".legal_entities", "LegalEntities")
+    bank_accounts = _Resource(".bank_accounts", "BankAccounts")
+    transfers = _Resource(".transfers", "Transfers")
+    operations = _Resource(".operations", "Operations")
+    contractors = _Resource(".contractors", "Contractors")
+    requisites = _Resource(".requisites", "Requisites")
+    warehouse = _Resource(".warehouse", "Warehouse")
+    tags = _Resource(".tags", "Tags")
+    webhooks = _Resource(".webhooks", "Webhooks")
+    registry = _Resource(".registry", "ReferenceRegistry")
+    v2 = _Resource(".client", "ApiV2Namespace")
+
+    def __init__(self, api_token, base_url="https://api.adesk.ru/v1/", base_url_v2="https://api.adesk.ru/v2/",
+                 transport=None, async_transport=None, rate_limit=None):
         """
         Initializes the AdeskClient.
 
@@ -64,23 +129,142 @@ class AdeskClient:
                                       Defaults to "https://api.adesk.ru/v1/".
             base_url_v2 (str, optional): The base URL for Adesk API v2.
                                          Defaults to "https://api.adesk.ru/v2/".
+            transport (Transport, optional): The HTTP transport used to send requests
+                                             (e.g., `Urllib3Transport`, `HTTPXTransport`,
+                                             `FakeTransport` or `ReplayTransport`).
+                                             Defaults to `RequestsTransport()`.
+            async_transport (AsyncTransport, optional): The transport used by the coroutine
+                                                        methods (`aget`, `apost`, `aget_v2`, ...).
+                                                        Defaults to running `transport` in a
+                                                        thread pool (`ExecutorAsyncTransport`).
+            rate_limit (float | RateLimiter, optional): Maximum requests per second, shared by
+                                                        all threads and coroutines using the client
+                                                        (or a `RateLimiter`, to share a budget between
+                                                        clients). Defaults to no limit.
         """
         self.api_token = api_token
         self.base_url = base_url
         self.base_url_v2 = base_url_v2
-        self.transaction_categories = TransactionCategories(self)
-        self.projects = Projects(self)
-        self.commitments = Commitments(self)
-        self.legal_entities = LegalEntities(self)
-        self.bank_accounts = BankAccounts(self)
-        self.transfers = Transfers(self)
-        self.operations = Operations(self)
-        self.contractors = Contractors(self)
-        self.requisites = Requisites(self)
-        self.warehouse = Warehouse(self)
-        self.tags = Tags(self)
-        self.v2 = ApiV2Namespace(self)
-        self.webhooks = Webhooks(self)
+        self.transport = transport if transport is not None else RequestsTransport()
+        self.async_transport = async_transport if async_transport is not None else ExecutorAsyncTransport(self.transport)
+        if rate_limit is not None and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate_limit)
+        self.rate_limiter = rate_limit
+
+    def _make_resource(self, resource_class):
+        return resource_class(self)
+
+    def _prepare_v1(self, method, endpoint, params=None, data=None):
+        """
+        Builds the URL, parameters and headers of an Adesk API v1 request.
+        V1 uses 'api_token' in query parameters for GET or in form data for POST.
+
+        Returns:
+            tuple: `(url, params, data, headers)` ready to be passed to a transport.
+        """
+        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        
+        headers = {}
+        
+        # Add api_token to params for GET or data for POST (V1 specific).
+        # Copies are made so that dicts shared between calls (and threads) are never mutated.
+        if method.upper() == "GET":
+            params = dict(params or {})
+            params["api_token"] = self.api_token
+        elif method.upper() == "POST": # V1 POST uses x-www-form-urlencoded
+            data = dict(data or {})
+            data["api_token"] = self.api_token
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        return url, params, data, headers
+
+    def _prepare_v2(self, endpoint):
+        """
+        Builds the URL and headers of an Adesk API v2 request (token in the X-API-Token header).
+
+        Returns:
+            tuple: `(url, headers)` ready to be passed to a transport.
+        """
+        url = f"{self.base_url_v2.rstrip('/')}/{endpoint.lstrip('/')}"
+        
+        headers = {
+            "X-API-Token": self.api_token,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        return url, headers
+
+    @staticmethod
+    def _error_details(response):
+        """
+        Extracts the error message and payload from an error response.
+
+        Returns:
+            tuple[str, dict | str]: The message and the parsed JSON body (or raw text).
+        """
+        default_message = f"{response.status_code} Error: {getattr(response, 'reason', None) or 'HTTP error'}"
+        try:
+            response_data = response.json()
+        except ValueError: # Covers json.JSONDecodeError and requests' JSONDecodeError
+            return default_message, response.text
+        if not isinstance(response_data, dict):
+            return default_message, response_data
+        message = response_data.get("message", default_message)
+        if "errors" in response_data: # Often validation errors are in 'errors'
+            message += f" Details: {response_data['errors']}"
+        return message, response_data
+
+    def _handle_v1_response(self, method, response):
+        """
+        Converts a v1 transport response into the API result, raising the
+        matching `AdeskAPIError` subclass for error statuses.
+
+        Returns:
+            dict or None: The JSON response from the API, or None for empty responses.
+        """
+        status_code = response.status_code
+        # Check for Adesk specific error code 21 even on HTTP 200
+        if status_code == 200:
+            try:
+                response_json = response.json()
+            except ValueError:
+                # If response is not JSON, but status is 200, return text (or None if empty, like a 204).
+                return response.text if response.text else None
+            if isinstance(response_json, dict) and response_json.get('code') == 21:
+                msg = response_json.get('message', "Payment required for API access.")
+                raise AdeskPaymentRequiredError(msg, status_code=200, response_data=response_json)
+            if response.text == "" and method.upper() != 'HEAD': # No content but not HEAD
+                return None
+            return response_json # Return parsed JSON if no error code 21
+
+        if status_code >= 400:
+            message, response_data = self._error_details(response)
+            raise error_for_status(status_code, message, response_data, api_version=1)
+
+        if status_code == 204:
+            return None
+        try:
+            return response.json()
+        except ValueError as e:
+            raise AdeskAPIError(f"Request failed: invalid JSON in response: {e}") from e
+
+    def _handle_v2_response(self, response):
+        """
+        Converts a v2 transport response into the API result, raising the
+        matching `AdeskAPIError` subclass for error statuses.
+
+        Returns:
+            dict or None: The JSON response from the API, or None for 204 No Content.
+        """
+        status_code = response.status_code
+        if status_code >= 400:
+            message, response_data = self._error_details(response)
+            raise error_for_status(status_code, message, response_data, api_version=2)
+        if status_code == 204: # No Content
+            return None
+        try:
+            return response.json()
+        except ValueError as e:
+            raise AdeskAPIError(f"V2 Request failed: invalid JSON in response: {e}") from e
 
     def _request(self, method, endpoint, params=None, data=None):
         """
@@ -104,79 +288,16 @@ class AdeskClient:
             AdeskBadRequestError: For client-side errors like missing parameters (400).
             AdeskNotFoundError: If the resource is not found (404).
             AdeskServerError: For server-side errors (5xx).
-            AdeskAPIError: For other API-related errors.
-            requests.exceptions.RequestException: For network or request-related issues.
+            AdeskAPIError: For other API-related errors, including network failures.
         """
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        
-        headers = {}
-        
-        # Add api_token to params for GET or data for POST (V1 specific)
-        if method.upper() == "GET":
-            if params is None:
-                params = {}
-            params["api_token"] = self.api_token
-        elif method.upper() == "POST": # V1 POST uses x-www-form-urlencoded
-            if data is None:
-                data = {}
-            data["api_token"] = self.api_token
-            headers["Content-Type"] = "application/x-www-form-urlencoded"
-
+        url, params, data, headers = self._prepare_v1(method, endpoint, params, data)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
         try:
-            response = requests.request(method, url, params=params, data=data, headers=headers)
-            
-            # Check for Adesk specific error code 21 even on HTTP 200
-            if response.status_code == 200:
-                try:
-                    response_json = response.json()
-                    if isinstance(response_json, dict) and response_json.get('code') == 21:
-                        msg = response_json.get('message', "Payment required for API access.")
-                        raise AdeskPaymentRequiredError(msg, status_code=200, response_data=response_json)
-                    if response.text == "" and response.request.method != 'HEAD': # No content but not HEAD
-                        return None # Or True, depending on desired behavior for empty success
-                    return response_json # Return parsed JSON if no error code 21
-                except requests.exceptions.JSONDecodeError:
-                    # If response is not JSON, but status is 200 and not code 21, return text or handle as error
-                    # For now, let's assume successful non-JSON 200 is rare for V1 and could be an issue.
-                    # If response.text is empty, it's like a 204.
-                    return response.text if response.text else None
-
-            response.raise_for_status()  # Raises an HTTPError for bad responses (4xx or 5xx) if not 200
-            
-            if response.status_code == 204: # Should be caught by raise_for_status for non-2xx, but good to be explicit
-                return None
-            return response.json() # Should not be reached if raise_for_status() is effective for all non-200s
-
-        except requests.exceptions.HTTPError as err:
-            status_code = err.response.status_code
-            try:
-                response_data = err.response.json()
-                message = response_data.get("message", str(err))
-                if "errors" in response_data: # Often validation errors are in 'errors'
-                    message += f" Details: {response_data['errors']}"
-            except requests.exceptions.JSONDecodeError:
-                response_data = err.response.text
-                message = str(err)
-
-            if status_code == 401:
-                raise AdeskAuthError(message, status_code, response_data) from err
-            elif status_code == 402 or status_code == 403: # Often used for payment/permission issues
-                 # Check for Adesk's specific code 21 structure again, just in case
-                if isinstance(response_data, dict) and response_data.get('code') == 21:
-                    message = response_data.get('message', "Payment required for API access.")
-                raise AdeskPaymentRequiredError(message, status_code, response_data) from err
-            elif status_code == 429:
-                raise AdeskRateLimitError(message, status_code, response_data) from err
-            elif status_code == 400:
-                raise AdeskBadRequestError(message, status_code, response_data) from err
-            elif status_code == 404:
-                raise AdeskNotFoundError(message, status_code, response_data) from err
-            elif 500 <= status_code < 600:
-                raise AdeskServerError(message, status_code, response_data) from err
-            else:
-                raise AdeskAPIError(message, status_code, response_data) from err
-        except requests.exceptions.RequestException as e: # Catches network errors, etc.
+            response = self.transport.request(method, url, params=params, data=data, headers=headers)
+        except TransportError as e: # Catches network errors, etc.
             raise AdeskAPIError(f"Request failed: {e}") from e # Wrap in AdeskAPIError for consistency
+        return self._handle_v1_response(method, response)
 
     def _request_v2(self, method, endpoint, params=None, json_data=None):
         """
@@ -200,52 +321,44 @@ class AdeskClient:
             AdeskBadRequestError: For client-side errors like missing parameters (400).
             AdeskNotFoundError: If the resource is not found (404).
             AdeskServerError: For server-side errors (5xx).
-            AdeskAPIError: For other API-related errors.
-            requests.exceptions.RequestException: For network or request-related issues.
+            AdeskAPIError: For other API-related errors, including network failures.
         """
-        url = f"{self.base_url_v2.rstrip('/')}/{endpoint.lstrip('/')}"
-        
-        headers = {
-            "X-API-Token": self.api_token,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        url, headers = self._prepare_v2(endpoint)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        try:
+            response = self.transport.request(method, url, params=params, json=json_data, headers=headers)
+        except TransportError as e: # Catches network errors
+            raise AdeskAPIError(f"V2 Request failed: {e}") from e
+        return self._handle_v2_response(response)
 
+    async def _arequest(self, method, endpoint, params=None, data=None):
+        """
+        Coroutine counterpart of `_request`, sent through `async_transport`.
+        Responses and errors are handled exactly as in `_request`.
+        """
+        url, params, data, headers = self._prepare_v1(method, endpoint, params, data)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
         try:
-            response = requests.request(method, url, params=params, json=json_data, headers=headers)
-            response.raise_for_status() # Raises HTTPError for 4xx/5xx
-            
-            if response.status_code == 204: # No Content
-                return None 
-            return response.json()
-            
-        except requests.exceptions.HTTPError as err:
-            status_code = err.response.status_code
-            try:
-                response_data = err.response.json()
-                message = response_data.get("message", str(err))
-                if "errors" in response_data: # V2 often uses 'errors' field
-                    message += f" Details: {response_data['errors']}"
-            except requests.exceptions.JSONDecodeError:
-                response_data = err.response.text
-                message = str(err)
-
-            if status_code == 401:
-                raise AdeskAuthError(message, status_code, response_data) from err
-            elif status_code == 429:
-                raise AdeskRateLimitError(message, status_code, response_data) from err
-            elif status_code == 400:
-                raise AdeskBadRequestError(message, status_code, response_data) from err
-            elif status_code == 404:
-                raise AdeskNotFoundError(message, status_code, response_data) from err
-            elif status_code == 403: # V2 might use 403 for payment/permission
-                raise AdeskPaymentRequiredError(message, status_code, response_data) from err
-            elif 500 <= status_code < 600:
-                raise AdeskServerError(message, status_code, response_data) from err
-            else:
-                raise AdeskAPIError(message, status_code, response_data) from err
-        except requests.exceptions.RequestException as e: # Catches network errors
+            response = await self.async_transport.request(method, url, params=params, data=data, headers=headers)
+        except TransportError as e:
+            raise AdeskAPIError(f"Request failed: {e}") from e
+        return self._handle_v1_response(method, response)
+
+    async def _arequest_v2(self, method, endpoint, params=None, json_data=None):
+        """
+        Coroutine counterpart of `_request_v2`, sent through `async_transport`.
+        Responses and errors are handled exactly as in `_request_v2`.
+        """
+        url, headers = self._prepare_v2(endpoint)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+        try:
+            response = await self.async_transport.request(method, url, params=params, json=json_data, headers=headers)
+        except TransportError as e:
             raise AdeskAPIError(f"V2 Request failed: {e}") from e
+        return self._handle_v2_response(response)
 
 
     def get(self, endpoint, params=None):
@@ -329,3 +442,42 @@ class AdeskClient:
             dict or None: The JSON response, or None for 204 No Content.
         """
         return self._request_v2("DELETE", endpoint, params=params)
+
+    # Async public methods
+    async def aget(self, endpoint, params=None):
+        """Coroutine version of `get`."""
+        return await self._arequest("GET", endpoint, params=params)
+
+    async def apost(self, endpoint, data=None, params=None):
+        """Coroutine version of `post`."""
+        return await self._arequest("POST", endpoint, params=params, data=data)
+
+    async def aget_v2(self, endpoint, params=None):
+        """Coroutine version of `get_v2`."""
+        return await self._arequest_v2("GET", endpoint, params=params)
+
+    async def apost_v2(self, endpoint, json_data=None, params=None):
+        """Coroutine version of `post_v2`."""
+        return await self._arequest_v2("POST", endpoint, params=params, json_data=json_data)
+
+    async def aput_v2(self, endpoint, json_data=None, params=None):
+        """Coroutine version of `put_v2`."""
+        return await self._arequest_v2("PUT", endpoint, params=params, json_data=json_data)
+
+    async def adelete_v2(self, endpoint, params=None):
+        """Coroutine version of `delete_v2`."""
+        return await self._arequest_v2("DELETE", endpoint, params=params)
+
+    def close(self):
+        """Closes the client's transport and releases its connections."""
+        self.transport.close()
+
+    async def aclose(self):
+        """Closes the client's async transport and releases its connections."""
+        await self.async_transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,4 +1,12 @@
 from adesk_python_sdk.adesk.models import Contractor, Commitment, Requisite
+from adesk_python_sdk.adesk.bulk import run_bulk
+from adesk_python_sdk.adesk.exceptions import AdeskAPIError, AdeskBulkError
+from adesk_python_sdk.adesk.registry import normalize_name, normalize_number
+from adesk_python_sdk.adesk.batch_get import MissCache, fetch_many
+
+_ENSURE_KEYS = {"inn": normalize_number, "name": normalize_name}
+# Related data `prefetch` can attach to contractors -> method fetching it for one contractor.
+_PREFETCH = {"commitments": "get_commitments", "requisites": "get_requisites"}
 
 class Contractors:
     """
@@ -13,9 +21,11 @@ class Contractors:
             client (AdeskClient): The AdeskClient instance to use for API calls.
         """
         self.client = client
+        self._misses = MissCache()
 
     def list_all(self, range_str=None, range_start=None, range_end=None, reduced=None, 
-                 q=None, inn=None, checking_bank_account=None, with_balance=None):
+                 q=None, inn=None, checking_bank_account=None, with_balance=None,
+                 prefetch=None, concurrency=4):
         """
         Retrieves a list of contractors based on specified filters.
         Corresponds to Adesk API v1 endpoint: `GET contractors`.
@@ -29,6 +39,9 @@ class Contractors:
             inn (str, optional): Filter by Taxpayer Identification Number (INN).
             checking_bank_account (str, optional): Filter by checking bank account number.
             with_balance (bool, optional): If True, includes balance information for contractors.
+            prefetch (list[str], optional): Related data to attach to each contractor
+                                            ("commitments", "requisites"); see `prefetch`.
+            concurrency (int, optional): Number of concurrent requests for `prefetch`. Defaults to 4.
 
         Returns:
             list[Contractor]: A list of Contractor model instances.
@@ -54,7 +67,10 @@ class Contractors:
             
         response_data = self.client.get("contractors", params=params)
         contractors_list_data = response_data.get("contractors", []) if response_data else []
-        return Contractor.from_list(contractors_list_data)
+        contractors = Contractor.from_list(contractors_list_data)
+        if prefetch:
+            self.prefetch(contractors, prefetch, concurrency=concurrency)
+        return contractors
 
     def get(self, contractor_id):
         """
@@ -73,6 +89,59 @@ class Contractors:
         contractor_data = response_data.get("contractor") if response_data else None
         return Contractor(contractor_data) if contractor_data else None
 
+    def get_many(self, contractor_ids, cache=None, prefetch=None, concurrency=4):
+        """
+        Retrieves many contractors as `{id: Contractor}`: from `cache` and `client.registry` first,
+        then with concurrent `get` calls; `prefetch` attaches related data (see `prefetch`).
+        """
+        registry = self.client.registry
+        contractors = fetch_many(contractor_ids, self.get,
+                                 lookups=[lambda ids: registry.cached("contractors", ids)],
+                                 list_all=lambda: registry.all("contractors"), cache=cache,
+                                 misses=self._misses, concurrency=concurrency)
+        if prefetch:
+            self.prefetch(list(contractors.values()), prefetch, concurrency=concurrency)
+        return contractors
+
+    def prefetch(self, contractors, related=tuple(_PREFETCH), concurrency=4):
+        """
+        Fetches related data of many contractors concurrently and attaches it to them, as
+        the `commitments` and `requisites` attributes.
+
+        All requests (one per contractor and kind of related data) share one pool of
+        `concurrency` threads, instead of two serial round-trips per contractor.
+
+        Args:
+            contractors (list[Contractor]): The contractors; they are modified in place.
+            related (iterable[str], optional): "commitments" and/or "requisites". Defaults to both.
+            concurrency (int, optional): Number of concurrent requests. Defaults to 4.
+
+        Returns:
+            list[Contractor]: The same contractors.
+
+        Raises:
+            ValueError: If `related` names unknown data.
+            AdeskBulkError: If some requests failed; the data fetched is attached anyway, and
+                            `failures` holds `((contractor_id, name), exception)` pairs.
+        """
+        related = list(dict.fromkeys(related))
+        unknown = [name for name in related if name not in _PREFETCH]
+        if unknown:
+            raise ValueError(f"Unknown related data: {', '.join(unknown)}. Known: {', '.join(_PREFETCH)}.")
+        tasks = [(contractor, name) for contractor in contractors for name in related]
+        failures = []
+        for outcome in run_bulk(lambda task: getattr(self, _PREFETCH[task[1]])(task[0].id), tasks,
+                                concurrency=concurrency):
+            contractor, name = outcome.item
+            if outcome.ok:
+                setattr(contractor, name, outcome.result)
+            else:
+                failures.append(((contractor.id, name), outcome.error))
+        if failures:
+            raise AdeskBulkError(f"{len(failures)} of {len(tasks)} related lists could not be fetched.",
+                                 results=contractors, failures=failures)
+        return contractors
+
     def get_commitments(self, contractor_id):
         """
         Retrieves a list of commitments associated with a specific contractor.
@@ -141,6 +210,87 @@ class Contractors:
         contractor_data = response_data.get("contractor") if response_data else None
         return Contractor(contractor_data) if contractor_data else None
 
+    def ensure(self, records, key="inn", concurrency=4):
+        """
+        Get-or-create for contractors: resolves records against the client's indexed
+        contractor list (`client.registry`) and creates only the missing contractors,
+        concurrently and once per distinct key. Contractors are created with `create`;
+        when a record has an INN, requisites carrying it are added with `requisites.create`
+        so the contractor is found by INN afterwards. If the requisites cannot be added,
+        the new contractor is removed again, so retrying does not duplicate it.
+
+        Args:
+            records (iterable[dict]): Contractors as `create` arguments plus `inn` (and
+                                      optionally `kpp`), e.g. `{"name": "ACME", "inn": "7701234567"}`.
+            key (str, optional): Field identifying a contractor: "inn" (digits compared) or
+                                 "name" (compared ignoring case and extra whitespace).
+                                 Defaults to "inn".
+            concurrency (int, optional): Creates in flight at the same time. Defaults to 4.
+
+        Returns:
+            dict: The contractor ID of every given key value, by key value.
+
+        Raises:
+            ValueError: If `key` is not supported, or a record misses its key or name.
+            AdeskBulkError: If some contractors could not be created; `results` holds the ID map
+                            of the keys that were resolved, `failures` the `(record, exception)` pairs.
+        """
+        if key not in _ENSURE_KEYS:
+            raise ValueError(f"Unsupported key: {key!r}")
+        normalize = _ENSURE_KEYS[key]
+        records = list(records)
+        distinct = {}
+        for record in records:
+            if not record.get(key) or not record.get("name"):
+                raise ValueError(f"Required parameter missing: {key if not record.get(key) else 'name'}.")
+            distinct.setdefault(normalize(record[key]), record)
+
+        registry = self.client.registry
+        if key == "inn":
+            ids = dict(zip(distinct, registry.contractor_ids([record["inn"] for record in distinct.values()])))
+        else:
+            by_name = {}
+            for contractor in registry.all("contractors"):
+                by_name.setdefault(normalize_name(contractor.name), contractor.id)
+            ids = {name: by_name.get(name) for name in distinct}
+
+        missing = [record for normalized, record in distinct.items() if ids[normalized] is None]
+        created, failures = [], []
+        for outcome in run_bulk(self._create_with_requisites, missing, concurrency=concurrency):
+            if outcome.ok:
+                created.append(outcome.result)
+                ids[normalize(outcome.item[key])] = outcome.result.id
+            else:
+                failures.append((outcome.item, outcome.error))
+        registry.remember("contractors", created)
+
+        result = {record[key]: ids[normalize(record[key])] for record in records}
+        if failures:
+            raise AdeskBulkError(f"{len(failures)} of {len(missing)} contractors could not be created.",
+                                 results={k: v for k, v in result.items() if v is not None}, failures=failures)
+        return result
+
+    def _create_with_requisites(self, record):
+        contractor = self.create(record["name"], contact_person=record.get("contact_person"),
+                                 phone_number=record.get("phone_number"), email=record.get("email"),
+                                 description=record.get("description"))
+        if contractor is None:
+            raise AdeskAPIError(f"The API did not return the created contractor {record['name']!r}.")
+        if record.get("inn"):
+            try:
+                self.client.requisites.create(contractor.id, name=record["name"], inn=record["inn"],
+                                              kpp=record.get("kpp"))
+            except AdeskAPIError as e:
+                # Without requisites it would never be found by INN, and a retry would duplicate it.
+                try:
+                    self.delete(contractor.id)
+                except AdeskAPIError:
+                    raise AdeskAPIError(f"Requisites of the created contractor {contractor.id} could not be added "
+                                        f"and it could not be removed: {e}", e.status_code, e.response_data) from e
+                raise
+            contractor = Contractor(dict(contractor._data, inn=record["inn"]))
+        return contractor
+
     def update(self, contractor_id, name=None, contact_person=None, phone_number=None, email=None, description=None):
         """
         Updates an existing contractor.
@@ -1,10 +1,89 @@
 # adesk/models/custom_reports.py
-from .base_model import BaseModel
 # from .projects import Project # Import if/when projects_data is fully modeled
 from adesk_python_sdk.adesk.models import (
     CustomReportGroup, CustomReportEntry, CustomReportValue, 
     CustomReportValueList, CustomReportDebtEntry
 )
+from adesk_python_sdk.adesk.bulk import run_bulk
+from adesk_python_sdk.adesk.exceptions import AdeskAPIError, AdeskBadRequestError, AdeskBulkError
+
+
+def value_key(value):
+    """
+    Natural key of a custom report value: the cell it fills in a report.
+
+    Args:
+        value (dict | CustomReportValue): A value in API format (e.g., `{"entryId": 1,
+                                          "date": "2024-01-01", ...}`; `projectId` and
+                                          `businessUnitId` are accepted for `project` and
+                                          `businessUnit`), or a value returned by the API.
+
+    Returns:
+        tuple: `(entryId, date, project, businessUnit)`, with the date as YYYY-MM-DD.
+    """
+    if isinstance(value, CustomReportValue):
+        key = (value.entry_id, value.date, value.project_id, value.business_unit_id)
+    else:
+        key = (value.get("entryId"), value.get("date"), value.get("project", value.get("projectId")),
+               value.get("businessUnit", value.get("businessUnitId")))
+    date = key[1][:10] if isinstance(key[1], str) else key[1]
+    return (key[0], date, key[2], key[3])
+
+
+# Fields compared by `sync_values`, mapped to `CustomReportValue` attributes.
+_COMPARED_FIELDS = {
+    "amount": "amount", "value": "amount", "vat": "vat", "vatPercent": "vat_percent",
+    "currency": "currency", "exchangeRate": "exchange_rate", "description": "description",
+}
+
+
+def _differs(desired, current):
+    """Whether any field set in the desired value differs from the current `CustomReportValue`."""
+    for field, attribute in _COMPARED_FIELDS.items():
+        if field not in desired:
+            continue
+        wanted, actual = desired[field], getattr(current, attribute)
+        try:
+            if abs(float(wanted) - float(actual)) > 1e-9:
+                return True
+        except (TypeError, ValueError):
+            if wanted != actual:
+                return True
+    return False
+
+
+class ValueSyncResult:
+    """
+    Changes computed (and, unless it was a dry run, sent) by `CustomReportValues.sync_values`.
+
+    Attributes:
+        creates (list[dict]): Desired values that did not exist.
+        updates (list[dict]): Desired values that differ from the existing ones (with their `id`).
+        removes (list[int]): IDs of existing values that are not in the desired set.
+        unchanged (int): Number of desired values already up to date.
+        saved (list[CustomReportValue]): Values returned by the API for creates and updates.
+    """
+    def __init__(self, creates, updates, removes, unchanged):
+        self.creates = creates
+        self.updates = updates
+        self.removes = removes
+        self.unchanged = unchanged
+        self.saved = []
+
+    @property
+    def writes(self):
+        """int: Number of values created, updated or removed."""
+        return len(self.creates) + len(self.updates) + len(self.removes)
+
+    def __repr__(self):
+        return (f"<ValueSyncResult(creates={len(self.creates)}, updates={len(self.updates)}, "
+                f"removes={len(self.removes)}, unchanged={self.unchanged})>")
+
+
+def _can_split(error):
+    """Whether a failed batch may succeed in smaller pieces (payload too large or rejected as a whole)."""
+    return isinstance(error, AdeskBadRequestError) or error.status_code == 413
+
 
 class CustomReportGroups:
     """
@@ -297,6 +376,175 @@ class CustomReportValues:
         data = response.get("data", []) if response else []
         return CustomReportValue.from_list(data)
 
+    def upsert_values(self, values, chunk_size=500, concurrency=4, index=None, key=value_key):
+        """
+        Creates or updates many custom report values in chunked, concurrent requests.
+
+        A value with an `id` is updated. A value without one is updated too when
+        `index` maps its key to an existing ID (e.g., an index built from `list`),
+        and created otherwise. Creates and updates are sent in chunks of
+        `chunk_size` values through `create` and `update`, several chunks at a
+        time. A chunk rejected with 413 (payload too large) or 400 is halved and
+        retried, down to single values, so one bad value only fails itself.
+
+        Args:
+            values (iterable[dict]): Values in API format (e.g.,
+                                     `{"entryId": 1, "date": "2024-01-01", "value": 100.5}`).
+            chunk_size (int, optional): Maximum values per request. Defaults to 500.
+            concurrency (int, optional): Number of requests in flight. Defaults to 4.
+            index (dict, optional): Maps `key(value)` to the ID of the existing value.
+            key (callable, optional): Computes the key looked up in `index`. Defaults to
+                                      `value_key`, i.e. `(entryId, date, project, businessUnit)`.
+
+        Returns:
+            list[CustomReportValue]: The created and updated values, merged in chunk order.
+
+        Raises:
+            ValueError: If `chunk_size` is less than 1.
+            AdeskBulkError: If some values could not be sent; `results` holds the values
+                            that were, `failures` the `(value, exception)` pairs that were not.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        creates, updates = [], []
+        for value in values:
+            if value.get("id") is None and index:
+                existing_id = index.get(key(value))
+                if existing_id is not None:
+                    value = dict(value, id=existing_id)
+            (creates if value.get("id") is None else updates).append(value)
+
+        chunks = [(self.create, creates[i:i + chunk_size]) for i in range(0, len(creates), chunk_size)]
+        chunks += [(self.update, updates[i:i + chunk_size]) for i in range(0, len(updates), chunk_size)]
+
+        results, failures = [], []
+        for outcome in run_bulk(lambda chunk: self._send_chunk(*chunk), chunks, concurrency=concurrency):
+            sent, failed = outcome.result
+            results.extend(sent)
+            failures.extend(failed)
+        if failures:
+            raise AdeskBulkError(f"{len(failures)} of {len(creates) + len(updates)} custom report values "
+                                 f"could not be sent.", results=results, failures=failures)
+        return results
+
+    def iter_values(self, page_size=1000, **filters):
+        """
+        Iterates over all custom report values matching the filters, fetching
+        them page by page (see `list`).
+
+        Args:
+            page_size (int, optional): Values requested per page. Defaults to 1000.
+            **filters: Filters accepted by `list` (e.g., `entry_id`, `date_from`, `date_to`).
+
+        Yields:
+            CustomReportValue: The matching values.
+        """
+        page, seen = 1, 0
+        while True:
+            result = self.list(page=page, page_size=page_size, **filters)
+            if result is None or not result.values:
+                return
+            for value in result.values:
+                yield value
+            seen += len(result.values)
+            if result.total_items_count is not None and seen >= result.total_items_count:
+                return
+            page += 1
+
+    def sync_values(self, desired, entry_ids=None, date_from=None, date_to=None, remove_missing=True,
+                    dry_run=False, chunk_size=500, concurrency=4):
+        """
+        Makes the stored values of some entries and dates match a desired set,
+        sending only what changed.
+
+        The current values of the affected entries (those of the desired values,
+        or `entry_ids`) between the earliest and latest desired dates (or
+        `date_from`/`date_to`) are fetched and diffed against the desired set by
+        `value_key`, i.e. `(entryId, date, project, businessUnit)`. New keys are
+        created, values whose fields differ are updated (only fields present in
+        the desired value are compared), and, with `remove_missing`, values in
+        the fetched scope that are not desired are removed. Up-to-date values
+        cost no writes.
+
+        Args:
+            desired (iterable[dict]): The full desired set of values in API format.
+            entry_ids (iterable[int], optional): Entries to sync. Defaults to the entries of
+                                                 the desired values.
+            date_from (str, optional): Start of the synced period (YYYY-MM-DD). Defaults to the
+                                       earliest desired date.
+            date_to (str, optional): End of the synced period (YYYY-MM-DD). Defaults to the
+                                     latest desired date.
+            remove_missing (bool, optional): Remove values in scope that are not desired.
+                                             Defaults to True.
+            dry_run (bool, optional): Only compute the changes, without sending them.
+            chunk_size (int, optional): Maximum values per write request. Defaults to 500.
+            concurrency (int, optional): Number of requests in flight. Defaults to 4.
+
+        Returns:
+            ValueSyncResult: The changes, and the values saved by the API.
+
+        Raises:
+            AdeskBulkError: If some creates or updates could not be sent (see `upsert_values`).
+        """
+        desired_by_key = {value_key(value): value for value in desired}
+        entry_ids = sorted(set(entry_ids or (key[0] for key in desired_by_key)))
+        dates = [key[1] for key in desired_by_key if key[1]]
+        date_from = date_from or (min(dates) if dates else None)
+        date_to = date_to or (max(dates) if dates else None)
+
+        current_by_key, duplicates = {}, []
+        fetch = lambda entry_id: list(self.iter_values(entry_id=entry_id, date_from=date_from, date_to=date_to))
+        for outcome in run_bulk(fetch, entry_ids, concurrency=concurrency):
+            if not outcome.ok:
+                raise outcome.error
+            for value in outcome.result:
+                key = value_key(value)
+                if key in current_by_key:
+                    duplicates.append(value.id)
+                else:
+                    current_by_key[key] = value
+
+        creates, updates, unchanged = [], [], 0
+        for key, value in desired_by_key.items():
+            current = current_by_key.get(key)
+            if current is None:
+                creates.append(value)
+            elif _differs(value, current):
+                updates.append(dict(value, id=current.id))
+            else:
+                unchanged += 1
+        removes = []
+        if remove_missing:
+            removes = [value.id for key, value in current_by_key.items() if key not in desired_by_key] + duplicates
+
+        result = ValueSyncResult(creates, updates, removes, unchanged)
+        if dry_run:
+            return result
+        if creates or updates:
+            result.saved = self.upsert_values(creates + updates, chunk_size=chunk_size, concurrency=concurrency)
+        chunks = [removes[i:i + chunk_size] for i in range(0, len(removes), chunk_size)]
+        for outcome in run_bulk(self.remove, chunks, concurrency=concurrency):
+            if not outcome.ok:
+                raise outcome.error
+        return result
+
+    def _send_chunk(self, send, chunk):
+        """
+        Sends one chunk, halving it on errors that smaller requests may avoid.
+
+        Returns:
+            tuple[list, list]: The values returned by the API and `(value, exception)` failures.
+        """
+        try:
+            return send(chunk), []
+        except AdeskAPIError as e:
+            if len(chunk) == 1 or not _can_split(e):
+                return [], [(value, e) for value in chunk]
+        middle = len(chunk) // 2
+        left_sent, left_failed = self._send_chunk(send, chunk[:middle])
+        right_sent, right_failed = self._send_chunk(send, chunk[middle:])
+        return left_sent + right_sent, left_failed + right_failed
+
     def remove(self, value_ids):
         """
         Removes custom report values by their IDs.
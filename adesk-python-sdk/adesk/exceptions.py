@@ -33,3 +33,58 @@ class AdeskNotFoundError(AdeskAPIError):
 class AdeskServerError(AdeskAPIError):
     """Adesk server-side error. Status codes 5xx."""
     pass
+
+class AdeskOutcomeUnknownError(AdeskAPIError):
+    """
+    A create may or may not have been applied and there is no way to check it;
+    it must not be sent again until it is reconciled by hand.
+    """
+    pass
+
+class AdeskBulkError(AdeskAPIError):
+    """
+    Some items of a bulk call could not be sent.
+
+    Attributes:
+        results (list): What was sent successfully (e.g., `CustomReportValue` instances).
+        failures (list[tuple]): `(item, exception)` pairs for the items that failed.
+    """
+    def __init__(self, message, results=None, failures=None):
+        super().__init__(message)
+        self.results = results or []
+        self.failures = failures or []
+
+
+def error_for_status(status_code, message, response_data=None, api_version=1):
+    """
+    Builds the exception matching an HTTP error status returned by the Adesk API.
+
+    Shared by every transport so that the same response always maps to the same
+    exception type, whichever HTTP library produced it.
+
+    Args:
+        status_code (int): The HTTP status code of the response.
+        message (str): The error message to use.
+        response_data (dict | str, optional): The parsed JSON body, or the raw text.
+        api_version (int, optional): API version of the request (1 or 2). V1 reports
+                                     payment problems with 402/403 (and custom code 21),
+                                     V2 with 403 only. Defaults to 1.
+
+    Returns:
+        AdeskAPIError: An instance of the most specific exception class.
+    """
+    if status_code == 401:
+        return AdeskAuthError(message, status_code, response_data)
+    if status_code == 403 or (status_code == 402 and api_version == 1):
+        if isinstance(response_data, dict) and response_data.get('code') == 21:
+            message = response_data.get('message', "Payment required for API access.")
+        return AdeskPaymentRequiredError(message, status_code, response_data)
+    if status_code == 429:
+        return AdeskRateLimitError(message, status_code, response_data)
+    if status_code == 400:
+        return AdeskBadRequestError(message, status_code, response_data)
+    if status_code == 404:
+        return AdeskNotFoundError(message, status_code, response_data)
+    if 500 <= status_code < 600:
+        return AdeskServerError(message, status_code, response_data)
+    return AdeskAPIError(message, status_code, response_data)
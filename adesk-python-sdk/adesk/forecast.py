@@ -0,0 +1,296 @@
+# adesk/forecast.py
+import heapq
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+from .aggregate import PERIODS
+from .mirror import _to_date
+from .models import Operation
+
+# Repetition period of a chain (as returned by the API, or as passed to `Operations.create`)
+# -> (days, months) between two occurrences.
+_REPETITIONS = {
+    "day": (1, 0), "daily": (1, 0),
+    "week": (7, 0), "weekly": (7, 0),
+    "month": (0, 1), "monthly": (0, 1),
+    "quarter": (0, 3), "quarterly": (0, 3),
+    "year": (0, 12), "yearly": (0, 12), "annually": (0, 12),
+}
+
+_OPEN_END = date.max.toordinal()
+
+
+def _add_months(day, months):
+    month = day.month - 1 + months
+    year, month = day.year + month // 12, month % 12 + 1
+    following = date(year + month // 12, month % 12 + 1, 1)
+    return date(year, month, min(day.day, (following - timedelta(days=1)).day))
+
+
+def _operation_date(data):
+    raw = data.get("dateIso") or data.get("date")
+    return _to_date(raw) if raw else None
+
+
+class RecurringChain:
+    """
+    A chain of periodic operations, projected forward from its latest known operation.
+
+    Attributes:
+        chain_id: The `periodic_chain` of its operations.
+        template (dict): Data of the latest known operation, copied into each occurrence.
+        step (tuple[int, int] | None): `(days, months)` between occurrences; None if the
+                                       period is not recognized (nothing is projected).
+        last (date): Date of the latest known operation.
+        end (date | None): Last day of repetition, if any.
+        amount (float): Amount of each occurrence.
+    """
+    def __init__(self, chain_id, template, end=None):
+        self.chain_id = chain_id
+        self.template = template
+        self.step = _REPETITIONS.get(str(template.get("period") or "").strip().lower())
+        self.last = _operation_date(template)
+        self.end = end
+        self.amount = float(template.get("amount") or 0.0)
+
+    @property
+    def next_date(self):
+        """date | None: The first projected date, or None if nothing is projected."""
+        first = self._nth(1) if self.step else None
+        return first if first is not None and (self.end is None or first <= self.end) else None
+
+    def dates(self, range_start, range_end):
+        """
+        Yields the projected dates within a period, computing the first one directly rather
+        than stepping from the chain's start.
+        """
+        if self.next_date is None:
+            return
+        last = min(range_end, self.end) if self.end is not None else range_end
+        days, months = self.step
+        if days:
+            n = max(1, -(-(range_start - self.last).days // days))
+        else:
+            n = (range_start.year - self.last.year) * 12 + range_start.month - self.last.month
+            n = max(1, n // months)
+            while self._nth(n) < range_start:
+                n += 1
+        current = self._nth(n)
+        while current <= last:
+            yield current
+            n += 1
+            current = self._nth(n)
+
+    def occurrences(self, range_start, range_end):
+        """Yields the projected planned operations within a period, as `Operation` models."""
+        for day in self.dates(range_start, range_end):
+            yield self.occurrence(day)
+
+    def occurrence(self, day):
+        """Returns the projected operation of a date (`id` None, `isPlanned` and `isProjected` set)."""
+        return Operation(dict(self.template, id=None, date=day.isoformat(), dateIso=day.isoformat(),
+                              isPlanned=True, isProjected=True))
+
+    def _nth(self, n):
+        days, months = self.step
+        return self.last + timedelta(days=days * n) if days else _add_months(self.last, months * n)
+
+    def __repr__(self):
+        return f"<RecurringChain(chain_id={self.chain_id!r}, step={self.step}, last={self.last}, end={self.end})>"
+
+
+def _tagged(position, chain, range_start, range_end):
+    for day in chain.dates(range_start, range_end):
+        yield day, position, chain
+
+
+class _IntervalIndex:
+    """
+    Static interval tree over `(start, end, item)` ordinals: an implicit balanced tree on the
+    intervals sorted by start, each node holding the largest end of its subtree. Overlap
+    queries take O(log n + k).
+    """
+    def __init__(self, intervals):
+        self.intervals = sorted(intervals, key=lambda interval: interval[0])
+        self.max_end = [0] * len(self.intervals)
+        self._build(0, len(self.intervals))
+
+    def _build(self, lo, hi):
+        if lo >= hi:
+            return 0
+        mid = (lo + hi) // 2
+        self.max_end[mid] = max(self.intervals[mid][1], self._build(lo, mid), self._build(mid + 1, hi))
+        return self.max_end[mid]
+
+    def overlapping(self, start, end):
+        """Returns the items whose interval overlaps `[start, end]`, by start."""
+        found = []
+        stack = [(0, len(self.intervals))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self.max_end[mid] < start:
+                continue # No interval of this subtree reaches the query.
+            interval = self.intervals[mid]
+            if interval[0] <= end:
+                if interval[1] >= start:
+                    found.append((interval[0], mid, interval[2]))
+                stack.append((mid + 1, hi))
+            stack.append((lo, mid))
+        return [item for _, _, item in sorted(found, key=lambda entry: entry[:2])]
+
+
+class CashFlowForecast:
+    """
+    Forward cash flow from actual and planned operations, plus the future occurrences of
+    periodic chains.
+
+    Operations with a `periodic_chain` are grouped into `RecurringChain` objects,
+    each projected from its latest known operation by its period (day, week,
+    month, quarter or year) until its `repetitionEndDate`, if any. The chains
+    are kept in an interval index on their projection periods, so a horizon
+    only touches the chains active in it, and each chain computes its first
+    occurrence in the horizon directly. Occurrences are generated lazily and
+    merged in date order.
+
+    Example:
+        forecast = CashFlowForecast(mirror.list_all(range_start="2024-01-01"))
+        for operation in forecast.occurrences("2024-12-31"):
+            print(operation.date_iso, operation.amount)
+        forecast.series("2024-07-01", "2024-12-31", step="month", opening_balance=15000)
+    """
+    def __init__(self, operations=()):
+        """
+        Initializes the CashFlowForecast.
+
+        Args:
+            operations (iterable[Operation | dict], optional): Actual and planned operations,
+                                                               including the periodic ones.
+        """
+        self._operations = {}
+        self._index = None
+        self._chains = None
+        self._days = None
+        self.add(operations)
+
+    def add(self, operations):
+        """Adds operations, or replaces the ones already added (by ID)."""
+        for operation in operations:
+            data = getattr(operation, "_data", operation)
+            key = data.get("id") if data.get("id") is not None else ("new", id(data))
+            self._operations[key] = data
+        self._index = self._chains = self._days = None
+
+    def remove(self, ids):
+        """Removes operations by ID."""
+        for operation_id in ids:
+            self._operations.pop(operation_id, None)
+        self._index = self._chains = self._days = None
+
+    @property
+    def chains(self):
+        """dict: `{chain_id: RecurringChain}` of the periodic chains among the operations."""
+        if self._chains is None:
+            latest = {}
+            for data in self._operations.values():
+                chain_id = data.get("periodicChain")
+                day = _operation_date(data)
+                if chain_id is None or day is None:
+                    continue
+                if chain_id not in latest or day >= _operation_date(latest[chain_id]):
+                    latest[chain_id] = data
+            self._chains = {}
+            for chain_id, data in latest.items():
+                end = data.get("repetitionEndDate")
+                self._chains[chain_id] = RecurringChain(chain_id, data, _to_date(end) if end else None)
+        return self._chains
+
+    def active_chains(self, range_start, range_end):
+        """Returns the chains with at least one projected occurrence possible within a period."""
+        if self._index is None:
+            self._index = _IntervalIndex(
+                (chain.next_date.toordinal(), chain.end.toordinal() if chain.end else _OPEN_END, chain)
+                for chain in self.chains.values() if chain.next_date is not None)
+        return self._index.overlapping(_to_date(range_start).toordinal(), _to_date(range_end).toordinal())
+
+    def occurrences(self, horizon, start=None):
+        """
+        Lazily yields the projected planned operations of all chains up to a horizon,
+        in date order.
+
+        Args:
+            horizon (str | date): Last day to project (YYYY-MM-DD or DD.MM.YYYY).
+            start (str | date, optional): First day to project. Defaults to today.
+
+        Yields:
+            Operation: Projected operations (`id` None, `isPlanned` and `isProjected` set in `_data`).
+        """
+        first = _to_date(start) if start is not None else date.today()
+        for day, chain in self._projected(first, _to_date(horizon)):
+            yield chain.occurrence(day)
+
+    def series(self, range_start, range_end, step="day", opening_balance=0.0):
+        """
+        Returns the forward cash flow of a period: the operations known for it merged with the
+        projected occurrences of the periodic chains.
+
+        Args:
+            range_start (str | date): First day.
+            range_end (str | date): Last day.
+            step (str, optional): "day", "week", "month", "quarter" or "year". Defaults to "day".
+            opening_balance (float, optional): Balance before the first day, e.g. from
+                                               `BalanceIndex.balances`. Defaults to 0.
+
+        Returns:
+            list[dict]: One dict per period with operations: "period" (as in `aggregate`),
+                        "income", "outcome", "net" and the closing "balance".
+        """
+        if step not in PERIODS:
+            raise ValueError(f"Unknown step: {step!r}")
+        first, last = _to_date(range_start), _to_date(range_end)
+        label = PERIODS[step]
+        totals, labels = {}, {}
+
+        def count(day, type, amount):
+            period = labels.get(day)
+            if period is None:
+                period = labels[day] = label(day.isoformat())
+            entry = totals.setdefault(period, [0.0, 0.0])
+            if type in (1, 2):
+                entry[type - 1] += amount
+
+        days, entries = self._known_days()
+        for position in range(bisect_left(days, first.toordinal()), bisect_right(days, last.toordinal())):
+            day, type, amount = entries[position]
+            count(date.fromordinal(day), type, amount)
+        for day, chain in self._projected(first, last):
+            count(day, chain.template.get("type"), chain.amount)
+
+        series, balance = [], opening_balance
+        for period in sorted(totals):
+            income, outcome = totals[period]
+            balance += income - outcome
+            series.append({"period": period, "income": round(income, 2), "outcome": round(outcome, 2),
+                           "net": round(income - outcome, 2), "balance": round(balance, 2)})
+        return series
+
+    def _projected(self, first, last):
+        """Merges the projected dates of the active chains: `(date, chain)` in date order."""
+        streams = [_tagged(position, chain, first, last)
+                   for position, chain in enumerate(self.active_chains(first, last))]
+        for day, _, chain in heapq.merge(*streams, key=lambda entry: entry[:2]):
+            yield day, chain
+
+    def _known_days(self):
+        """The stored operations as `(day ordinal, type, amount)` sorted by day, for range lookups."""
+        if self._days is None:
+            entries = []
+            for data in self._operations.values():
+                day = _operation_date(data)
+                if day is not None:
+                    entries.append((day.toordinal(), data.get("type"), float(data.get("amount") or 0.0)))
+            entries.sort(key=lambda entry: entry[0])
+            self._days = ([entry[0] for entry in entries], entries)
+        return self._days
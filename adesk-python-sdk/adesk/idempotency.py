@@ -0,0 +1,252 @@
+# adesk/idempotency.py
+import json
+import sqlite3
+import threading
+import time
+import uuid
+
+from .exceptions import AdeskAPIError, AdeskOutcomeUnknownError, AdeskRateLimitError, AdeskServerError
+
+PENDING = "pending"
+DONE = "done"
+
+
+def marker_for(key):
+    """
+    Returns the marker appended to the description of an object created with `key`,
+    which lets a later lookup recognize the object.
+    """
+    return f"[idem:{key}]"
+
+
+class MemoryIdempotencyStore:
+    """
+    Keeps idempotency records in memory: protects retries within one process.
+    """
+    def __init__(self):
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the record of `key` as `(status, data)`, or None if the key is unknown.
+        `data` is the raw API data of the created object once `status` is "done".
+        """
+        with self._lock:
+            return self._records.get(key)
+
+    def put(self, key, status, data=None):
+        """Stores the record of `key`."""
+        with self._lock:
+            self._records[key] = (status, data)
+
+    def delete(self, key):
+        """Forgets `key` (e.g., after a create that definitely failed)."""
+        with self._lock:
+            self._records.pop(key, None)
+
+
+class SQLiteIdempotencyStore(MemoryIdempotencyStore):
+    """
+    Keeps idempotency records in a SQLite database, so keys survive restarts
+    and are shared by the processes using the same file.
+    """
+    def __init__(self, path):
+        """
+        Initializes the SQLiteIdempotencyStore.
+
+        Args:
+            path (str): Path to the database file (created if missing), or ":memory:".
+        """
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS idempotency ("
+                           "key TEXT PRIMARY KEY, status TEXT NOT NULL, data TEXT, updated REAL NOT NULL)")
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT status, data FROM idempotency WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]) if row[1] is not None else None
+
+    def put(self, key, status, data=None):
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO idempotency (key, status, data, updated) VALUES (?, ?, ?, ?)",
+                               (key, status, json.dumps(data) if data is not None else None, time.time()))
+
+    def delete(self, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM idempotency WHERE key = ?", (key,))
+
+    def close(self):
+        """Closes the database connection."""
+        self._conn.close()
+
+
+def _is_ambiguous(error):
+    """Whether the request may have been applied even though it failed (network errors, 5xx)."""
+    return error.status_code is None or isinstance(error, AdeskServerError)
+
+
+class IdempotentCreator:
+    """
+    Makes `create` calls safe to retry.
+
+    Every create is tagged with an idempotency key (given by the caller, or
+    generated) whose outcome is kept in a store. The key's marker (see
+    `marker_for`) is appended to the object's description. A key that already
+    produced an object returns that object without calling the API again.
+    When a create fails ambiguously (network error or 5xx: the object may or
+    may not exist), the creator first looks for an object carrying the
+    marker with a matching list query, and only re-sends the create if there
+    is none. Rate-limited (429) creates are retried directly; if every attempt
+    is throttled, or the create raises before anything is sent, the key is
+    released so that the next call with it sends the create again.
+
+    Transfers cannot be listed by the API, so an ambiguous transfer create is
+    only retried if a `finders["transfer"]` lookup is supplied; otherwise
+    `AdeskOutcomeUnknownError` is raised, now and on every later call with the
+    same key, and the key stays pending for reconciliation.
+
+    Example:
+        creator = IdempotentCreator(client, SQLiteIdempotencyStore("idempotency.db"))
+        operation = creator.operation(key=f"stmt-42-line-{n}", date="2024-01-15", type="income",
+                                      amount=100, bank_account=1, description="Invoice 17")
+    """
+    def __init__(self, client, store=None, retries=3, backoff=0.5, finders=None):
+        """
+        Initializes the IdempotentCreator.
+
+        Args:
+            client (AdeskClient): The client to create objects with.
+            store (MemoryIdempotencyStore, optional): Where key outcomes are kept.
+                                                      Defaults to a `MemoryIdempotencyStore`.
+            retries (int, optional): Extra attempts after a retryable failure. Defaults to 3.
+            backoff (float, optional): Seconds to wait before the first retry; doubled after
+                                       each one. Defaults to 0.5.
+            finders (dict, optional): Overrides the lookups by kind ("operation", "transfer",
+                                      "commitment", "contractor"). Each is called as
+                                      `finder(kwargs, marker)` and returns the created model
+                                      or None.
+        """
+        self.client = client
+        self.store = store if store is not None else MemoryIdempotencyStore()
+        self.retries = retries
+        self.backoff = backoff
+        self.finders = {
+            "operation": self._find_operation,
+            "commitment": self._find_commitment,
+            "contractor": self._find_contractor,
+        }
+        self.finders.update(finders or {})
+
+    def operation(self, key=None, **kwargs):
+        """Creates an operation; see `Operations.create` for the arguments."""
+        return self._create("operation", key, kwargs)
+
+    def transfer(self, key=None, **kwargs):
+        """Creates a transfer; see `Transfers.create` for the arguments."""
+        return self._create("transfer", key, kwargs)
+
+    def commitment(self, key=None, **kwargs):
+        """Creates a commitment; see `Commitments.create` for the arguments."""
+        return self._create("commitment", key, kwargs)
+
+    def contractor(self, key=None, **kwargs):
+        """Creates a contractor; see `Contractors.create` for the arguments."""
+        return self._create("contractor", key, kwargs)
+
+    def _create(self, kind, key, kwargs):
+        key = key or uuid.uuid4().hex
+        model_class, create = self._resources()[kind]
+        record = self.store.get(key)
+        if record is not None and record[0] == DONE:
+            return model_class(record[1])
+
+        marker = marker_for(key)
+        kwargs = dict(kwargs)
+        description = kwargs.get("description")
+        if not description or marker not in description:
+            kwargs["description"] = f"{description} {marker}" if description else marker
+
+        if record is not None: # Pending: an earlier attempt ended without a known outcome.
+            if kind not in self.finders:
+                raise AdeskOutcomeUnknownError(f"Outcome of {kind} create {key} is unknown and cannot be "
+                                               f"verified; not sending it again.")
+            found = self._find(kind, kwargs, marker)
+            if found is not None:
+                self.store.put(key, DONE, found._data)
+                return found
+        self.store.put(key, PENDING)
+
+        delay = self.backoff
+        uncertain = False # Whether an attempt of this call may have created the object.
+        for attempt in range(self.retries + 1):
+            try:
+                created = create(**kwargs)
+            except AdeskAPIError as e:
+                if not (_is_ambiguous(e) or isinstance(e, AdeskRateLimitError)):
+                    self.store.delete(key) # Rejected: nothing was created.
+                    raise
+                if _is_ambiguous(e) and kind not in self.finders:
+                    raise AdeskOutcomeUnknownError(f"Outcome of {kind} create {key} is unknown and cannot be "
+                                                   f"verified; not retrying: {e}") from e
+                uncertain = uncertain or _is_ambiguous(e)
+                if attempt == self.retries:
+                    if not uncertain: # Throttled every time: nothing was created.
+                        self.store.delete(key)
+                    raise
+                if _is_ambiguous(e):
+                    found = self._find(kind, kwargs, marker)
+                    if found is not None:
+                        self.store.put(key, DONE, found._data)
+                        return found
+                time.sleep(delay)
+                delay *= 2
+                continue
+            except Exception:
+                if not uncertain: # e.g. invalid arguments, raised before anything was sent.
+                    self.store.delete(key)
+                raise
+            if created is None:
+                raise AdeskAPIError(f"The API did not return the created {kind}.")
+            self.store.put(key, DONE, created._data)
+            return created
+
+    def _find(self, kind, kwargs, marker):
+        finder = self.finders.get(kind)
+        return finder(kwargs, marker) if finder is not None else None
+
+    def _resources(self):
+        # Imported here, like the client's lazy resources.
+        from .models import Operation, Transfer, Commitment, Contractor
+        client = self.client
+        return {
+            "operation": (Operation, client.operations.create),
+            "transfer": (Transfer, client.transfers.create),
+            "commitment": (Commitment, client.commitments.create),
+            "contractor": (Contractor, client.contractors.create),
+        }
+
+    def _find_operation(self, kwargs, marker):
+        candidates = self.client.operations.iter_all(range_start=kwargs.get("date"), range_end=kwargs.get("date"),
+                                                     bank_account=kwargs.get("bank_account"))
+        return next((op for op in candidates if marker in (op.description or "")), None)
+
+    def _find_commitment(self, kwargs, marker):
+        contractor = kwargs.get("contractor")
+        candidates = self.client.commitments.list_commitments(
+            range_start=kwargs.get("date"), range_end=kwargs.get("date"),
+            contractors=[contractor] if contractor is not None else None)
+        return next((c for c in candidates if marker in (c.description or "")), None)
+
+    def _find_contractor(self, kwargs, marker):
+        # The list may leave out descriptions: those candidates are fetched one by one.
+        for candidate in self.client.contractors.list_all(q=kwargs.get("name")):
+            if candidate.description is None:
+                candidate = self.client.contractors.get(candidate.id) or candidate
+            if marker in (candidate.description or ""):
+                return candidate
+        return None
@@ -0,0 +1,442 @@
+# adesk/importer.py
+import csv
+import hashlib
+import json
+import os
+import queue
+import threading
+from datetime import datetime
+
+from .bulk import run_bulk
+from .idempotency import DONE, PENDING, IdempotentCreator
+
+# Column names `read_csv` maps to row fields, unless given its own `columns`.
+DEFAULT_COLUMNS = {
+    "date": "date",
+    "amount": "amount",
+    "description": "description",
+    "contractor": "contractor",
+    "contractor_inn": "contractor_inn",
+    "category": "category",
+}
+
+_DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%d.%m.%y", "%d/%m/%Y")
+_KEY_FIELDS = ("date", "amount", "description", "contractor", "contractor_inn")
+_DONE = object()
+
+
+def read_csv(path, columns=None, delimiter=";", encoding="utf-8-sig"):
+    """
+    Streams rows of a CSV bank statement without loading the file in memory.
+
+    Args:
+        path (str): Path to the CSV file (with a header line).
+        columns (dict, optional): Maps row fields (`date`, `amount`, `description`, `contractor`,
+                                  `contractor_inn`, `category`) to CSV column names.
+                                  Defaults to `DEFAULT_COLUMNS`.
+        delimiter (str, optional): Field delimiter. Defaults to ";".
+        encoding (str, optional): File encoding. Defaults to "utf-8-sig".
+
+    Yields:
+        tuple[int, dict]: The line number and the row fields. Amounts are signed:
+                          negative for outgoing payments.
+    """
+    columns = columns or DEFAULT_COLUMNS
+    with open(path, newline="", encoding=encoding) as f:
+        reader = csv.DictReader(f, delimiter=delimiter)
+        for record in reader:
+            yield reader.line_num, {field: record.get(column) for field, column in columns.items()}
+
+
+def read_1c(path, account_number, encoding="cp1251"):
+    """
+    Streams payments of a 1C client-bank exchange file (`1CClientBankExchange`).
+
+    Args:
+        path (str): Path to the exchange file.
+        account_number (str): Number of the account the statement belongs to; payments
+                              from it are outgoing, payments to it incoming.
+        encoding (str, optional): File encoding. Defaults to "cp1251".
+
+    Yields:
+        tuple[int, dict]: The line number of the document and its row fields.
+    """
+    document, start = None, 0
+    with open(path, encoding=encoding) as f:
+        for line_number, line in enumerate(f, 1):
+            key, _, value = line.strip().partition("=")
+            if key == "СекцияДокумент":
+                document, start = {}, line_number
+            elif key == "КонецДокумента" and document is not None:
+                outgoing = document.get("ПлательщикСчет") == account_number
+                side = "Получатель" if outgoing else "Плательщик"
+                amount = document.get("Сумма", "")
+                yield start, {
+                    "date": document.get("Дата"),
+                    "amount": f"-{amount}" if outgoing else amount,
+                    "description": document.get("НазначениеПлатежа"),
+                    "contractor": document.get(side + "1") or document.get(side),
+                    "contractor_inn": document.get(side + "ИНН"),
+                    "category": None,
+                }
+                document = None
+            elif document is not None:
+                document[key] = value
+
+
+def _row_key(fields, occurrences):
+    """
+    Dedup key of a source row: a hash of its raw fields, plus the number of identical
+    rows before it (so that two identical payments on the same day are both imported).
+    """
+    fingerprint = hashlib.sha1(json.dumps([str(fields.get(name) or "").strip() for name in _KEY_FIELDS],
+                                          ensure_ascii=False).encode("utf-8")).hexdigest()
+    occurrences[fingerprint] = occurrences.get(fingerprint, 0) + 1
+    return f"{fingerprint}:{occurrences[fingerprint]}"
+
+
+def _parse_date(value):
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), date_format).strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid date: {value!r}")
+
+
+def _parse_amount(value):
+    text = str(value).replace("\xa0", "").replace(" ", "").replace(",", ".")
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"Invalid amount: {value!r}") from None
+
+
+class ImportJournal:
+    """
+    Append-only journal of an import, one JSON line per processed row.
+
+    Every row outcome is written (and flushed) as soon as it is known, so a
+    crashed or interrupted import can be run again with the same journal:
+    rows already created are skipped and everything else is retried.
+
+    The journal is also the idempotency store of the importer's creates (see
+    `IdempotentCreator`): a row is marked "sending" before its create is sent,
+    and a row still sending when the journal is reopened is looked up before
+    it is sent again.
+    """
+    def __init__(self, path, fsync=False):
+        """
+        Initializes the ImportJournal and loads the outcomes already recorded in it.
+
+        Args:
+            path (str): Path to the journal file; created if missing.
+            fsync (bool, optional): Force every entry to disk (slower, survives power loss).
+                                    Defaults to False.
+        """
+        self.path = path
+        self.fsync = fsync
+        self.done = {}
+        self.sending = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue # A line cut short by a crash.
+                    self._apply(entry["key"], entry.get("status"), entry.get("id"))
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def is_done(self, key):
+        """Whether the row with this key was created by a previous run."""
+        return key in self.done
+
+    def record(self, key, line, status, operation_id=None, error=None):
+        """
+        Appends the outcome of a row.
+
+        Args:
+            key (str): The row's dedup key.
+            line (int): The row's line number in the source file.
+            status (str): "created", "invalid", "failed", "sending" or "released".
+            operation_id (int, optional): ID of the created operation.
+            error (Exception, optional): Why the row was not created.
+        """
+        entry = {"key": key, "line": line, "status": status}
+        if operation_id is not None:
+            entry["id"] = operation_id
+        if error is not None:
+            entry["error"] = str(error)
+        with self._lock:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._apply(key, status, operation_id)
+
+    def get(self, key):
+        """Idempotency store interface: the `(status, data)` record of a key, or None."""
+        if key in self.done:
+            return DONE, {"id": self.done[key]}
+        return (PENDING, None) if key in self.sending else None
+
+    def put(self, key, status, data=None):
+        """Idempotency store interface: records that a create is being sent, or succeeded."""
+        if status == PENDING:
+            self.record(key, None, "sending")
+        else:
+            with self._lock:
+                self.sending.discard(key) # "created" is recorded by the importer, with the row's line.
+
+    def delete(self, key):
+        """Idempotency store interface: records that a create definitely failed."""
+        self.record(key, None, "released")
+
+    def _apply(self, key, status, operation_id):
+        if status == "created":
+            self.done[key] = operation_id
+            self.sending.discard(key)
+        elif status == "sending":
+            self.sending.add(key)
+        elif status == "released":
+            self.sending.discard(key)
+
+    def close(self):
+        """Closes the journal file."""
+        self._file.close()
+
+
+class ImportReport:
+    """
+    Summary of an import run.
+
+    Attributes:
+        created (int): Rows created as operations.
+        skipped (int): Rows already created by a previous run (found in the journal).
+        invalid (list[tuple[int, Exception]]): `(line, error)` of rows rejected by parsing,
+                                               validation or resolution.
+        failed (list[tuple[int, Exception]]): `(line, error)` of rows the API did not create.
+    """
+    def __init__(self):
+        self.created = 0
+        self.skipped = 0
+        self.invalid = []
+        self.failed = []
+
+    def __repr__(self):
+        return (f"<ImportReport(created={self.created}, skipped={self.skipped}, "
+                f"invalid={len(self.invalid)}, failed={len(self.failed)})>")
+
+
+class _Row:
+    """A statement row moving through the pipeline."""
+    __slots__ = ("line", "fields", "kwargs", "key", "error")
+
+    def __init__(self, line, fields):
+        self.line = line
+        self.fields = fields
+        self.kwargs = None
+        self.key = None
+        self.error = None
+
+
+class OperationImporter:
+    """
+    Streams bank-statement rows into `Operations.create`.
+
+    Rows flow through parse/validate, resolve (category and contractor IDs) and
+    dedup stages, each running in its own thread and connected by bounded
+    queues, into the concurrent create path (`run_bulk`). Memory use stays flat
+    whatever the file size, and a slow stage applies back-pressure to the ones
+    before it. Rejected rows are journaled by the stage that rejects them.
+
+    Dedup keys are a hash of the row's raw date, amount, description and
+    contractor, plus the number of identical rows before it in the file (so
+    that two identical payments on the same day are both imported); they are
+    assigned as rows are read, before any stage can reject them. With a
+    journal, rows created by an earlier run (or an overlapping statement
+    imported into the same journal) are skipped, and creates go through
+    `IdempotentCreator` with the row's key (its marker is appended to the
+    description), so a row whose create outcome was not recorded (a crash,
+    a 5xx) is looked up rather than created twice.
+
+    Example:
+        importer = OperationImporter(client, bank_account=12, journal="statement.journal",
+                                     resolve_contractor=lambda name, inn: contractor_ids.get(inn))
+        report = importer.run(read_csv("statement.csv"))
+    """
+    def __init__(self, client, bank_account, journal=None, resolve_category=None, resolve_contractor=None,
+                 concurrency=4, queue_size=1000, create_options=None):
+        """
+        Initializes the OperationImporter.
+
+        Args:
+            client (AdeskClient): The client to create operations with.
+            bank_account (int): ID of the bank account the statement belongs to.
+            journal (str | ImportJournal, optional): Journal (or its path) making the import
+                                                     resumable. Defaults to no journal.
+            resolve_category (callable, optional): Called as `resolve_category(fields)`; returns
+                                                   the category ID (or None) for a row.
+                                                   Defaults to looking up the row's `category`
+                                                   name in `client.registry`.
+            resolve_contractor (callable, optional): Called as `resolve_contractor(name, inn)`;
+                                                     returns the contractor ID or None. Results
+                                                     are cached per `(name, inn)`.
+            concurrency (int, optional): Number of create requests in flight. Defaults to 4.
+            queue_size (int, optional): Capacity of the queues between stages. Defaults to 1000.
+            create_options (dict, optional): Extra `Operations.create` arguments for every row
+                                             (e.g., `{"apply_import_rules": True}`).
+        """
+        self.client = client
+        self.bank_account = bank_account
+        self.journal = ImportJournal(journal) if isinstance(journal, str) else journal
+        self.resolve_category = resolve_category
+        self.resolve_contractor = resolve_contractor
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.create_options = create_options or {}
+        self._contractors = {}
+
+    def parse(self, row):
+        """Parse and validate stage: builds the `create` arguments of a row."""
+        fields = row.fields
+        if not fields.get("date") or not fields.get("amount"):
+            raise ValueError("Required fields missing: date, amount.")
+        amount = _parse_amount(fields["amount"])
+        if amount == 0:
+            raise ValueError("Amount must not be zero.")
+        row.kwargs = dict(self.create_options, date=_parse_date(fields["date"]),
+                          type="outcome" if amount < 0 else "income", amount=abs(amount),
+                          bank_account=self.bank_account)
+        if fields.get("description"):
+            row.kwargs["description"] = fields["description"]
+        return row
+
+    def resolve(self, row):
+        """Resolve stage: looks up category and contractor IDs."""
+        fields = row.fields
+        if self.resolve_category is not None:
+            category = self.resolve_category(fields)
+        elif fields.get("category"):
+            category = self.client.registry.category_id(fields["category"], row.kwargs["type"])
+        else:
+            category = None
+        if category:
+            row.kwargs["category"] = category
+        if self.resolve_contractor and (fields.get("contractor") or fields.get("contractor_inn")):
+            lookup = (fields.get("contractor"), fields.get("contractor_inn"))
+            if lookup not in self._contractors:
+                self._contractors[lookup] = self.resolve_contractor(*lookup)
+            if self._contractors[lookup]:
+                row.kwargs["contractor"] = self._contractors[lookup]
+        return row
+
+    def run(self, rows):
+        """
+        Imports the rows.
+
+        Args:
+            rows (iterable): `(line, fields)` pairs, as yielded by `read_csv` or `read_1c`.
+
+        Returns:
+            ImportReport: What was created, skipped and rejected.
+        """
+        report = ImportReport()
+
+        def dedup(row):
+            if self.journal is not None and self.journal.is_done(row.key):
+                report.skipped += 1
+                return None
+            return row
+
+        errors = []
+
+        def reject(row): # Called from the stage threads, as soon as a row is rejected.
+            if isinstance(row, BaseException):
+                errors.append(row)
+                return
+            report.invalid.append((row.line, row.error))
+            self._record(row.key, row.line, "invalid", error=row.error)
+
+        source = queue.Queue(self.queue_size)
+        parsed = queue.Queue(self.queue_size)
+        resolved = queue.Queue(self.queue_size)
+        ready = queue.Queue(self.queue_size)
+        threads = [
+            threading.Thread(target=self._read, args=(rows, source), daemon=True),
+            threading.Thread(target=self._stage, args=(self.parse, source, parsed, reject), daemon=True),
+            threading.Thread(target=self._stage, args=(self.resolve, parsed, resolved, reject), daemon=True),
+            threading.Thread(target=self._stage, args=(dedup, resolved, ready, reject), daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        if self.journal is not None:
+            creator = IdempotentCreator(self.client, self.journal, retries=0)
+            create = lambda row: creator.operation(key=row.key, **row.kwargs)
+        else:
+            create = lambda row: self.client.operations.create(**row.kwargs)
+        for outcome in run_bulk(create, self._drain(ready), concurrency=self.concurrency):
+            row = outcome.item
+            if outcome.ok and outcome.result is not None:
+                report.created += 1
+                self._record(row.key, row.line, "created", operation_id=outcome.result.id)
+            else:
+                error = outcome.error or ValueError("The API did not return the created operation.")
+                report.failed.append((row.line, error))
+                self._record(row.key, row.line, "failed", error=error)
+
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return report
+
+    def close(self):
+        """Closes the journal, if any."""
+        if self.journal is not None:
+            self.journal.close()
+
+    def _record(self, key, line, status, operation_id=None, error=None):
+        if self.journal is not None:
+            self.journal.record(key, line, status, operation_id=operation_id, error=error)
+
+    @staticmethod
+    def _read(rows, out_queue):
+        occurrences = {}
+        try:
+            for line, fields in rows:
+                row = _Row(line, fields)
+                row.key = _row_key(fields, occurrences)
+                out_queue.put(row)
+        except BaseException as e: # Surfaced by the last stage, e.g. an unreadable file.
+            out_queue.put(e)
+        out_queue.put(_DONE)
+
+    @staticmethod
+    def _stage(func, in_queue, out_queue, reject):
+        while True:
+            row = in_queue.get()
+            if row is _DONE or isinstance(row, BaseException):
+                if isinstance(row, BaseException):
+                    reject(row)
+                out_queue.put(_DONE)
+                return
+            try:
+                row = func(row)
+            except Exception as e:
+                row.error = e
+                reject(row)
+                continue
+            if row is not None:
+                out_queue.put(row)
+
+    @staticmethod
+    def _drain(in_queue):
+        while True:
+            row = in_queue.get()
+            if row is _DONE:
+                return
+            yield row
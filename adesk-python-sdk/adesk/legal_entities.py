@@ -1,4 +1,5 @@
 from adesk_python_sdk.adesk.models import LegalEntity
+from adesk_python_sdk.adesk.batch_get import MissCache, fetch_many
 
 class LegalEntities:
     """
@@ -13,6 +14,7 @@ class LegalEntities:
             client (AdeskClient): The AdeskClient instance to use for API calls.
         """
         self.client = client
+        self._misses = MissCache()
 
     def create(self, name, full_name=None, inn=None, kpp=None, address=None, phone_number=None, registration_number=None):
         """
@@ -130,6 +132,16 @@ class LegalEntities:
         entity_data = response_data.get("legalEntity") if response_data else None
         return LegalEntity(entity_data) if entity_data else None
 
+    def get_many(self, legal_entity_ids, cache=None, concurrency=4):
+        """
+        Retrieves many legal entities as `{id: LegalEntity}`: from `cache` and `client.registry`
+        first, then with concurrent `get` calls. See `batch_get.fetch_many`.
+        """
+        registry = self.client.registry
+        return fetch_many(legal_entity_ids, self.get, lookups=[lambda ids: registry.cached("legal_entities", ids)],
+                          list_all=lambda: registry.all("legal_entities"), cache=cache,
+                          misses=self._misses, concurrency=concurrency)
+
     def list_all(self):
         """
         Retrieves a list of all legal entities.
@@ -0,0 +1,638 @@
+# adesk/mirror.py
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import date, datetime, timedelta
+
+from .bulk import run_bulk
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS operations (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    type INTEGER,
+    amount REAL,
+    description TEXT,
+    category_id INTEGER,
+    bank_account_id INTEGER,
+    legal_entity_id INTEGER,
+    contractor_id INTEGER,
+    project_id INTEGER,
+    business_unit_id INTEGER,
+    is_planned INTEGER,
+    is_transfer INTEGER,
+    data TEXT NOT NULL,
+    related_date TEXT
+);
+CREATE INDEX IF NOT EXISTS operations_date ON operations (date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    shard TEXT PRIMARY KEY,
+    range_start TEXT NOT NULL,
+    range_end TEXT NOT NULL,
+    synced_at REAL,
+    rows INTEGER NOT NULL DEFAULT 0,
+    duration REAL,
+    dirty INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+_OPERATION_COLUMNS = ("id", "date", "type", "amount", "description", "category_id", "bank_account_id",
+                      "legal_entity_id", "contractor_id", "project_id", "business_unit_id", "is_planned",
+                      "is_transfer", "data", "related_date")
+_FLAT_COLUMNS = tuple(column for column in _OPERATION_COLUMNS if column != "data")
+_INSERT_OPERATION = (f"INSERT OR REPLACE INTO operations ({', '.join(_OPERATION_COLUMNS)}) "
+                     f"VALUES ({', '.join('?' * len(_OPERATION_COLUMNS))})")
+
+# `list_all` filters stored as columns -> column; each gets a (column, date) index.
+_INDEXED_FILTERS = {
+    "category": "category_id",
+    "bank_account": "bank_account_id",
+    "legal_entity": "legal_entity_id",
+    "contractor": "contractor_id",
+    "project": "project_id",
+    "business_unit": "business_unit_id",
+}
+
+_OPERATION_TYPES = {"income": 1, "outcome": 2, 1: 1, 2: 2}
+
+# Reference tables: name -> function fetching every object with the client.
+REFERENCE_KINDS = {
+    "projects": lambda client: client.projects.list(),
+    "contractors": lambda client: client.contractors.list_all(),
+    "bank_accounts": lambda client: client.bank_accounts.list_all(),
+    "categories": lambda client: client.transaction_categories.list(),
+}
+
+
+def _to_date(value):
+    """Parses YYYY-MM-DD (or an ISO date-time) and DD.MM.YYYY dates."""
+    if isinstance(value, date):
+        return value
+    value = str(value)
+    if "." in value[:6]:
+        return datetime.strptime(value[:10], "%d.%m.%Y").date()
+    return datetime.strptime(value[:10], "%Y-%m-%d").date()
+
+
+def _month_shards(range_start, range_end):
+    """Splits a period into calendar-month shards: `(key, first_day, last_day)`."""
+    current = _to_date(range_start).replace(day=1)
+    last = _to_date(range_end)
+    while current <= last:
+        following = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
+        yield current.strftime("%Y-%m"), current.isoformat(), (following - timedelta(days=1)).isoformat()
+        current = following
+
+
+def _named_range(name, today):
+    """Resolves a predefined `range_str` (e.g., "this_month") to `(first_day, last_day)`."""
+    def month_end(day):
+        return (day.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+
+    month = today.replace(day=1)
+    quarter = month.replace(month=month.month - (month.month - 1) % 3)
+    previous_quarter = (quarter - timedelta(days=1)).replace(day=1)
+    previous_quarter = previous_quarter.replace(month=previous_quarter.month - 2)
+    ranges = {
+        "today": (today, today),
+        "yesterday": (today - timedelta(days=1), today - timedelta(days=1)),
+        "this_week": (today - timedelta(days=today.weekday()), today - timedelta(days=today.weekday()) + timedelta(days=6)),
+        "this_month": (month, month_end(month)),
+        "last_month": ((month - timedelta(days=1)).replace(day=1), month - timedelta(days=1)),
+        "this_quarter": (quarter, month_end(quarter.replace(month=quarter.month + 2))),
+        "last_quarter": (previous_quarter, quarter - timedelta(days=1)),
+        "this_year": (today.replace(month=1, day=1), today.replace(month=12, day=31)),
+        "last_year": (today.replace(year=today.year - 1, month=1, day=1), today.replace(month=1, day=1) - timedelta(days=1)),
+    }
+    if name not in ranges:
+        raise ValueError(f"Unsupported range_str for offline queries: {name!r}")
+    return ranges[name]
+
+
+def _import_pandas(feature="LocalMirror.list_frame"):
+    try:
+        import pandas
+    except ImportError as e:
+        raise ImportError(f"{feature} requires the 'pandas' package (pip install pandas).") from e
+    return pandas
+
+
+def _ref_id(value):
+    if isinstance(value, dict):
+        return value.get("id")
+    return value
+
+
+def _operation_row(operation):
+    """Flattens an `Operation` into a row of the `operations` table."""
+    data = operation._data
+    bank_account = data.get("bankAccount") or {}
+    operation_date = operation.date_iso or operation.date
+    return (
+        operation.id,
+        _to_date(operation_date).isoformat(),
+        operation.type,
+        operation.amount,
+        operation.description,
+        _ref_id(data.get("category")),
+        _ref_id(bank_account),
+        _ref_id(data.get("legalEntity") or (bank_account.get("legalEntity") if isinstance(bank_account, dict) else None)),
+        _ref_id(data.get("contractor")),
+        _ref_id(data.get("project")),
+        _ref_id(data.get("businessUnit") or data.get("business_unit")),
+        None if operation.is_planned is None else int(bool(operation.is_planned)),
+        None if operation.is_transfer is None else int(bool(operation.is_transfer)),
+        json.dumps(data, ensure_ascii=False),
+        _to_date(operation.related_date).isoformat() if operation.related_date else None,
+    )
+
+
+def _summarize(flat_rows):
+    """
+    Per-day aggregates of operation rows (in `_FLAT_COLUMNS` order): `{date: (count, amount, checksum)}`.
+    The checksum is the sum of the CRC32 of each row, so it does not depend on row order and changes
+    when any mirrored field of any operation of the day changes.
+    """
+    days = {}
+    for row in flat_rows:
+        count, amount, checksum = days.get(row[1], (0, 0.0, 0))
+        days[row[1]] = (count + 1, amount + (row[3] or 0.0),
+                        (checksum + zlib.crc32(json.dumps(row, ensure_ascii=False).encode("utf-8"))) & 0xFFFFFFFF)
+    return {day: (count, round(amount, 2), checksum) for day, (count, amount, checksum) in days.items()}
+
+
+def _flat_row(operation):
+    """An operation's row without its raw data, in `_FLAT_COLUMNS` order."""
+    row = _operation_row(operation)
+    return row[:13] + row[14:]
+
+
+def _reference_row(obj):
+    return obj.id, getattr(obj, "name", None), json.dumps(obj._data, ensure_ascii=False)
+
+
+class MirrorProgress:
+    """
+    Progress of a mirror load or refresh, passed to `on_progress` after each shard.
+
+    Attributes:
+        shards_total (int): Shards to synchronize.
+        shards_done (int): Shards synchronized so far.
+        rows (int): Operations written so far.
+        failed (list[tuple[str, Exception]]): `(shard, error)` of shards that could not be synced.
+        started_at (float): When the run started (monotonic clock).
+    """
+    def __init__(self, shards_total):
+        self.shards_total = shards_total
+        self.shards_done = 0
+        self.rows = 0
+        self.failed = []
+        self.started_at = time.monotonic()
+
+    @property
+    def elapsed(self):
+        """float: Seconds since the run started."""
+        return time.monotonic() - self.started_at
+
+    def __repr__(self):
+        return (f"<MirrorProgress(shards={self.shards_done}/{self.shards_total}, rows={self.rows}, "
+                f"failed={len(self.failed)}, elapsed={self.elapsed:.1f}s)>")
+
+
+class LocalMirror:
+    """
+    On-disk SQLite copy of operations (and, optionally, reference data) kept
+    up to date with few API calls.
+
+    Operations are stored in calendar-month shards. `load` fetches the
+    shards of a period concurrently, skipping the ones already synced, so an
+    interrupted load resumes where it stopped. `refresh` then re-fetches only
+    the shards overlapping a recent sliding window, those marked dirty with
+    `mark_dirty` (e.g., after back-dated edits) and, optionally, the ones not
+    synced for a while. Each shard is replaced atomically, which also drops
+    deleted operations, and its sync time and row count are kept as its
+    watermark.
+
+    Example:
+        mirror = LocalMirror(client, "adesk.db")
+        mirror.load("2023-01-01", "2024-12-31", on_progress=print)
+        mirror.sync_references()
+        ...
+        mirror.refresh(window_days=45) # e.g. hourly
+    """
+    def __init__(self, client, path, page_size=1000, concurrency=4):
+        """
+        Initializes the LocalMirror.
+
+        Args:
+            client (AdeskClient): The client to fetch data with.
+            path (str): Path to the SQLite database (created if missing).
+            page_size (int, optional): Operations requested per page. Defaults to 1000.
+            concurrency (int, optional): Shards fetched at the same time. Defaults to 4.
+        """
+        self.client = client
+        self.path = path
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        if "related_date" not in {row[1] for row in self._conn.execute("PRAGMA table_info(operations)")}:
+            self._conn.execute("ALTER TABLE operations ADD COLUMN related_date TEXT") # Mirrors created before related dates were stored.
+        self._conn.execute("CREATE INDEX IF NOT EXISTS operations_related_date ON operations (related_date)")
+        for column in _INDEXED_FILTERS.values():
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS operations_{column} ON operations ({column}, date)")
+        for kind in REFERENCE_KINDS:
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {kind} (id INTEGER PRIMARY KEY, name TEXT, data TEXT NOT NULL)")
+
+    def load(self, range_start, range_end, resync=False, on_progress=None):
+        """
+        Initial (or extending) load of the operations of a period.
+
+        Args:
+            range_start (str): First day of the period (YYYY-MM-DD).
+            range_end (str): Last day of the period (YYYY-MM-DD).
+            resync (bool, optional): Also fetch shards that are already synced. Defaults to False.
+            on_progress (callable, optional): Called with the `MirrorProgress` after each shard.
+
+        Returns:
+            MirrorProgress: The outcome of the run.
+        """
+        synced = {row[0] for row in self._query("SELECT shard FROM sync_state WHERE synced_at IS NOT NULL AND dirty = 0")}
+        shards = [shard for shard in _month_shards(range_start, range_end) if resync or shard[0] not in synced]
+        return self._sync(shards, on_progress)
+
+    def refresh(self, window_days=31, max_age=None, today=None, on_progress=None):
+        """
+        Incremental refresh: re-fetches the shards overlapping the last `window_days`
+        days, the shards marked dirty and, with `max_age`, the known shards synced
+        longer ago than that.
+
+        Args:
+            window_days (int, optional): Size of the sliding window ending today. Defaults to 31.
+            max_age (float, optional): Also refresh shards older than this many seconds.
+            today (str, optional): End of the window (YYYY-MM-DD). Defaults to the current date.
+            on_progress (callable, optional): Called with the `MirrorProgress` after each shard.
+
+        Returns:
+            MirrorProgress: The outcome of the run.
+        """
+        end = _to_date(today) if today else date.today()
+        shards = {shard[0]: shard for shard in _month_shards(end - timedelta(days=window_days), end)}
+        conditions, args = ["dirty = 1"], []
+        if max_age is not None:
+            conditions.append("synced_at < ?")
+            args.append(time.time() - max_age)
+        for key, first, last in self._query(f"SELECT shard, range_start, range_end FROM sync_state "
+                                            f"WHERE {' OR '.join(conditions)}", args):
+            shards[key] = (key, first, last)
+        return self._sync(sorted(shards.values()), on_progress)
+
+    def mark_dirty(self, range_start, range_end=None):
+        """
+        Marks the shards of a period (e.g., where back-dated changes happened) to be
+        re-fetched by the next `refresh`.
+        """
+        with self._lock:
+            for key, first, last in _month_shards(range_start, range_end or range_start):
+                self._conn.execute("INSERT INTO sync_state (shard, range_start, range_end, dirty) VALUES (?, ?, ?, 1) "
+                                   "ON CONFLICT(shard) DO UPDATE SET dirty = 1", (key, first, last))
+
+    def sync_references(self, kinds=tuple(REFERENCE_KINDS)):
+        """
+        Reloads reference data (projects, contractors, bank accounts, categories).
+
+        Args:
+            kinds (iterable[str], optional): Which reference tables to reload. Defaults to all.
+
+        Returns:
+            dict: Number of objects stored per kind.
+        """
+        counts = {}
+        for kind in kinds:
+            rows = [_reference_row(obj) for obj in REFERENCE_KINDS[kind](self.client) or []]
+            with self._lock:
+                self._conn.execute("BEGIN")
+                self._conn.execute(f"DELETE FROM {kind}")
+                self._conn.executemany(f"INSERT OR REPLACE INTO {kind} (id, name, data) VALUES (?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+            counts[kind] = len(rows)
+        return counts
+
+    def upsert_operations(self, operations):
+        """
+        Writes operations (e.g., received by a webhook) into the mirror, replacing the stored
+        versions. The sync state of their shards is not changed.
+
+        Args:
+            operations (iterable[Operation]): Complete operations.
+        """
+        rows = [_operation_row(operation) for operation in operations]
+        with self._lock:
+            self._conn.executemany(_INSERT_OPERATION, rows)
+
+    def delete_operations(self, ids):
+        """Removes operations from the mirror by ID."""
+        with self._lock:
+            self._conn.executemany("DELETE FROM operations WHERE id = ?", [(id,) for id in ids])
+
+    def upsert_references(self, kind, objects):
+        """
+        Writes reference objects into the mirror, replacing the stored versions.
+
+        Args:
+            kind (str): One of "projects", "contractors", "bank_accounts" or "categories".
+            objects (iterable[BaseModel]): Complete objects of that kind.
+        """
+        if kind not in REFERENCE_KINDS:
+            raise ValueError(f"Unknown reference kind: {kind!r}")
+        rows = [_reference_row(obj) for obj in objects]
+        with self._lock:
+            self._conn.executemany(f"INSERT OR REPLACE INTO {kind} (id, name, data) VALUES (?, ?, ?)", rows)
+
+    def delete_references(self, kind, ids):
+        """Removes reference objects of `kind` from the mirror by ID."""
+        if kind not in REFERENCE_KINDS:
+            raise ValueError(f"Unknown reference kind: {kind!r}")
+        with self._lock:
+            self._conn.executemany(f"DELETE FROM {kind} WHERE id = ?", [(id,) for id in ids])
+
+    def list_all(self, range_str=None, range_start=None, range_end=None, type=None, category=None,
+                 bank_account=None, legal_entity=None, contractor=None, contractor_inn=None,
+                 project=None, business_unit=None, status=None, owner_transfer=None,
+                 taxes=None, date_type=None, start=None, length=None):
+        """
+        Queries the mirrored operations without calling the API. Takes the same filters
+        as `Operations.list_all`; operations are returned newest first.
+
+        Args:
+            range_str (str, optional): Predefined date range: "today", "yesterday", "this_week",
+                                       "this_month", "last_month", "this_quarter", "last_quarter",
+                                       "this_year" or "last_year".
+            range_start (str, optional): Start date for custom range (YYYY-MM-DD).
+            range_end (str, optional): End date for custom range (YYYY-MM-DD).
+            type (str, optional): Filter by type ("income" or "outcome").
+            category (int, optional): Filter by category ID.
+            bank_account (int, optional): Filter by bank account ID.
+            legal_entity (int, optional): Filter by legal entity ID.
+            contractor (int, optional): Filter by contractor ID.
+            contractor_inn (str, optional): Filter by contractor's INN.
+            project (int, optional): Filter by project ID.
+            business_unit (int, optional): Filter by business unit ID.
+            status (str, optional): Filter by status ("planned" or "completed").
+            owner_transfer (bool, optional): Filter by owner transfer status (of the category).
+            taxes (bool, optional): Not available offline; must be None.
+            date_type (str, optional): Type of date to use for filtering ("operation" or "related").
+            start (int, optional): For pagination, the starting record number.
+            length (int, optional): For pagination, the number of records to retrieve.
+
+        Returns:
+            list[Operation]: The matching operations.
+
+        Raises:
+            ValueError: If a filter value cannot be evaluated offline.
+        """
+        from .models import Operation # Imported here, like the client's lazy resources.
+        sql, args = self._select(
+            ("data",), range_str=range_str, range_start=range_start, range_end=range_end, type=type,
+            category=category, bank_account=bank_account, legal_entity=legal_entity, contractor=contractor,
+            contractor_inn=contractor_inn, project=project, business_unit=business_unit, status=status,
+            owner_transfer=owner_transfer, taxes=taxes, date_type=date_type, start=start, length=length)
+        return [Operation(json.loads(data)) for data, in self._query(sql, args)]
+
+    def list_frame(self, **filters):
+        """
+        Same as `list_all`, but returns a pandas DataFrame with one row per operation and
+        the columns id, date, type, amount, description, category_id, bank_account_id,
+        legal_entity_id, contractor_id, project_id, business_unit_id, is_planned,
+        is_transfer and related_date. Requires pandas.
+
+        Returns:
+            pandas.DataFrame: The matching operations.
+        """
+        pandas = _import_pandas()
+        sql, args = self._select(_FLAT_COLUMNS, **filters)
+        return pandas.DataFrame.from_records(self._query(sql, args), columns=_FLAT_COLUMNS)
+
+    def get_operations(self, ids):
+        """
+        Returns the mirrored operations with the given IDs, without calling the API.
+
+        Returns:
+            dict: `{id: Operation}` for the IDs found in the mirror.
+        """
+        from .models import Operation
+        ids = list(ids)
+        found = {}
+        for offset in range(0, len(ids), 500): # Stay below SQLite's limit on parameters.
+            chunk = ids[offset:offset + 500]
+            rows = self._query(f"SELECT id, data FROM operations WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+            found.update((id, Operation(json.loads(data))) for id, data in rows)
+        return found
+
+    def aggregate(self, by=(), period=None, **filters):
+        """
+        Groups the mirrored operations and sums their amounts in SQLite; see `aggregate.aggregate`.
+
+        Args:
+            by (str | iterable[str], optional): Dimensions to group by (e.g., "category", "project").
+            period (str, optional): Also group by "day", "week", "month", "quarter" or "year".
+            **filters: The filters of `list_all` (except pagination).
+
+        Returns:
+            Aggregation: Count, income and outcome per group.
+        """
+        from .aggregate import aggregate
+        return aggregate(self, by, period, **filters)
+
+    def fetch_operations(self, range_start, range_end):
+        """
+        Fetches all operations of a period from the API, page by page (nothing is stored).
+
+        Returns:
+            list[Operation]: The operations of the period.
+        """
+        operations, offset = [], 0
+        while True:
+            page = self.client.operations.list_all(range_start=range_start, range_end=range_end,
+                                                   start=offset, length=self.page_size)
+            operations.extend(page)
+            if len(page) < self.page_size:
+                return operations
+            offset += len(page)
+
+    def daily_summary(self, range_start, range_end):
+        """
+        Per-day aggregates of the mirrored operations of a period, to compare with the API
+        cheaply (see `Reconciler`).
+
+        Returns:
+            dict: `{date: (count, amount sum, checksum)}` for the days that have operations.
+        """
+        rows = self._query(f"SELECT {', '.join(_FLAT_COLUMNS)} FROM operations WHERE date BETWEEN ? AND ?",
+                           (_to_date(range_start).isoformat(), _to_date(range_end).isoformat()))
+        return _summarize(rows)
+
+    def replace_range(self, range_start, range_end, operations):
+        """
+        Atomically replaces the mirrored operations dated within a period (shard watermarks
+        are not changed).
+
+        Args:
+            range_start (str): First day of the period (YYYY-MM-DD).
+            range_end (str): Last day of the period (YYYY-MM-DD).
+            operations (iterable[Operation]): All operations of the period.
+
+        Returns:
+            int: Number of operations written.
+        """
+        rows = [_operation_row(operation) for operation in operations]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM operations WHERE date BETWEEN ? AND ?",
+                                   (_to_date(range_start).isoformat(), _to_date(range_end).isoformat()))
+                self._conn.executemany(_INSERT_OPERATION, rows)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(rows)
+
+    def references(self, kind):
+        """
+        Returns the mirrored objects of a reference kind.
+
+        Returns:
+            dict: Raw API data of each object, by ID.
+        """
+        if kind not in REFERENCE_KINDS:
+            raise ValueError(f"Unknown reference kind: {kind!r}")
+        return {id: json.loads(data) for id, data in self._query(f"SELECT id, data FROM {kind}")}
+
+    def shards(self):
+        """
+        Lists the sync watermarks of all known shards.
+
+        Returns:
+            list[dict]: `shard`, `range_start`, `range_end`, `synced_at`, `rows`, `duration`
+                        and `dirty` of each shard, oldest first.
+        """
+        columns = ("shard", "range_start", "range_end", "synced_at", "rows", "duration", "dirty")
+        rows = self._query(f"SELECT {', '.join(columns)} FROM sync_state ORDER BY shard")
+        return [dict(zip(columns, row)) for row in rows]
+
+    def stats(self):
+        """
+        Summarizes the mirror.
+
+        Returns:
+            dict: Row counts per table, number of shards (synced and dirty), and the time of
+                  the oldest and newest shard sync.
+        """
+        stats = {table: self._query(f"SELECT COUNT(*) FROM {table}")[0][0]
+                 for table in ("operations",) + tuple(REFERENCE_KINDS)}
+        shards, dirty, oldest, newest = self._query(
+            "SELECT COUNT(*), COALESCE(SUM(dirty), 0), MIN(synced_at), MAX(synced_at) FROM sync_state")[0]
+        stats.update(shards=shards, dirty_shards=dirty, oldest_sync=oldest, newest_sync=newest)
+        return stats
+
+    def close(self):
+        """Closes the database."""
+        self._conn.close()
+
+    def _query(self, sql, args=()):
+        with self._lock:
+            return self._conn.execute(sql, args).fetchall()
+
+    def _select(self, columns, start=None, length=None, **filters):
+        where, args, date_column = self._where(**filters)
+        sql = f"SELECT {', '.join(columns)} FROM operations{where} ORDER BY {date_column} DESC, id DESC"
+        if start is not None or length is not None:
+            sql += " LIMIT ? OFFSET ?"
+            args += [-1 if length is None else length, start or 0]
+        return sql, args
+
+    def _where(self, range_str=None, range_start=None, range_end=None, type=None, category=None,
+               bank_account=None, legal_entity=None, contractor=None, contractor_inn=None,
+               project=None, business_unit=None, status=None, owner_transfer=None,
+               taxes=None, date_type=None):
+        """Returns the WHERE clause (or ""), its arguments and the date column for `list_all` filters."""
+        if taxes is not None:
+            raise ValueError("The taxes filter is not available offline.")
+        if date_type not in (None, "operation", "related"):
+            raise ValueError(f"Unknown date_type: {date_type!r}")
+        date_column = "related_date" if date_type == "related" else "date"
+        conditions, args = [], []
+        if range_str is not None:
+            range_start, range_end = _named_range(range_str, date.today())
+        if range_start is not None:
+            conditions.append(f"{date_column} >= ?")
+            args.append(_to_date(range_start).isoformat())
+        if range_end is not None:
+            conditions.append(f"{date_column} <= ?")
+            args.append(_to_date(range_end).isoformat())
+        if type is not None:
+            if type not in _OPERATION_TYPES:
+                raise ValueError(f"Unknown operation type: {type!r}")
+            conditions.append("type = ?")
+            args.append(_OPERATION_TYPES[type])
+        indexed = {"category": category, "bank_account": bank_account, "legal_entity": legal_entity,
+                   "contractor": contractor, "project": project, "business_unit": business_unit}
+        for name, column in _INDEXED_FILTERS.items():
+            if indexed[name] is not None:
+                conditions.append(f"{column} = ?")
+                args.append(indexed[name])
+        if contractor_inn is not None:
+            conditions.append("json_extract(data, '$.contractor.inn') = ?")
+            args.append(str(contractor_inn))
+        if status is not None:
+            if status not in ("planned", "completed"):
+                raise ValueError(f"Unknown status: {status!r}")
+            conditions.append("is_planned = ?")
+            args.append(int(status == "planned"))
+        if owner_transfer is not None:
+            conditions.append("COALESCE(json_extract(data, '$.category.isOwnerTransfer'), 0) = ?")
+            args.append(int(bool(owner_transfer)))
+
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), args, date_column
+
+    def _sync(self, shards, on_progress):
+        progress = MirrorProgress(len(shards))
+        for outcome in run_bulk(self._fetch_shard, shards, concurrency=self.concurrency):
+            if outcome.ok:
+                progress.rows += self._store_shard(outcome.item, *outcome.result)
+            else:
+                progress.failed.append((outcome.item[0], outcome.error))
+            progress.shards_done += 1
+            if on_progress is not None:
+                on_progress(progress)
+        return progress
+
+    def _fetch_shard(self, shard):
+        _, first, last = shard
+        started = time.monotonic()
+        operations = self.fetch_operations(first, last)
+        return operations, time.monotonic() - started
+
+    def _store_shard(self, shard, operations, duration):
+        key, first, last = shard
+        rows = [_operation_row(operation) for operation in operations]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM operations WHERE date BETWEEN ? AND ?", (first, last))
+                self._conn.executemany(_INSERT_OPERATION, rows)
+                self._conn.execute(
+                    "INSERT INTO sync_state (shard, range_start, range_end, synced_at, rows, duration, dirty) "
+                    "VALUES (?, ?, ?, ?, ?, ?, 0) ON CONFLICT(shard) DO UPDATE SET synced_at = excluded.synced_at, "
+                    "rows = excluded.rows, duration = excluded.duration, dirty = 0",
+                    (key, first, last, time.time(), len(rows), duration))
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(rows)
@@ -1,27 +1,7 @@
 # adesk/models/__init__.py
-from .base_model import BaseModel
-from .projects import Project, ProjectCategory, ProjectManager, DealContractor, DealLegalEntity
-from .transactions import TransactionCategory
-from .bank_accounts import BankAccount
-from .commitments import Commitment, Shipment, ShipmentProduct
-from .legal_entities import LegalEntity, VatRate
-from .transfers import Transfer, TransferAccountInfo
-from .operations import (
-    Operation, OperationBankAccount, OperationCategory, 
-    OperationContractor, OperationProject, OperationBusinessUnit
-)
-from .contractors import Contractor
-from .requisites import Requisite
-from .warehouse import (
-    Product, Unit, InitialBatch, CommodityCost, 
-    WarehouseShipmentModel # Renamed from ShipmentModel to avoid potential future conflicts
-)
-from .tags import Tag
-from .webhooks import Webhook
-from .custom_reports import (
-    CustomReportGroup, CustomReportEntry, CustomReportValue, CustomReportValueList,
-    CustomReportDebtEntry, CashflowCategoryInfo, IntegrationInfo, CustomReportDebtEntryDetail
-)
+# Models are imported lazily on first access (see adesk/_lazy.py): resource modules
+# only pay for the model modules they actually use.
+from .._lazy import lazy_attributes
 
 __all__ = [
     'BaseModel',
@@ -54,3 +34,28 @@ __all__ = [
     'CustomReportGroup', 'CustomReportEntry', 'CustomReportValue', 'CustomReportValueList',
     'CustomReportDebtEntry', 'CashflowCategoryInfo', 'IntegrationInfo', 'CustomReportDebtEntryDetail',
 ]
+
+_LAZY_ATTRIBUTES = {
+    'BaseModel': '.base_model',
+    'Project': '.projects', 'ProjectCategory': '.projects', 'ProjectManager': '.projects',
+    'DealContractor': '.projects', 'DealLegalEntity': '.projects',
+    'TransactionCategory': '.transactions',
+    'BankAccount': '.bank_accounts',
+    'Commitment': '.commitments', 'Shipment': '.commitments', 'ShipmentProduct': '.commitments',
+    'LegalEntity': '.legal_entities', 'VatRate': '.legal_entities',
+    'Transfer': '.transfers', 'TransferAccountInfo': '.transfers',
+    'Operation': '.operations', 'OperationBankAccount': '.operations', 'OperationCategory': '.operations',
+    'OperationContractor': '.operations', 'OperationProject': '.operations', 'OperationBusinessUnit': '.operations',
+    'Contractor': '.contractors',
+    'Requisite': '.requisites',
+    'Product': '.warehouse', 'Unit': '.warehouse', 'InitialBatch': '.warehouse',
+    'CommodityCost': '.warehouse', 'WarehouseShipmentModel': '.warehouse',
+    'Tag': '.tags',
+    'Webhook': '.webhooks',
+    'CustomReportGroup': '.custom_reports', 'CustomReportEntry': '.custom_reports',
+    'CustomReportValue': '.custom_reports', 'CustomReportValueList': '.custom_reports',
+    'CustomReportDebtEntry': '.custom_reports', 'CashflowCategoryInfo': '.custom_reports',
+    'IntegrationInfo': '.custom_reports', 'CustomReportDebtEntryDetail': '.custom_reports',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
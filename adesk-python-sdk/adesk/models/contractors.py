@@ -14,11 +14,14 @@ class Contractor(BaseModel):
         data = data or {}
         self.id = data.get('id')
         self.name = data.get('name')
+        self.inn = data.get('inn')
         self.contact_person = data.get('contactPerson')
         self.phone_number = data.get('phoneNumber')
         self.email = data.get('email')
         self.balance = data.get('balance') # Only in list view
         self.description = data.get('description') # Might be in detailed view
+        self.commitments = None # list[Commitment], set by `prefetch`
+        self.requisites = None # list[Requisite], set by `prefetch`
 
         if self.balance is not None:
             try:
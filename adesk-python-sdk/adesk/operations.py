@@ -1,4 +1,53 @@
-from adesk_python_sdk.adesk.models import Operation
+from adesk_python_sdk.adesk.models import Operation, BaseModel
+from adesk_python_sdk.adesk.bulk import run_bulk
+from adesk_python_sdk.adesk.batch_get import MissCache, fetch_many
+
+# Arguments of `Operations.create`, read from row objects by `bulk_create`.
+_CREATE_FIELDS = (
+    "date", "type", "amount", "bank_account", "apply_import_rules", "category", "project",
+    "business_unit", "contractor", "description", "related_date", "is_periodic", "period",
+    "repetition_end_date", "is_commitment", "is_planned", "is_splitted", "parts", "tags",
+)
+# Arguments `Operations.update` requires even when they do not change.
+_UPDATE_REQUIRED_FIELDS = ("date", "bank_account", "amount")
+# `Operation.type` as returned by the API, mapped to the values `create` expects.
+_OPERATION_TYPES = {1: "income", 2: "outcome"}
+
+
+def _row_kwargs(row, fields):
+    """
+    Turns a row into keyword arguments for `Operations.create`/`update`.
+
+    Dicts are used as is. For other objects (e.g., `Operation` instances or
+    named tuples) the attributes named in `fields` are read; nested models are
+    replaced by their IDs, tag lists by comma-separated IDs and numeric
+    operation types by "income"/"outcome". The date is taken from `date_iso`
+    when the object has one, as YYYY-MM-DD.
+    """
+    if isinstance(row, dict):
+        return dict(row)
+    kwargs = {}
+    for name in fields:
+        value = getattr(row, name, None)
+        if value is None:
+            continue
+        if isinstance(value, BaseModel):
+            value = getattr(value, "id", None)
+        elif name == "tags" and isinstance(value, (list, tuple)):
+            value = ",".join(str(getattr(tag, "id", tag)) for tag in value)
+        elif name == "type":
+            value = _OPERATION_TYPES.get(value, value)
+        kwargs[name] = value
+    date_iso = getattr(row, "date_iso", None) if "date" in fields else None
+    if date_iso:
+        kwargs["date"] = date_iso[:10] # YYYY-MM-DD; `date` may be DD.MM.YYYY
+    return kwargs
+
+
+def _required_update_fields(operation):
+    """Reads the arguments `Operations.update` always needs from a known `Operation`."""
+    return _row_kwargs(operation, _UPDATE_REQUIRED_FIELDS)
+
 
 class Operations:
     """
@@ -13,6 +62,7 @@ class Operations:
             client (AdeskClient): The AdeskClient instance to use for API calls.
         """
         self.client = client
+        self._misses = MissCache()
 
     def create(self, date, type, amount, bank_account, apply_import_rules=None, category=None, 
                project=None, business_unit=None, contractor=None, description=None, 
@@ -90,6 +140,110 @@ class Operations:
         op_data = response_data.get("transaction") if response_data else None
         return Operation(op_data) if op_data else None
 
+    def bulk_create(self, rows, concurrency=4, on_progress=None):
+        """
+        Creates many operations concurrently, e.g. when importing a bank statement.
+        Each row is sent as a separate `POST transaction` (see `create`) from a bounded
+        pool of worker threads, under the client's rate limit if one is set.
+
+        Rows that fail (validation or API errors) do not stop the import: their
+        exception is reported and the other rows are still created.
+
+        Args:
+            rows (iterable): Row dicts with `create` keyword arguments
+                             (e.g., `{"date": "2024-01-15", "type": "income", "amount": 100,
+                             "bank_account": 1}`), or objects with attributes of the same names
+                             (such as `Operation` instances). May be a generator.
+            concurrency (int, optional): Number of requests in flight. Defaults to 4.
+            on_progress (callable, optional): Called with each `BulkResult` as it is yielded.
+
+        Yields:
+            BulkResult: One per row, in input order, with the created `Operation` in `result`
+                        or the raised exception in `error`.
+
+        Example:
+            failed = [r for r in client.operations.bulk_create(rows, concurrency=8) if not r.ok]
+        """
+        return run_bulk(lambda row: self.create(**_row_kwargs(row, _CREATE_FIELDS)), rows,
+                        concurrency=concurrency, on_result=on_progress)
+
+    def bulk_update(self, changes, concurrency=4, cache=None, periodic_edit_type=None, on_progress=None):
+        """
+        Updates many operations concurrently (e.g., to recategorize them).
+        Each item is sent as a separate `POST transaction/<id>` (see `update`).
+
+        `update` requires `date`, `bank_account` and `amount` on every call. When
+        an item's changes leave them out, they are taken from the operation's copy
+        in `cache` (e.g., built from `list_all`), or fetched once with `get` and
+        added to `cache` when it is not there.
+
+        Args:
+            changes (iterable): `(transaction_id, changes)` pairs, where `changes` is a dict of
+                                `update` keyword arguments (e.g., `(42, {"category": 7})`).
+                                May be a generator.
+            concurrency (int, optional): Number of requests in flight. Defaults to 4.
+            cache (dict, optional): Known operations keyed by ID (`{id: Operation}`). Operations
+                                    fetched to fill missing fields are stored in it.
+            periodic_edit_type (str, optional): Default "this" or "this-and-following" for
+                                                periodic transactions; an item's own
+                                                `periodic_edit_type` takes precedence.
+            on_progress (callable, optional): Called with each `BulkResult` as it is yielded.
+
+        Yields:
+            BulkResult: One per item, in input order, with the updated `Operation` in `result`
+                        or the raised exception in `error`.
+
+        Example:
+            cache = {op.id: op for op in client.operations.list_all(category=old_category)}
+            results = client.operations.bulk_update(((op_id, {"category": new_category}) for op_id in cache),
+                                                    cache=cache)
+        """
+        cache = {} if cache is None else cache
+
+        def update(item):
+            transaction_id, item_changes = item
+            kwargs = dict(item_changes)
+            if any(kwargs.get(name) is None for name in _UPDATE_REQUIRED_FIELDS):
+                operation = cache.get(transaction_id)
+                if operation is None:
+                    operation = self.get(transaction_id)
+                    if operation is None:
+                        raise ValueError(f"Operation {transaction_id} not found; cannot fill required fields.")
+                    cache[transaction_id] = operation
+                for name, value in _required_update_fields(operation).items():
+                    if kwargs.get(name) is None:
+                        kwargs[name] = value
+            if periodic_edit_type is not None:
+                kwargs.setdefault("periodic_edit_type", periodic_edit_type)
+            return self.update(transaction_id, **kwargs)
+
+        return run_bulk(update, changes, concurrency=concurrency, on_result=on_progress)
+
+    def bulk_delete(self, transaction_ids, concurrency=4, periodic_edit_type=None, on_progress=None):
+        """
+        Deletes many operations concurrently.
+        Each item is sent as a separate `POST transaction/<id>/remove` (see `delete`).
+
+        Args:
+            transaction_ids (iterable): IDs of the transactions to delete, or
+                                        `(transaction_id, options)` pairs where `options` may
+                                        hold a `periodic_edit_type`. May be a generator.
+            concurrency (int, optional): Number of requests in flight. Defaults to 4.
+            periodic_edit_type (str, optional): Default "this" or "this-and-following" for
+                                                periodic transactions.
+            on_progress (callable, optional): Called with each `BulkResult` as it is yielded.
+
+        Yields:
+            BulkResult: One per item, in input order, with the API response in `result`
+                        or the raised exception in `error`.
+        """
+        def delete(item):
+            transaction_id, options = item if isinstance(item, tuple) else (item, {})
+            return self.delete(transaction_id,
+                               periodic_edit_type=(options or {}).get("periodic_edit_type", periodic_edit_type))
+
+        return run_bulk(delete, transaction_ids, concurrency=concurrency, on_result=on_progress)
+
     def update(self, transaction_id, date, bank_account, amount, category=None, project=None, 
                business_unit=None, contractor=None, description=None, related_date=None, 
                is_periodic=None, period=None, repetition_end_date=None, is_commitment=None, 
@@ -173,10 +327,8 @@ class Operations:
         Args:
             transaction_id (int): ID of the transaction to delete. (Required)
             periodic_edit_type (str, optional): For periodic transactions, "this" or 
-                                                "this-and-following".
-                                                Note: This parameter is typically a query parameter
-                                                in Adesk API, but client.post sends it in the body
-                                                if provided. Behavior may vary based on API version/setup.
+                                                "this-and-following". Sent in the request body,
+                                                like for `update`.
 
         Returns:
             dict: The response from the API, typically confirming success or failure.
@@ -185,13 +337,8 @@ class Operations:
             raise ValueError("Required parameter missing: transaction_id.")
         
         data = {}
-        # Based on the task description, periodic_edit_type is not part of the POST body for delete.
-        # If it were a query parameter, client.post would need modification or a different approach.
-        # For now, following the prompt's decision to omit it from the body.
-        # However, if the API expects it in body for this specific call, it can be added here.
-        # Example if it were a body parameter:
-        # if periodic_edit_type is not None:
-        #    data["periodic_edit_type"] = periodic_edit_type
+        if periodic_edit_type is not None: # 'this' or 'this-and-following'
+            data["periodic_edit_type"] = periodic_edit_type
 
         return self.client.post(f"transaction/{transaction_id}/remove", data=data)
 
@@ -227,6 +374,15 @@ class Operations:
         op_data = response_data.get("transaction") if response_data else None
         return Operation(op_data) if op_data else None
 
+    def get_many(self, transaction_ids, mirror=None, cache=None, concurrency=4):
+        """
+        Retrieves many operations as `{id: Operation}`: from `cache` and `mirror` first, then
+        with concurrent `get` calls. See `batch_get.fetch_many`.
+        """
+        lookups = [mirror.get_operations] if mirror is not None else []
+        return fetch_many(transaction_ids, self.get, lookups=lookups, cache=cache, misses=self._misses,
+                          concurrency=concurrency)
+
     def list_all(self, range_str=None, range_start=None, range_end=None, type=None, category=None, 
                  bank_account=None, legal_entity=None, contractor=None, contractor_inn=None, 
                  project=None, business_unit=None, status=None, owner_transfer=None, 
@@ -297,3 +453,24 @@ class Operations:
         response_data = self.client.get("transactions", params=params)
         operations_data = response_data.get("transactions", []) if response_data else []
         return Operation.from_list(operations_data)
+
+    def iter_all(self, page_size=1000, **filters):
+        """
+        Iterates over all operations matching the filters, fetching them page by
+        page (see `list_all`, which returns a single, possibly truncated, page).
+
+        Args:
+            page_size (int, optional): Operations requested per page. Defaults to 1000.
+            **filters: Filters accepted by `list_all` (e.g., `range_start`, `bank_account`).
+
+        Yields:
+            Operation: The matching operations.
+        """
+        offset = 0
+        while True:
+            page = self.list_all(start=offset, length=page_size, **filters)
+            for operation in page:
+                yield operation
+            if len(page) < page_size:
+                return
+            offset += len(page)
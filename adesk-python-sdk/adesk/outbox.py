@@ -0,0 +1,399 @@
+# adesk/outbox.py
+import json
+import sqlite3
+import threading
+import time
+
+from .bulk import run_bulk
+from .exceptions import AdeskAPIError, AdeskOutcomeUnknownError, AdeskRateLimitError, AdeskServerError
+from .idempotency import IdempotentCreator, SQLiteIdempotencyStore
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+# Supported actions by target, and the payload field identifying the object they change
+# (entries on the same object are sent in order, never concurrently).
+_TARGETS = {
+    "operations": ({"create", "update", "delete"}, "transaction_id"),
+    "transfers": ({"create"}, None),
+    "commitments": ({"create", "update", "delete"}, "commitment_id"),
+    "custom_report_values": ({"create", "update", "remove"}, None),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    target TEXT NOT NULL,
+    action TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, id);
+"""
+
+
+class OutboxEntry:
+    """
+    A mutation recorded in the outbox.
+
+    Attributes:
+        id (int): Position of the entry in the outbox.
+        target (str): "operations", "transfers", "commitments" or "custom_report_values".
+        action (str): "create", "update", "delete" (or "remove" for custom report values).
+        payload: The arguments of the call (keyword arguments, or the list of values/IDs).
+        status (str): "pending", "done" or "failed".
+        attempts (int): Number of failed attempts so far.
+        created_at (float): When the entry was recorded (Unix time).
+        next_attempt_at (float): When the entry is due to be sent (Unix time).
+        last_error (str): The error of the last failed attempt.
+        result: The API data returned for the entry once it is done.
+    """
+    def __init__(self, row):
+        (self.id, self.target, self.action, payload, self.status, self.attempts,
+         self.created_at, self.next_attempt_at, self.last_error, result) = row
+        self.payload = json.loads(payload)
+        self.result = json.loads(result) if result is not None else None
+
+    def __repr__(self):
+        return f"<OutboxEntry(id={self.id}, {self.target}.{self.action}, status={self.status}, attempts={self.attempts})>"
+
+
+class _OutboxResource:
+    """Records calls such as `outbox.operations.create(...)` instead of sending them."""
+    def __init__(self, outbox, target):
+        self._outbox = outbox
+        self._target = target
+
+    def __getattr__(self, action):
+        if action not in _TARGETS[self._target][0]:
+            raise AttributeError(f"The outbox does not support {self._target}.{action}")
+        return lambda *args, **kwargs: self._outbox.enqueue(self._target, action, *args, **kwargs)
+
+
+def _is_retryable(error):
+    if isinstance(error, AdeskOutcomeUnknownError): # may have been applied; retrying could duplicate it
+        return False
+    return error.status_code is None or isinstance(error, (AdeskServerError, AdeskRateLimitError))
+
+
+def _to_data(result):
+    if isinstance(result, list):
+        return [_to_data(item) for item in result]
+    return getattr(result, "_data", result)
+
+
+class Outbox:
+    """
+    Durable write-behind queue for Adesk mutations.
+
+    `create`/`update`/`delete` calls for operations, transfers, commitments and
+    custom report values are appended to a local SQLite journal and return at
+    once with the entry ID; a background thread sends them in the order they
+    were recorded. Entries are sent in batches (consecutive custom report
+    value writes are merged into one request), concurrently when they touch
+    different objects, under the client's rate limit. Failures caused by the
+    network, 5xx or 429 responses are retried with exponential backoff; other
+    errors, and entries out of attempts, are marked failed and can be
+    inspected and retried. Creates of operations, transfers and commitments go
+    through `IdempotentCreator`, so retrying them does not duplicate objects;
+    a create whose outcome cannot be verified (a transfer that failed with a
+    network error or 5xx) is marked failed at once, for manual review.
+
+    Example:
+        outbox = Outbox(client, "adesk-outbox.db").start()
+        outbox.operations.create(date="2024-01-15", type="income", amount=100, bank_account=1)
+        ...
+        print(outbox.lag(), outbox.stats())
+        outbox.stop()
+    """
+    def __init__(self, client, path, batch_size=50, concurrency=4, max_attempts=8, backoff=1.0,
+                 poll_interval=0.5):
+        """
+        Initializes the Outbox.
+
+        Args:
+            client (AdeskClient): The client used to send the mutations.
+            path (str): Path to the SQLite journal (created if missing).
+            batch_size (int, optional): Maximum entries sent per batch. Defaults to 50.
+            concurrency (int, optional): Requests in flight while sending a batch. Defaults to 4.
+            max_attempts (int, optional): Attempts before an entry is marked failed. Defaults to 8.
+            backoff (float, optional): Seconds before the first retry; doubled after each one.
+                                       Defaults to 1.
+            poll_interval (float, optional): Seconds the background thread sleeps when there is
+                                             nothing to send. Defaults to 0.5.
+        """
+        self.client = client
+        self.path = path
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._creator = IdempotentCreator(client, SQLiteIdempotencyStore(path), retries=0)
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        for target in _TARGETS:
+            setattr(self, target, _OutboxResource(self, target))
+
+    def enqueue(self, target, action, payload=None, **kwargs):
+        """
+        Durably records a mutation to be sent in the background.
+
+        Args:
+            target (str): "operations", "transfers", "commitments" or "custom_report_values".
+            action (str): The resource method to call ("create", "update", "delete", "remove").
+            payload (list, optional): For custom report values, the values (or IDs to remove).
+            **kwargs: For the other targets, the keyword arguments of the resource method
+                      (e.g., `transaction_id=5, category=7` for `operations.update`).
+
+        Returns:
+            int: The ID of the outbox entry.
+
+        Raises:
+            ValueError: If the target or action is not supported.
+        """
+        if target not in _TARGETS or action not in _TARGETS[target][0]:
+            raise ValueError(f"Unsupported outbox mutation: {target}.{action}")
+        payload = list(payload or []) if target == "custom_report_values" else kwargs
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO outbox (target, action, payload, status, created_at, next_attempt_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", (target, action, json.dumps(payload), PENDING, now, now))
+        self._wakeup.set()
+        return cursor.lastrowid
+
+    def start(self):
+        """
+        Starts sending entries from a background thread.
+
+        Returns:
+            Outbox: The outbox itself.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="adesk-outbox", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """Stops the background thread once the batch in progress is sent."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def close(self):
+        """Stops the background thread and closes the journal."""
+        self.stop()
+        self._creator.store.close()
+        self._conn.close()
+
+    def drain(self):
+        """
+        Sends due entries in the calling thread until none is left.
+
+        Returns:
+            int: The number of entries processed (done, failed or rescheduled).
+        """
+        total = 0
+        while True:
+            processed = self.send_batch()
+            if not processed:
+                return total
+            total += processed
+
+    def send_batch(self):
+        """
+        Sends one batch of due entries.
+
+        Returns:
+            int: The number of entries processed.
+        """
+        jobs = self._plan(self._due_entries())
+        processed = 0
+        for outcome in run_bulk(self._send_job, jobs, concurrency=self.concurrency):
+            for entry, result, error in outcome.result:
+                self._settle(entry, result, error)
+                processed += 1
+        return processed
+
+    # Inspection
+
+    def stats(self):
+        """
+        Counts entries by status.
+
+        Returns:
+            dict: E.g., `{"pending": 12, "done": 3400, "failed": 1}`.
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        counts = {PENDING: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def lag(self):
+        """
+        Age of the oldest pending entry.
+
+        Returns:
+            float: Seconds since the oldest unsent entry was recorded (0 if all are sent).
+        """
+        with self._lock:
+            oldest = self._conn.execute("SELECT MIN(created_at) FROM outbox WHERE status = ?", (PENDING,)).fetchone()[0]
+        return max(0.0, time.time() - oldest) if oldest is not None else 0.0
+
+    def stuck(self, min_attempts=3):
+        """
+        Lists entries that need attention: failed ones, and pending ones that already
+        failed at least `min_attempts` times.
+
+        Returns:
+            list[OutboxEntry]: The entries, oldest first.
+        """
+        return self._select("WHERE status = ? OR (status = ? AND attempts >= ?) ORDER BY id",
+                            (FAILED, PENDING, min_attempts))
+
+    def entries(self, status=None, limit=100):
+        """
+        Lists entries, oldest first.
+
+        Args:
+            status (str, optional): Only entries with this status.
+            limit (int, optional): Maximum number of entries. Defaults to 100.
+
+        Returns:
+            list[OutboxEntry]: The entries.
+        """
+        if status is None:
+            return self._select("ORDER BY id LIMIT ?", (limit,))
+        return self._select("WHERE status = ? ORDER BY id LIMIT ?", (status, limit))
+
+    def retry(self, entry_id):
+        """Puts a failed entry back in the queue, with a fresh attempt count."""
+        with self._lock:
+            self._conn.execute("UPDATE outbox SET status = ?, attempts = 0, next_attempt_at = ? WHERE id = ?",
+                               (PENDING, time.time(), entry_id))
+        self._wakeup.set()
+
+    def purge(self, older_than=0):
+        """Deletes done entries recorded more than `older_than` seconds ago."""
+        with self._lock:
+            self._conn.execute("DELETE FROM outbox WHERE status = ? AND created_at < ?",
+                               (DONE, time.time() - older_than))
+
+    # Internals
+
+    def _select(self, where, args):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, target, action, payload, status, attempts, created_at, next_attempt_at, last_error, "
+                "result FROM outbox " + where, args).fetchall()
+        return [OutboxEntry(row) for row in rows]
+
+    def _due_entries(self):
+        """Pending entries in order; an entry waiting for a retry blocks later ones on the same object."""
+        now = time.time()
+        blocked, due = set(), []
+        for entry in self._select("WHERE status = ? ORDER BY id LIMIT ?", (PENDING, self.batch_size * 4)):
+            object_field = _TARGETS[entry.target][1]
+            object_id = entry.payload.get(object_field) if object_field else None
+            object_key = (entry.target, object_id) if object_id is not None else None # creates are independent
+            if entry.target == "custom_report_values":
+                object_key = (entry.target,) # values are written strictly in order
+            if object_key is not None and object_key in blocked:
+                continue
+            if entry.next_attempt_at > now:
+                if object_key is not None:
+                    blocked.add(object_key)
+                continue
+            due.append(entry)
+            if object_key is not None and entry.target != "custom_report_values":
+                blocked.add(object_key)
+            if len(due) >= self.batch_size:
+                break
+        return due
+
+    @staticmethod
+    def _plan(entries):
+        """
+        Groups due entries into jobs run concurrently. Custom report value writes form a
+        single job, in which consecutive entries with the same action are merged.
+        """
+        jobs, values_job = [], []
+        for entry in entries:
+            if entry.target != "custom_report_values":
+                jobs.append([[entry]])
+            elif values_job and values_job[-1][0].action == entry.action:
+                values_job[-1].append(entry)
+            else:
+                values_job.append([entry])
+        if values_job:
+            jobs.insert(0, values_job)
+        return jobs
+
+    def _send_job(self, job):
+        outcomes = []
+        for group in job:
+            try:
+                results = self._send_group(group)
+            except Exception as e:
+                outcomes.extend((entry, None, e) for entry in group)
+            else:
+                outcomes.extend((entry, result, None) for entry, result in zip(group, results))
+        return outcomes
+
+    def _send_group(self, group):
+        first = group[0]
+        if first.target == "custom_report_values":
+            resource = self.client.v2.custom_report_values
+            payload = [item for entry in group for item in entry.payload]
+            results = getattr(resource, first.action)(payload)
+            if first.action == "remove":
+                return [results] * len(group)
+            # The API returns the written values in request order: hand each entry its share.
+            shares, start = [], 0
+            for entry in group:
+                shares.append(results[start:start + len(entry.payload)])
+                start += len(entry.payload)
+            return shares
+        if first.action == "create":
+            create = getattr(self._creator, first.target[:-1]) # operation, transfer, commitment
+            return [create(key=f"outbox-{first.id}", **first.payload)]
+        return [getattr(getattr(self.client, first.target), first.action)(**first.payload)]
+
+    def _settle(self, entry, result, error):
+        with self._lock:
+            if error is None:
+                self._conn.execute("UPDATE outbox SET status = ?, result = ?, last_error = NULL WHERE id = ?",
+                                   (DONE, json.dumps(_to_data(result)), entry.id))
+                return
+            attempts = entry.attempts + 1
+            retryable = isinstance(error, AdeskAPIError) and _is_retryable(error)
+            status = PENDING if retryable and attempts < self.max_attempts else FAILED
+            next_attempt_at = time.time() + self.backoff * 2 ** (attempts - 1)
+            self._conn.execute("UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? "
+                               "WHERE id = ?", (status, attempts, next_attempt_at, f"{type(error).__name__}: {error}",
+                                                entry.id))
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                processed = self.send_batch()
+            except Exception: # e.g. a locked database; try again on the next tick.
+                processed = 0
+            if not processed:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
@@ -1,4 +1,5 @@
 from adesk_python_sdk.adesk.models import Project, ProjectCategory as ProjectCategoryModel
+from adesk_python_sdk.adesk.batch_get import MissCache, fetch_many
 
 class Projects:
     """
@@ -13,6 +14,7 @@ class Projects:
             client (AdeskClient): The AdeskClient instance to use for API calls.
         """
         self.client = client
+        self._misses = MissCache()
 
     def list(self, category=None, managers=None, status=None, start=None, length=None, q=None, reduced=None, sorting=None):
         """
@@ -56,6 +58,17 @@ class Projects:
         projects_data = response.get("projects", []) if response else []
         return Project.from_list(projects_data)
 
+    def get_many(self, project_ids, cache=None):
+        """
+        Retrieves many projects as `{id: Project}`, from `cache` and the projects list in
+        `client.registry` (the API cannot get a single project). See `batch_get.fetch_many`.
+        """
+        registry = self.client.registry
+        return fetch_many(project_ids, lambda project_id: None,
+                          lookups=[lambda ids: registry.cached("projects", ids)],
+                          list_all=lambda: registry.all("projects"), cache=cache,
+                          misses=self._misses, list_threshold=1)
+
     def create(self, name, description=None, is_archived=None, plan_income=None, plan_outcome=None, 
                category=None, manager=None, deal_contractor=None, deal_legal_entity=None, is_deal=None):
         """
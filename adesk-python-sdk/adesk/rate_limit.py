@@ -0,0 +1,69 @@
+# adesk/rate_limit.py
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how many requests are sent per second.
+
+    Shared by all threads (and coroutines) using a client: each request reserves
+    the next free slot under a short lock and then waits outside of it, so
+    waiting callers never block each other's bookkeeping.
+
+    Example:
+        client = AdeskClient(api_token, rate_limit=5) # at most 5 requests per second
+    """
+    def __init__(self, rate, burst=None, clock=time.monotonic):
+        """
+        Initializes the RateLimiter.
+
+        Args:
+            rate (float): Allowed requests per second.
+            burst (int, optional): Requests that may be sent back to back after an idle
+                                   period. Defaults to 1 (evenly spaced requests).
+            clock (callable, optional): Monotonic clock returning seconds. Defaults to
+                                        `time.monotonic`.
+
+        Raises:
+            ValueError: If `rate` or `burst` is not positive.
+        """
+        if not rate or rate <= 0:
+            raise ValueError("rate must be a positive number of requests per second.")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1.")
+        self.rate = float(rate)
+        self.burst = burst or 1
+        self._clock = clock
+        self._interval = 1.0 / self.rate
+        # Theoretical arrival time of the next request (GCRA): requests may run up to
+        # `burst - 1` intervals ahead of it.
+        self._next_free = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Reserves the next request slot without waiting.
+
+        Returns:
+            float: Seconds to wait before sending the request (0 if it can go now).
+        """
+        with self._lock:
+            now = self._clock()
+            slot = max(self._next_free, now)
+            self._next_free = slot + self._interval
+            return max(0.0, slot - (self.burst - 1) * self._interval - now)
+
+    def acquire(self):
+        """Blocks the calling thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        """Waits (without blocking the event loop) until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            import asyncio
+
+            await asyncio.sleep(delay)
@@ -0,0 +1,182 @@
+# adesk/reconcile.py
+import json
+import threading
+import time
+import zlib
+from datetime import date, timedelta
+
+from .mirror import REFERENCE_KINDS, _flat_row, _summarize, _to_date
+
+
+class ReconcileReport:
+    """
+    Outcome of a `Reconciler` check.
+
+    Attributes:
+        range_start (str): First day checked.
+        range_end (str): Last day checked.
+        days_checked (int): Days with operations locally or in the API.
+        mismatched (list[str]): Days whose count, amount sum or checksum differed, and were re-synced.
+        rows_written (int): Operations written while re-syncing those days.
+        references (dict): `{kind: (upserted, deleted)}` for the reference kinds checked.
+    """
+    def __init__(self, range_start=None, range_end=None):
+        self.range_start = range_start
+        self.range_end = range_end
+        self.days_checked = 0
+        self.mismatched = []
+        self.rows_written = 0
+        self.references = {}
+
+    def __repr__(self):
+        return (f"<ReconcileReport({self.range_start}..{self.range_end}, days_checked={self.days_checked}, "
+                f"mismatched={len(self.mismatched)}, rows_written={self.rows_written})>")
+
+
+def _runs(days):
+    """Groups sorted ISO dates into runs of consecutive days: `[(first, last), ...]`."""
+    runs = []
+    for day in days:
+        if runs and _to_date(runs[-1][1]) + timedelta(days=1) == _to_date(day):
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+def _checksum(data):
+    return zlib.crc32(json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+
+
+class Reconciler:
+    """
+    Detects when a webhook-fed `LocalMirror` may have diverged from Adesk and
+    re-syncs only what differs.
+
+    Gaps are noticed in two ways: no webhook was seen for `max_silence`
+    seconds (`heartbeat` is registered as a webhook handler), or an outage
+    was reported with `record_outage` (e.g., on receiver start-up). `run`
+    then checks the last `window_days` days; `check` can also be called for
+    any period.
+
+    A check lists the period's operations once and reduces them to per-day
+    aggregates (count, amount sum and a checksum of the mirrored fields),
+    comparing them with the same aggregates computed locally. Only the days
+    that differ are rewritten in the mirror, so a check of a consistent
+    mirror writes nothing. Reference data (projects, contractors, ...) is
+    compared object by object with the list endpoints.
+
+    Example:
+        reconciler = Reconciler(client, mirror, window_days=14, max_silence=3600)
+        receiver.on("*", reconciler.heartbeat)
+        reconciler.record_outage()  # the receiver was down until now
+        ...
+        reconciler.run()            # e.g. every 10 minutes
+    """
+    def __init__(self, client, mirror, window_days=7, max_silence=3600.0, clock=time.time):
+        """
+        Initializes the Reconciler.
+
+        Args:
+            client (AdeskClient): The client to list objects with.
+            mirror (LocalMirror): The mirror to verify.
+            window_days (int, optional): Days back from today checked after a gap. Defaults to 7.
+            max_silence (float, optional): Seconds without webhooks treated as a gap. Defaults to 3600.
+            clock (callable, optional): Time source. Defaults to `time.time`.
+        """
+        self.client = client
+        self.mirror = mirror
+        self.window_days = window_days
+        self.max_silence = max_silence
+        self.clock = clock
+        self.last_seen = clock()
+        self._outage = False
+        self._lock = threading.Lock()
+
+    def heartbeat(self, event=None):
+        """Records that a webhook was received; usable as a `WebhookReceiver` handler."""
+        self.last_seen = self.clock()
+
+    def record_outage(self):
+        """Reports that webhooks may have been missed (e.g., the receiver was down)."""
+        self._outage = True
+
+    @property
+    def gap_detected(self):
+        """bool: Whether an outage was reported or no webhook was seen for `max_silence` seconds."""
+        return self._outage or self.clock() - self.last_seen > self.max_silence
+
+    def run(self, today=None, force=False, references=tuple(REFERENCE_KINDS)):
+        """
+        Checks the last `window_days` days (and, optionally, reference data) if a gap
+        was detected.
+
+        Args:
+            today (str, optional): Last day of the window (YYYY-MM-DD). Defaults to the current date.
+            force (bool, optional): Check even if no gap was detected. Defaults to False.
+            references (iterable[str], optional): Reference kinds to check as well. Defaults to all.
+
+        Returns:
+            ReconcileReport | None: The report, or None if there was nothing to check.
+        """
+        with self._lock:
+            if not (force or self.gap_detected):
+                return None
+            started = self.clock()
+            end = _to_date(today) if today else date.today()
+            report = self.check((end - timedelta(days=self.window_days)).isoformat(), end.isoformat())
+            if references:
+                report.references = self.check_references(references).references
+            # Only now is the gap closed: if a check raises, the next run checks again.
+            self._outage = False
+            self.last_seen = max(self.last_seen, started)
+            return report
+
+    def check(self, range_start, range_end):
+        """
+        Compares per-day aggregates of a period with the API and re-syncs the days that differ.
+
+        Args:
+            range_start (str): First day of the period (YYYY-MM-DD).
+            range_end (str): Last day of the period (YYYY-MM-DD).
+
+        Returns:
+            ReconcileReport: What was checked and re-synced.
+        """
+        report = ReconcileReport(range_start, range_end)
+        rows, by_day = [], {}
+        for operation in self.mirror.fetch_operations(range_start, range_end):
+            rows.append(_flat_row(operation))
+            by_day.setdefault(rows[-1][1], []).append(operation)
+        remote = _summarize(rows)
+        local = self.mirror.daily_summary(range_start, range_end)
+
+        days = sorted(set(remote) | set(local))
+        report.days_checked = len(days)
+        report.mismatched = [day for day in days if remote.get(day) != local.get(day)]
+        for first, last in _runs(report.mismatched):
+            operations = [operation for day in sorted(by_day) if first <= day <= last for operation in by_day[day]]
+            report.rows_written += self.mirror.replace_range(first, last, operations)
+        return report
+
+    def check_references(self, kinds=tuple(REFERENCE_KINDS)):
+        """
+        Compares reference objects with the list endpoints; upserts the changed and new ones
+        and deletes the ones gone.
+
+        Returns:
+            ReconcileReport: With `references` set to `{kind: (upserted, deleted)}`.
+        """
+        report = ReconcileReport()
+        for kind in kinds:
+            remote = {obj.id: obj for obj in REFERENCE_KINDS[kind](self.client) or []}
+            local = self.mirror.references(kind)
+            changed = [obj for id, obj in remote.items()
+                       if id not in local or _checksum(local[id]) != _checksum(obj._data)]
+            gone = [id for id in local if id not in remote]
+            if changed:
+                self.mirror.upsert_references(kind, changed)
+            if gone:
+                self.mirror.delete_references(kind, gone)
+            report.references[kind] = (len(changed), len(gone))
+        return report
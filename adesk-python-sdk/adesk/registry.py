@@ -0,0 +1,264 @@
+# adesk/registry.py
+import threading
+import time
+
+_TYPES = {"income": 1, "outcome": 2, 1: 1, 2: 2}
+
+
+def normalize_name(value):
+    """Natural key of names: case and surrounding/repeated whitespace are ignored."""
+    return " ".join(str(value).split()).casefold() if value is not None else None
+
+
+def normalize_number(value):
+    """Natural key of numbers such as INNs and account numbers: only the digits count."""
+    if value is None:
+        return None
+    digits = "".join(ch for ch in str(value) if ch.isdigit())
+    return digits or None
+
+
+def _code_key(value):
+    return str(value).strip() if value is not None else None
+
+
+# Kind -> (loader, natural key of an object, normalization of a looked-up key).
+_KINDS = {
+    "categories": (lambda client: client.transaction_categories.list(),
+                   lambda obj: normalize_name(obj.name), normalize_name),
+    "bank_accounts": (lambda client: client.bank_accounts.list_all(),
+                      lambda obj: normalize_number(obj.number), normalize_number),
+    "contractors": (lambda client: client.contractors.list_all(),
+                    lambda obj: normalize_number(obj.inn), normalize_number),
+    "legal_entities": (lambda client: client.legal_entities.list_all(),
+                       lambda obj: normalize_number(obj.inn), normalize_number),
+    "projects": (lambda client: client.projects.list(),
+                 lambda obj: normalize_name(obj.name), normalize_name),
+    "tags": (lambda client: client.tags.list_all(),
+             lambda obj: normalize_name(obj.name), normalize_name),
+    "units": (lambda client: client.warehouse.list_units(),
+              lambda obj: _code_key(obj.code), _code_key),
+}
+
+
+class _Index:
+    """One loaded reference list with its lookup tables (replaced as a whole on refresh)."""
+    def __init__(self, objects, natural_key, loaded_at):
+        self.loaded_at = loaded_at
+        self.by_id = {}
+        self.by_key = {}
+        for obj in objects:
+            self.by_id[obj.id] = obj
+            key = natural_key(obj)
+            if key is not None:
+                self.by_key.setdefault(key, []).append(obj)
+
+
+class ReferenceRegistry:
+    """
+    Cached reference data with hash indexes on natural keys, for mapping
+    names and numbers to IDs in O(1).
+
+    Each list (categories by name, bank accounts by number, contractors and
+    legal entities by INN, projects by name, tags by name, units by code) is
+    loaded on first use and reloaded once it is older than `ttl` seconds, or
+    after `invalidate`. A key that is not found triggers one reload, at most every
+    `miss_refresh` seconds, so objects created since the last load are found
+    too. Names are matched ignoring case and extra whitespace; INNs and
+    account numbers ignoring anything but digits.
+
+    Available as `client.registry`.
+
+    Example:
+        client.registry.category_id("Sales", type="income")
+        client.registry.contractor_ids(["7701234567", "7707654321"])
+        client.registry.invalidate("contractors") # after creating contractors
+    """
+    def __init__(self, client, ttl=300.0, miss_refresh=60.0, clock=time.monotonic):
+        """
+        Initializes the ReferenceRegistry.
+
+        Args:
+            client (AdeskClient): The client to load lists with.
+            ttl (float, optional): Seconds a loaded list is used for. Defaults to 300.
+            miss_refresh (float, optional): Minimum seconds between reloads caused by unknown
+                                            keys; None disables them. Defaults to 60.
+            clock (callable, optional): Time source. Defaults to `time.monotonic`.
+        """
+        self.client = client
+        self.ttl = ttl
+        self.miss_refresh = miss_refresh
+        self.clock = clock
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, kind, key):
+        """
+        Returns the ID of the object of `kind` with the natural key `key`.
+
+        Args:
+            kind (str): "categories", "bank_accounts", "contractors", "legal_entities", "projects",
+                        "tags" or "units".
+            key (str): Name, number, INN or code, depending on `kind`.
+
+        Returns:
+            int | None: The ID, or None if no object has that key.
+
+        Raises:
+            ValueError: If several objects have that key.
+        """
+        return self.resolve_many(kind, [key])[0]
+
+    def resolve_many(self, kind, keys):
+        """
+        Batch variant of `resolve`: one (possibly refreshed) index is used for all keys.
+
+        Returns:
+            list[int | None]: IDs in the order of `keys`.
+        """
+        return [self._unique(kind, key, matches) for key, matches in zip(keys, self._lookup(kind, keys))]
+
+    def natural_key(self, kind, value):
+        """Returns the normalized form of `value` used as a key of `kind` (e.g., a casefolded name)."""
+        return _KINDS[kind][2](value)
+
+    def get(self, kind, object_id):
+        """Returns the cached object of `kind` with the given ID, or None."""
+        return self._index(kind).by_id.get(object_id)
+
+    def all(self, kind):
+        """Returns all cached objects of `kind`."""
+        return list(self._index(kind).by_id.values())
+
+    def cached(self, kind, ids):
+        """
+        Returns `{id: object}` for the given IDs found in the list of `kind`, only if
+        that list is already loaded and fresh (never triggers a request).
+        """
+        index = self._indexes.get(kind)
+        if index is None or self.clock() - index.loaded_at >= self.ttl:
+            return {}
+        return {object_id: index.by_id[object_id] for object_id in ids if object_id in index.by_id}
+
+    def category_id(self, name, type=None):
+        """
+        Resolves a transaction category name.
+
+        Args:
+            name (str): The category name.
+            type (str | int, optional): "income" or "outcome" (1 or 2), to tell apart
+                                        categories of both types with the same name.
+        """
+        return self.category_ids([name], type)[0]
+
+    def category_ids(self, names, type=None):
+        """Batch variant of `category_id`."""
+        wanted = _TYPES[type] if type is not None else None
+        results = []
+        for name, matches in zip(names, self._lookup("categories", names)):
+            if wanted is not None:
+                matches = [obj for obj in matches if obj.type == wanted]
+            results.append(self._unique("categories", name, matches))
+        return results
+
+    def bank_account_id(self, number):
+        """Resolves a bank account number."""
+        return self.resolve("bank_accounts", number)
+
+    def bank_account_ids(self, numbers):
+        """Batch variant of `bank_account_id`."""
+        return self.resolve_many("bank_accounts", numbers)
+
+    def contractor_id(self, inn):
+        """Resolves a contractor INN."""
+        return self.resolve("contractors", inn)
+
+    def contractor_ids(self, inns):
+        """Batch variant of `contractor_id`."""
+        return self.resolve_many("contractors", inns)
+
+    def legal_entity_id(self, inn):
+        """Resolves a legal entity INN."""
+        return self.resolve("legal_entities", inn)
+
+    def legal_entity_ids(self, inns):
+        """Batch variant of `legal_entity_id`."""
+        return self.resolve_many("legal_entities", inns)
+
+    def project_id(self, name):
+        """Resolves a project name."""
+        return self.resolve("projects", name)
+
+    def project_ids(self, names):
+        """Batch variant of `project_id`."""
+        return self.resolve_many("projects", names)
+
+    def tag_id(self, name):
+        """Resolves a tag name."""
+        return self.resolve("tags", name)
+
+    def tag_ids(self, names):
+        """Batch variant of `tag_id`."""
+        return self.resolve_many("tags", names)
+
+    def unit_id(self, code):
+        """Resolves a unit code."""
+        return self.resolve("units", code)
+
+    def unit_ids(self, codes):
+        """Batch variant of `unit_id`."""
+        return self.resolve_many("units", codes)
+
+    def remember(self, kind, objects):
+        """
+        Adds objects created since the list of `kind` was loaded to its cached index
+        (nothing is done if the list is not loaded).
+        """
+        with self._lock:
+            index = self._indexes.get(kind)
+            if index is not None:
+                merged = dict(index.by_id)
+                merged.update((obj.id, obj) for obj in objects)
+                self._indexes[kind] = _Index(merged.values(), _KINDS[kind][1], index.loaded_at)
+
+    def invalidate(self, kind=None):
+        """Drops the cached list of `kind` (or all lists), so the next lookup reloads it."""
+        with self._lock:
+            if kind is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(kind, None)
+
+    def refresh(self, kind=None):
+        """Reloads the list of `kind` (or all lists) now."""
+        for name in [kind] if kind is not None else list(_KINDS):
+            self._load(name)
+
+    def _lookup(self, kind, keys):
+        normalize = _KINDS[kind][2]
+        normalized = [normalize(key) for key in keys]
+        index = self._index(kind)
+        if self.miss_refresh is not None and any(key is not None and key not in index.by_key for key in normalized):
+            if self.clock() - index.loaded_at >= self.miss_refresh:
+                index = self._load(kind)
+        return [index.by_key.get(key, []) if key is not None else [] for key in normalized]
+
+    def _unique(self, kind, key, matches):
+        if len(matches) > 1:
+            raise ValueError(f"Ambiguous {kind} key {key!r}: IDs {[obj.id for obj in matches]}")
+        return matches[0].id if matches else None
+
+    def _index(self, kind):
+        if kind not in _KINDS:
+            raise ValueError(f"Unknown reference kind: {kind!r}")
+        index = self._indexes.get(kind)
+        if index is None or self.clock() - index.loaded_at >= self.ttl:
+            index = self._load(kind)
+        return index
+
+    def _load(self, kind):
+        loader, natural_key, _ = _KINDS[kind]
+        index = _Index(loader(self.client) or [], natural_key, self.clock())
+        with self._lock:
+            self._indexes[kind] = index
+        return index
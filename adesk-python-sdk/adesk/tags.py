@@ -1,4 +1,7 @@
 from adesk_python_sdk.adesk.models import Tag
+from adesk_python_sdk.adesk.bulk import run_bulk
+from adesk_python_sdk.adesk.exceptions import AdeskBulkError
+from adesk_python_sdk.adesk.batch_get import MissCache, fetch_many
 
 class Tags:
     """
@@ -13,6 +16,7 @@ class Tags:
             client (AdeskClient): The AdeskClient instance to use for API calls.
         """
         self.client = client
+        self._misses = MissCache()
 
     def list_all(self, search=None):
         """
@@ -51,6 +55,16 @@ class Tags:
         tag_data = response_data.get("tag") if response_data else None
         return Tag(tag_data) if tag_data else None
 
+    def get_many(self, tag_ids, cache=None, concurrency=4):
+        """
+        Retrieves many tags as `{id: Tag}`: from `cache` and `client.registry` first, then with
+        concurrent `get` calls. See `batch_get.fetch_many`.
+        """
+        registry = self.client.registry
+        return fetch_many(tag_ids, self.get, lookups=[lambda ids: registry.cached("tags", ids)],
+                          list_all=lambda: registry.all("tags"), cache=cache,
+                          misses=self._misses, concurrency=concurrency)
+
     def create(self, name, color):
         """
         Creates a new tag.
@@ -77,6 +91,53 @@ class Tags:
             return Tag(created_tag_data)
         return response_data # Fallback for success messages or other structures
 
+    def ensure(self, names, color="blue", concurrency=4):
+        """
+        Get-or-create for tags: resolves names against the client's indexed tag list
+        (`client.registry`) and creates only the missing tags, concurrently and once per
+        distinct name (names are compared ignoring case and extra whitespace).
+
+        Args:
+            names (iterable[str]): Tag names; duplicates and empty names are allowed.
+            color (str, optional): Color of the created tags. Defaults to "blue".
+            concurrency (int, optional): Creates in flight at the same time. Defaults to 4.
+
+        Returns:
+            dict: The ID of every given (non-empty) name, by name.
+
+        Raises:
+            AdeskBulkError: If some tags could not be created; `results` holds the ID map of
+                            the names that were resolved, `failures` the `(name, exception)` pairs.
+        """
+        registry = self.client.registry
+        names = [name for name in names if name]
+        distinct = {}
+        for name in names:
+            distinct.setdefault(registry.natural_key("tags", name), name)
+        ids = dict(zip(distinct, registry.tag_ids(list(distinct.values()))))
+
+        missing = [name for key, name in distinct.items() if ids[key] is None]
+        created, failures, unresolved = [], [], False
+        for outcome in run_bulk(lambda name: self.create(name, color), missing, concurrency=concurrency):
+            if not outcome.ok:
+                failures.append((outcome.item, outcome.error))
+            elif isinstance(outcome.result, Tag) and outcome.result.id is not None:
+                created.append(outcome.result)
+                ids[registry.natural_key("tags", outcome.item)] = outcome.result.id
+            else:
+                unresolved = True # The API did not return the tag: look it up below.
+        registry.remember("tags", created)
+        if unresolved:
+            registry.invalidate("tags")
+            pending = [name for key, name in distinct.items() if ids[key] is None]
+            ids.update(zip((registry.natural_key("tags", name) for name in pending), registry.tag_ids(pending)))
+
+        result = {name: ids[registry.natural_key("tags", name)] for name in names}
+        if failures:
+            raise AdeskBulkError(f"{len(failures)} of {len(missing)} tags could not be created.",
+                                 results={k: v for k, v in result.items() if v is not None}, failures=failures)
+        return result
+
     def update(self, tag_id, name=None, color=None):
         """
         Updates an existing tag.
@@ -0,0 +1,51 @@
+# adesk/transports/__init__.py
+# Transports are imported lazily on first access (see adesk/_lazy.py), so that the
+# HTTP libraries behind the ones you do not use are never loaded.
+from .._lazy import lazy_attributes
+
+__all__ = [
+    # Interfaces
+    'Transport',
+    'AsyncTransport',
+    'ExecutorAsyncTransport',
+    'TransportResponse',
+    'TransportError',
+    # Implementations
+    'RequestsTransport',
+    'Urllib3Transport',
+    'HTTPXTransport',
+    'AsyncHTTPXTransport',
+    'HTTP2Transport',
+    'AsyncHTTP2Transport',
+    'http2_available',
+    'FakeTransport',
+    'AsyncFakeTransport',
+    'FakeRequest',
+    # Record/replay
+    'RecordingTransport',
+    'ReplayTransport',
+    'CassetteMissError',
+]
+
+_LAZY_ATTRIBUTES = {
+    'Transport': '.base',
+    'AsyncTransport': '.base',
+    'ExecutorAsyncTransport': '.base',
+    'TransportResponse': '.base',
+    'TransportError': '.base',
+    'RequestsTransport': '.requests_transport',
+    'Urllib3Transport': '.urllib3_transport',
+    'HTTPXTransport': '.httpx_transport',
+    'AsyncHTTPXTransport': '.httpx_transport',
+    'HTTP2Transport': '.httpx_transport',
+    'AsyncHTTP2Transport': '.httpx_transport',
+    'http2_available': '.httpx_transport',
+    'FakeTransport': '.fake',
+    'AsyncFakeTransport': '.fake',
+    'FakeRequest': '.fake',
+    'RecordingTransport': '.cassette',
+    'ReplayTransport': '.cassette',
+    'CassetteMissError': '.cassette',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,212 @@
+# adesk/transports/base.py
+import json as jsonlib
+from urllib.parse import urlencode
+
+
+class TransportError(Exception):
+    """
+    Raised by transports for network-level failures (connection errors, timeouts, etc.).
+    The client wraps it into an `AdeskAPIError`.
+    """
+    pass
+
+
+class TransportResponse:
+    """
+    Minimal HTTP response returned by transports.
+
+    Exposes the subset of the `requests.Response` interface the client relies on
+    (`status_code`, `headers`, `content`, `text`, `json()`), so that `requests.Response`
+    objects can be returned unchanged by requests-based transports.
+    """
+    def __init__(self, status_code, content=b"", headers=None, reason=None, url=None, elapsed=None,
+                 http_version=None):
+        """
+        Initializes a TransportResponse.
+
+        Args:
+            status_code (int): The HTTP status code.
+            content (bytes, optional): The raw response body.
+            headers (dict, optional): Response headers.
+            reason (str, optional): The HTTP reason phrase.
+            url (str, optional): The URL of the request.
+            elapsed (float, optional): Time taken by the request, in seconds.
+            http_version (str, optional): Protocol used for the exchange (e.g., "HTTP/2").
+        """
+        self.status_code = status_code
+        self.content = content or b""
+        self.headers = headers or {}
+        self.reason = reason
+        self.url = url
+        self.elapsed = elapsed
+        self.http_version = http_version
+
+    @property
+    def text(self):
+        """str: The response body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        """
+        Parses the response body as JSON.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return jsonlib.loads(self.content)
+
+    def __repr__(self):
+        return f"<TransportResponse [{self.status_code}]>"
+
+
+def encode_query(params):
+    """
+    URL-encodes query or form parameters the way `requests` does:
+    `None` values are dropped and list values become repeated keys.
+
+    Args:
+        params (dict | None): Parameters to encode.
+
+    Returns:
+        str: The encoded string (empty if there are no parameters).
+    """
+    if not params:
+        return ""
+    pairs = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            pairs.extend((key, item) for item in value if item is not None)
+        else:
+            pairs.append((key, value))
+    return urlencode(pairs)
+
+
+def build_url(url, params):
+    """Appends encoded query parameters to `url`."""
+    query = encode_query(params)
+    if not query:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}{query}"
+
+
+def encode_body(data=None, json=None, headers=None):
+    """
+    Encodes a request body for transports that work with raw bytes.
+
+    Args:
+        data (dict, optional): Form data, encoded as `application/x-www-form-urlencoded`.
+        json (dict | list, optional): Data encoded as JSON.
+        headers (dict, optional): Request headers; a copy is returned with `Content-Type` set.
+
+    Returns:
+        tuple[bytes | None, dict]: The encoded body and the headers to send.
+    """
+    headers = dict(headers or {})
+    if json is not None:
+        headers.setdefault("Content-Type", "application/json")
+        return jsonlib.dumps(json).encode("utf-8"), headers
+    if data:
+        headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+        return encode_query(data).encode("utf-8"), headers
+    return None, headers
+
+
+class Transport:
+    """
+    Base class for the synchronous HTTP layer used by `AdeskClient`.
+
+    A transport receives a fully built request (absolute URL, query parameters,
+    body and headers) and returns a response object (`TransportResponse` or
+    `requests.Response`). Authentication and mapping of error statuses to
+    `AdeskAPIError` subclasses stay in the client, so transports only deal with
+    moving bytes and must raise `TransportError` for network failures.
+
+    `AdeskClient` shares one transport between all the threads using it, so
+    `request` must be safe to call concurrently.
+    """
+    def request(self, method, url, params=None, data=None, json=None, headers=None):
+        """
+        Sends a single HTTP request.
+
+        Args:
+            method (str): HTTP method (e.g., "GET", "POST").
+            url (str): Absolute URL of the request.
+            params (dict, optional): Query parameters.
+            data (dict, optional): Form data for the request body (API v1).
+            json (dict | list, optional): JSON body for the request (API v2).
+            headers (dict, optional): Request headers.
+
+        Returns:
+            TransportResponse: The HTTP response.
+
+        Raises:
+            TransportError: For network-level failures.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Releases any resources held by the transport.
+        The base implementation does nothing.
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncTransport:
+    """
+    Base class for asynchronous transports used by the `AdeskClient` coroutine
+    methods (`aget`, `apost`, `aget_v2`, ...). Same contract as `Transport`,
+    with `request` and `close` being coroutines.
+    """
+    async def request(self, method, url, params=None, data=None, json=None, headers=None):
+        """
+        Sends a single HTTP request. See `Transport.request`.
+
+        Returns:
+            TransportResponse: The HTTP response.
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """Releases any resources held by the transport."""
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class ExecutorAsyncTransport(AsyncTransport):
+    """
+    Adapts a synchronous `Transport` to the `AsyncTransport` interface by running
+    its calls in the event loop's default thread pool executor.
+    Used by `AdeskClient` when no native async transport is configured.
+    """
+    def __init__(self, transport):
+        """
+        Initializes the ExecutorAsyncTransport.
+
+        Args:
+            transport (Transport): The synchronous transport to run in the executor.
+        """
+        self.transport = transport
+
+    async def request(self, method, url, **kwargs):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.transport.request(method, url, **kwargs))
+
+    async def close(self):
+        # The wrapped transport is owned by the caller (usually the client).
+        pass
@@ -0,0 +1,237 @@
+# adesk/transports/cassette.py
+import gzip
+import json
+import threading
+import time
+from collections import deque
+
+from .base import Transport, TransportResponse
+from .requests_transport import RequestsTransport
+
+CASSETTE_VERSION = 1
+TOKEN_PLACEHOLDER = "<API_TOKEN>"
+
+# Credentials are never written to a cassette: v1 sends the token as a query/form
+# field, v2 as a header (request headers are not recorded at all).
+_TOKEN_FIELDS = ("api_token",)
+# Only the response headers needed to decode the body are kept.
+_KEPT_RESPONSE_HEADERS = ("Content-Type",)
+# Shorter values (test tokens) are not searched for inside free text to avoid mangling it.
+_MIN_SCRUBBED_TOKEN_LENGTH = 8
+
+
+class CassetteMissError(LookupError):
+    """Raised on replay when a request has no recorded interaction."""
+    pass
+
+
+def _open(path, mode):
+    """Opens a cassette file, transparently gzip-compressed for `.gz` paths."""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _canonical(value):
+    """Serializes params/body into a stable string used for request matching."""
+    if value is None:
+        return ""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _request_key(method, url, params, body):
+    return (method.upper(), url, _canonical(params), _canonical(body))
+
+
+class _Scrubber:
+    """
+    Removes API token occurrences from request parts before they are stored or matched.
+    Safe to share between threads sending requests concurrently.
+    """
+    def __init__(self):
+        self.tokens = set()
+        self._lock = threading.Lock()
+
+    def collect(self, params, body, headers):
+        found = []
+        for container in (params, body):
+            if isinstance(container, dict):
+                found.extend(container.get(field) for field in _TOKEN_FIELDS)
+        if headers:
+            found.append(headers.get("X-API-Token"))
+        found = [str(t) for t in found if t and len(str(t)) >= _MIN_SCRUBBED_TOKEN_LENGTH]
+        with self._lock:
+            self.tokens.update(found)
+
+    def text(self, value):
+        if not value:
+            return value
+        with self._lock:
+            tokens = tuple(self.tokens)
+        for token in tokens:
+            value = value.replace(token, TOKEN_PLACEHOLDER)
+        return value
+
+    def mapping(self, value):
+        if not isinstance(value, dict):
+            return value
+        return {k: v for k, v in value.items() if k not in _TOKEN_FIELDS}
+
+
+class RecordingTransport(Transport):
+    """
+    Transport that forwards requests to a real transport and records every
+    interaction into a cassette file.
+
+    The API token is stripped from query parameters and form bodies, request
+    headers are not stored, and any remaining token occurrences in URLs or
+    response bodies are replaced with a placeholder. The cassette is written
+    as JSON lines (gzip-compressed when the path ends with `.gz`) on `save()`
+    or `close()`.
+
+    Example:
+        with RecordingTransport("operations.jsonl.gz") as transport:
+            client = AdeskClient(api_token, transport=transport)
+            client.operations.list_all(range_str="this_year")
+    """
+    def __init__(self, path, inner=None):
+        """
+        Initializes the RecordingTransport.
+
+        Args:
+            path (str): Path of the cassette file to write.
+            inner (Transport, optional): Transport used for the real calls.
+                                         Defaults to `RequestsTransport()`.
+        """
+        self.path = path
+        self.inner = inner if inner is not None else RequestsTransport()
+        self.interactions = []
+        self._scrubber = _Scrubber()
+        self._lock = threading.Lock()
+
+    def request(self, method, url, params=None, data=None, json=None, headers=None):
+        """
+        Sends the request through the inner transport and records the response.
+
+        Returns:
+            TransportResponse: The response returned by the inner transport.
+        """
+        kwargs = {"params": params, "headers": headers}
+        if json is not None:
+            kwargs["json"] = json
+        else:
+            kwargs["data"] = data
+        started = time.perf_counter()
+        response = self.inner.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - started
+
+        scrub = self._scrubber
+        scrub.collect(params, data, headers)
+        body = json if json is not None else scrub.mapping(data)
+        content_headers = getattr(response, "headers", None) or {}
+        entry = {
+            "method": method.upper(),
+            "url": scrub.text(url),
+            "params": scrub.mapping(params),
+            "body": body,
+            "status": response.status_code,
+            "reason": getattr(response, "reason", None),
+            "headers": {h: content_headers[h] for h in _KEPT_RESPONSE_HEADERS if h in content_headers},
+            "content": scrub.text(response.text),
+            "elapsed": round(elapsed, 6),
+        }
+        with self._lock:
+            self.interactions.append(entry)
+        return response
+
+    def save(self):
+        """Writes all recorded interactions to the cassette file."""
+        with self._lock:
+            interactions = list(self.interactions)
+        with _open(self.path, "w") as fh:
+            fh.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+            for entry in interactions:
+                fh.write(json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n")
+
+    def close(self):
+        """Saves the cassette and closes the inner transport."""
+        self.save()
+        self.inner.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Transport that answers requests from a previously recorded cassette
+    without touching the network.
+
+    Requests are matched on method, URL, query parameters and body (with the API
+    token removed, so any token can be used on replay). Identical requests are
+    answered in recording order; once they are exhausted the last recorded
+    response is repeated, which allows the same cassette to drive benchmark loops.
+
+    Example:
+        client = AdeskClient("any-token", transport=ReplayTransport("operations.jsonl.gz"))
+        operations = client.operations.list_all(range_str="this_year")
+    """
+    def __init__(self, path, realtime=False, speed=1.0):
+        """
+        Initializes the ReplayTransport.
+
+        Args:
+            path (str): Path of the cassette file to read.
+            realtime (bool, optional): If True, sleeps for the recorded latency of each
+                                       interaction before returning it. Defaults to False
+                                       (full speed).
+            speed (float, optional): Divides recorded latencies when `realtime` is True
+                                     (e.g., 2.0 replays twice as fast). Defaults to 1.0.
+        """
+        if speed <= 0:
+            raise ValueError("speed must be positive.")
+        self.path = path
+        self.realtime = realtime
+        self.speed = speed
+        self._scrubber = _Scrubber()
+        self._lock = threading.Lock()
+        self._interactions = {}
+        self._load()
+
+    def _load(self):
+        with _open(self.path, "r") as fh:
+            header = json.loads(fh.readline() or "{}")
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(f"Unsupported cassette version: {header.get('version')!r}")
+            for line in fh:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = _request_key(entry["method"], entry["url"], entry["params"], entry["body"])
+                self._interactions.setdefault(key, deque()).append(entry)
+
+    def request(self, method, url, params=None, data=None, json=None, headers=None):
+        """
+        Returns the recorded response for the request.
+
+        Returns:
+            TransportResponse: A response rebuilt from the cassette.
+
+        Raises:
+            CassetteMissError: If no interaction was recorded for the request.
+        """
+        scrub = self._scrubber
+        body = json if json is not None else scrub.mapping(data)
+        key = _request_key(method, url, scrub.mapping(params), body)
+        with self._lock:
+            recorded = self._interactions.get(key)
+            if not recorded:
+                raise CassetteMissError(f"No recorded interaction for {method.upper()} {url}")
+            entry = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        if self.realtime and entry.get("elapsed"):
+            time.sleep(entry["elapsed"] / self.speed)
+        return self._build_response(method, url, entry)
+
+    @staticmethod
+    def _build_response(method, url, entry):
+        return TransportResponse(
+            entry["status"], (entry.get("content") or "").encode("utf-8"), dict(entry.get("headers") or {}),
+            reason=entry.get("reason"), url=url, elapsed=entry.get("elapsed"),
+        )
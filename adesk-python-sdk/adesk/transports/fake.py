@@ -0,0 +1,135 @@
+# adesk/transports/fake.py
+import json as jsonlib
+import re
+import threading
+import time
+from urllib.parse import urlsplit, parse_qsl
+
+from .base import Transport, AsyncTransport, TransportResponse
+
+
+class FakeRequest:
+    """A request received by a fake transport, as seen by route handlers."""
+    def __init__(self, method, url, params=None, data=None, json=None, headers=None):
+        self.method = method.upper()
+        self.url = url
+        split = urlsplit(url)
+        self.path = split.path
+        self.params = dict(parse_qsl(split.query))
+        self.params.update(params or {})
+        self.data = data
+        self.json = json
+        self.headers = headers or {}
+
+    def __repr__(self):
+        return f"<FakeRequest {self.method} {self.path}>"
+
+
+def _compile_path(path):
+    """Turns a route such as `transaction/{id}` into a regex matching the end of a URL path."""
+    pattern = re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>[^/]+)", re.escape(path.strip("/")))
+    return re.compile(rf"(?:^|/){pattern}/?$")
+
+
+class _FakeRouter:
+    """Route table shared by the sync and async fake transports."""
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = []
+        # Replaced as a whole on `add` (copy-on-write), so dispatch reads it without locking.
+        self._routes = ()
+        self._lock = threading.Lock()
+
+    def add(self, method, path, response=None, status=200, handler=None):
+        """
+        Registers a canned response for requests matching `method` and `path`.
+
+        Args:
+            method (str): HTTP method to match (e.g., "GET").
+            path (str): Endpoint path relative to the API base URL (e.g., "transactions"
+                        or "transaction/{id}"). `{name}` segments match any value and are
+                        passed to `handler` as keyword arguments.
+            response (dict | list, optional): JSON body returned for matching requests.
+            status (int, optional): HTTP status returned with `response`. Defaults to 200.
+            handler (callable, optional): Called as `handler(request, **path_args)` instead
+                                          of returning `response`. It may return a JSON-able
+                                          body, a `(status, body)` tuple or a `TransportResponse`.
+
+        Returns:
+            _FakeRouter: The transport itself, so calls can be chained.
+        """
+        if handler is None:
+            body = response
+            handler = lambda request, **kwargs: (status, body)
+        with self._lock:
+            # Later registrations take precedence over earlier ones.
+            self._routes = ((method.upper(), _compile_path(path), handler),) + self._routes
+        return self
+
+    def _dispatch(self, method, url, params=None, data=None, json=None, headers=None):
+        request = FakeRequest(method, url, params=params, data=data, json=json, headers=headers)
+        with self._lock:
+            self.calls.append(request)
+        for route_method, pattern, handler in self._routes:
+            if route_method != request.method:
+                continue
+            match = pattern.search(request.path)
+            if match:
+                return self._to_response(handler(request, **match.groupdict()), url)
+        return self._to_response((404, {"message": f"No fake route for {request.method} {request.path}"}), url)
+
+    @staticmethod
+    def _to_response(result, url):
+        if isinstance(result, TransportResponse):
+            return result
+        status, body = result if isinstance(result, tuple) else (200, result)
+        content = b"" if body is None else jsonlib.dumps(body).encode("utf-8")
+        return TransportResponse(status, content, {"Content-Type": "application/json"}, url=url)
+
+
+class FakeTransport(_FakeRouter, Transport):
+    """
+    In-memory stand-in for the Adesk API, for tests and benchmarks.
+
+    Responses are served from registered routes without any network I/O;
+    every received request is appended to `calls`. Unknown routes return 404.
+
+    Example:
+        fake = FakeTransport()
+        fake.add("GET", "transaction/{id}", handler=lambda request, id: {"transaction": {"id": int(id)}})
+        client = AdeskClient("token", transport=fake)
+        client.operations.get(5)
+    """
+    def __init__(self, latency=0.0):
+        """
+        Initializes the FakeTransport.
+
+        Args:
+            latency (float, optional): Seconds to sleep before answering each request,
+                                       to simulate network round-trips. Defaults to 0.
+        """
+        _FakeRouter.__init__(self, latency=latency)
+
+    def request(self, method, url, params=None, data=None, json=None, headers=None):
+        if self.latency:
+            time.sleep(self.latency)
+        return self._dispatch(method, url, params=params, data=data, json=json, headers=headers)
+
+
+class AsyncFakeTransport(_FakeRouter, AsyncTransport):
+    """Asynchronous variant of `FakeTransport`; latency is simulated with `asyncio.sleep`."""
+    def __init__(self, latency=0.0):
+        """
+        Initializes the AsyncFakeTransport.
+
+        Args:
+            latency (float, optional): Seconds to wait before answering each request. Defaults to 0.
+        """
+        _FakeRouter.__init__(self, latency=latency)
+
+    async def request(self, method, url, params=None, data=None, json=None, headers=None):
+        if self.latency:
+            import asyncio
+
+            await asyncio.sleep(self.latency)
+        return self._dispatch(method, url, params=params, data=data, json=json, headers=headers)
@@ -0,0 +1,198 @@
+# adesk/transports/httpx_transport.py
+import warnings
+
+from .base import Transport, AsyncTransport, TransportError, TransportResponse
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "HTTPXTransport requires the 'httpx' package (pip install 'httpx[http2]')."
+        ) from e
+    return httpx
+
+
+def http2_available():
+    """
+    Checks whether HTTP/2 can be used, i.e. both `httpx` and `h2` are installed.
+
+    Returns:
+        bool: True if HTTP/2 transports can negotiate HTTP/2.
+    """
+    try:
+        import httpx # noqa: F401
+        import h2 # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _client_kwargs(httpx, http2, prior_knowledge, timeout, max_connections):
+    """
+    Builds `httpx.Client`/`httpx.AsyncClient` options, falling back to HTTP/1.1
+    with a warning when HTTP/2 is requested but `h2` is not installed.
+    """
+    if http2 and not http2_available():
+        warnings.warn("HTTP/2 requested but the 'h2' package is not installed; falling back to HTTP/1.1. "
+                      "Install it with: pip install 'httpx[http2]'", RuntimeWarning, stacklevel=3)
+        http2 = prior_knowledge = False
+    kwargs = {"http2": http2, "limits": httpx.Limits(max_connections=max_connections)}
+    if prior_knowledge:
+        # Cleartext HTTP/2 without the HTTP/1.1 upgrade dance (h2c), e.g. for local stand-ins.
+        kwargs["http1"] = False
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    return kwargs
+
+
+def _to_response(response):
+    return TransportResponse(
+        response.status_code, response.content, dict(response.headers),
+        reason=response.reason_phrase, url=str(response.url),
+        elapsed=response.elapsed.total_seconds(), http_version=response.http_version,
+    )
+
+
+def _request_kwargs(params, data, json, headers):
+    kwargs = {"params": params, "headers": headers}
+    if json is not None:
+        kwargs["json"] = json
+    elif data is not None:
+        kwargs["data"] = data
+    return kwargs
+
+
+class HTTPXTransport(Transport):
+    """
+    Transport backed by `httpx`, with optional HTTP/2 support.
+
+    With `http2=True` (requires the `h2` package, `pip install 'httpx[http2]'`)
+    concurrent requests from several threads to the same host are multiplexed
+    over a single connection. Servers that do not offer HTTP/2 are talked to
+    over HTTP/1.1, and a missing `h2` package downgrades the transport to
+    HTTP/1.1 with a `RuntimeWarning`.
+    """
+    def __init__(self, http2=True, client=None, timeout=None, max_connections=10, prior_knowledge=False):
+        """
+        Initializes the HTTPXTransport.
+
+        Args:
+            http2 (bool, optional): Whether to negotiate HTTP/2. Defaults to True.
+            client (httpx.Client, optional): Pre-configured client; other options are ignored.
+            timeout (float, optional): Timeout for every call, in seconds. Defaults to httpx's default.
+            max_connections (int, optional): Maximum number of open connections. Defaults to 10.
+            prior_knowledge (bool, optional): Speak HTTP/2 directly over cleartext `http://` URLs
+                                              (h2c) instead of negotiating it with TLS ALPN.
+                                              Only useful for local stand-ins. Defaults to False.
+        """
+        httpx = _import_httpx()
+        self._httpx = httpx
+        if client is None:
+            client = httpx.Client(**_client_kwargs(httpx, http2, prior_knowledge, timeout, max_connections))
+        self.client = client
+
+    def request(self, method, url, params=None, data=None, json=None, headers=None):
+        """
+        Sends a request through the httpx client.
+
+        Returns:
+            TransportResponse: The HTTP response; `http_version` tells which protocol was used.
+
+        Raises:
+            TransportError: If httpx fails to complete the request.
+        """
+        try:
+            response = self.client.request(method, url, **_request_kwargs(params, data, json, headers))
+        except self._httpx.TransportError as e:
+            raise TransportError(e) from e
+        return _to_response(response)
+
+    def close(self):
+        """Closes the httpx client and its connections."""
+        self.client.close()
+
+
+class AsyncHTTPXTransport(AsyncTransport):
+    """
+    Asynchronous transport backed by `httpx.AsyncClient`, with optional HTTP/2 support.
+    Concurrent coroutines share (and, with HTTP/2, multiplex) the client's connections.
+    Falls back to HTTP/1.1 the same way as `HTTPXTransport`.
+    """
+    def __init__(self, http2=True, client=None, timeout=None, max_connections=10, prior_knowledge=False):
+        """
+        Initializes the AsyncHTTPXTransport.
+
+        Args:
+            http2 (bool, optional): Whether to negotiate HTTP/2. Defaults to True.
+            client (httpx.AsyncClient, optional): Pre-configured client; other options are ignored.
+            timeout (float, optional): Timeout for every call, in seconds. Defaults to httpx's default.
+            max_connections (int, optional): Maximum number of open connections. Defaults to 10.
+            prior_knowledge (bool, optional): Speak HTTP/2 directly over cleartext `http://` URLs (h2c).
+                                              Defaults to False.
+        """
+        httpx = _import_httpx()
+        self._httpx = httpx
+        if client is None:
+            client = httpx.AsyncClient(**_client_kwargs(httpx, http2, prior_knowledge, timeout, max_connections))
+        self.client = client
+
+    async def request(self, method, url, params=None, data=None, json=None, headers=None):
+        """
+        Sends a request through the async httpx client.
+
+        Returns:
+            TransportResponse: The HTTP response; `http_version` tells which protocol was used.
+
+        Raises:
+            TransportError: If httpx fails to complete the request.
+        """
+        try:
+            response = await self.client.request(method, url, **_request_kwargs(params, data, json, headers))
+        except self._httpx.TransportError as e:
+            raise TransportError(e) from e
+        return _to_response(response)
+
+    async def close(self):
+        """Closes the httpx client and its connections."""
+        await self.client.aclose()
+
+
+class HTTP2Transport(HTTPXTransport):
+    """
+    HTTP/2 transport for fanning out many concurrent requests.
+
+    The v1 and v2 base URLs live on the same host (`api.adesk.ru`), so all
+    requests of a client, from any number of threads, are multiplexed as
+    concurrent streams over one TLS connection instead of one socket (and
+    handshake) per in-flight request. Falls back to HTTP/1.1 when the server
+    or the installed packages do not support HTTP/2.
+
+    Example:
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = AdeskClient(api_token, transport=HTTP2Transport())
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            operations = list(pool.map(client.operations.get, operation_ids))
+    """
+    def __init__(self, client=None, timeout=None, max_connections=10, prior_knowledge=False):
+        """
+        Initializes the HTTP2Transport. See `HTTPXTransport` for the arguments.
+        """
+        super().__init__(http2=True, client=client, timeout=timeout,
+                         max_connections=max_connections, prior_knowledge=prior_knowledge)
+
+
+class AsyncHTTP2Transport(AsyncHTTPXTransport):
+    """
+    Asynchronous HTTP/2 transport: coroutines awaiting `client.aget(...)` /
+    `client.aget_v2(...)` concurrently (e.g., via `asyncio.gather`) share a
+    single multiplexed connection. Falls back to HTTP/1.1 like `HTTP2Transport`.
+    """
+    def __init__(self, client=None, timeout=None, max_connections=10, prior_knowledge=False):
+        """
+        Initializes the AsyncHTTP2Transport. See `AsyncHTTPXTransport` for the arguments.
+        """
+        super().__init__(http2=True, client=client, timeout=timeout,
+                         max_connections=max_connections, prior_knowledge=prior_knowledge)
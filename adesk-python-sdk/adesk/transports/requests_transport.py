@@ -0,0 +1,109 @@
+# adesk/transports/requests_transport.py
+import threading
+import weakref
+
+from .base import Transport, TransportError
+
+
+class RequestsTransport(Transport):
+    """
+    Default transport backed by the `requests` library.
+
+    Without a session every call goes through `requests.request`, which opens a
+    new connection each time; use `with_session()` to keep connections alive
+    between calls. `requests.Session` is not guaranteed to be thread-safe, so
+    `with_session()` gives every thread its own session, all of them mounted on
+    one shared (thread-safe) urllib3 connection pool. A `session` passed to the
+    constructor is used as is by all threads.
+
+    `requests` is imported on the first call rather than at module load, which
+    keeps `import adesk` and client construction cheap for short-lived processes.
+    """
+    def __init__(self, session=None, timeout=None, session_factory=None):
+        """
+        Initializes the RequestsTransport.
+
+        Args:
+            session (requests.Session, optional): Session to send requests with.
+                                                  Defaults to module-level `requests.request`.
+            timeout (float | tuple, optional): Timeout passed to `requests` for every call.
+            session_factory (callable, optional): Creates a session for each thread that sends
+                                                  requests. Ignored if `session` is given.
+        """
+        self.session = session
+        self.timeout = timeout
+        self.session_factory = session_factory
+        self._local = threading.local()
+        self._sessions = weakref.WeakSet() # a session goes away with its thread's locals
+        self._sessions_lock = threading.Lock()
+
+    @classmethod
+    def with_session(cls, pool_maxsize=10, timeout=None):
+        """
+        Creates a transport with a dedicated `requests.Session` and connection pool.
+
+        Args:
+            pool_maxsize (int, optional): Maximum number of pooled connections per host.
+                                          Defaults to 10.
+            timeout (float | tuple, optional): Timeout for every call.
+
+        Returns:
+            RequestsTransport: The new transport.
+        """
+        import requests
+
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=pool_maxsize)
+
+        def session_factory():
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            return session
+
+        return cls(timeout=timeout, session_factory=session_factory)
+
+    def _get_session(self):
+        """
+        Returns the session for the calling thread, or None to use `requests.request`.
+        Lock-free once the thread has its session.
+        """
+        if self.session is not None or self.session_factory is None:
+            return self.session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self.session_factory()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.add(session)
+        return session
+
+    def request(self, method, url, **kwargs):
+        """
+        Sends a request through `requests`. Keyword arguments are passed as is.
+
+        Returns:
+            requests.Response: The HTTP response.
+
+        Raises:
+            TransportError: If `requests` fails to complete the request.
+        """
+        import requests
+
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        session = self._get_session()
+        try:
+            if session is not None:
+                return session.request(method, url, **kwargs)
+            return requests.request(method, url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            raise TransportError(e) from e
+
+    def close(self):
+        """Closes the underlying session(s), if any."""
+        if self.session is not None:
+            self.session.close()
+        with self._sessions_lock:
+            sessions, self._sessions = list(self._sessions), weakref.WeakSet()
+        for session in sessions:
+            session.close()
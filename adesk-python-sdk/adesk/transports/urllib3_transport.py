@@ -0,0 +1,61 @@
+# adesk/transports/urllib3_transport.py
+import time
+
+from .base import Transport, TransportError, TransportResponse, build_url, encode_body
+
+
+class Urllib3Transport(Transport):
+    """
+    Transport that talks to `urllib3` directly, skipping the `requests` layer.
+
+    `urllib3.PoolManager` is thread-safe and keeps connections alive, so a single
+    instance can be shared by all threads of a process. Requires `urllib3`
+    (installed together with `requests`).
+    """
+    def __init__(self, pool_manager=None, timeout=None, maxsize=10):
+        """
+        Initializes the Urllib3Transport.
+
+        Args:
+            pool_manager (urllib3.PoolManager, optional): Pool manager to send requests with.
+                                                          A new one is created if omitted.
+            timeout (float, optional): Timeout for every call, in seconds.
+            maxsize (int, optional): Connections kept per host when creating the pool manager.
+                                     Defaults to 10.
+        """
+        try:
+            import urllib3
+        except ImportError as e: # pragma: no cover - urllib3 ships with requests
+            raise ImportError("Urllib3Transport requires the 'urllib3' package.") from e
+        self._urllib3 = urllib3
+        self.pool_manager = pool_manager or urllib3.PoolManager(maxsize=maxsize, retries=False)
+        self.timeout = timeout
+
+    def request(self, method, url, params=None, data=None, json=None, headers=None):
+        """
+        Sends a request through the urllib3 pool manager.
+
+        Returns:
+            TransportResponse: The HTTP response.
+
+        Raises:
+            TransportError: If urllib3 fails to complete the request.
+        """
+        body, headers = encode_body(data=data, json=json, headers=headers)
+        full_url = build_url(url, params)
+        kwargs = {"body": body, "headers": headers, "retries": False}
+        if self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+        started = time.perf_counter()
+        try:
+            response = self.pool_manager.request(method.upper(), full_url, **kwargs)
+        except self._urllib3.exceptions.HTTPError as e:
+            raise TransportError(e) from e
+        return TransportResponse(
+            response.status, response.data, dict(response.headers),
+            reason=response.reason, url=full_url, elapsed=time.perf_counter() - started,
+        )
+
+    def close(self):
+        """Closes all pooled connections."""
+        self.pool_manager.clear()
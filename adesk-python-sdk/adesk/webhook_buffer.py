@@ -0,0 +1,200 @@
+# adesk/webhook_buffer.py
+import asyncio
+import collections
+import hashlib
+import json
+import threading
+import time
+
+from .webhook_sync import WebhookEvent, parse_event
+
+
+def fingerprint(payload):
+    """Returns a 64-bit fingerprint of a webhook payload (same content, same fingerprint)."""
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(canonical, digest_size=8).digest(), "big")
+
+
+def event_version(event):
+    """
+    Default ordering key of an event: the object's `version` or `updatedAt`, else the
+    payload's `timestamp` or `createdAt`. None if the event carries none of them.
+    """
+    data = event.data[0] if event.data else {}
+    for source, fields in ((data, ("version", "updatedAt", "updated_at")),
+                           (event.payload, ("timestamp", "createdAt", "created_at"))):
+        for field in fields:
+            if source.get(field) is not None:
+                return source[field]
+    return None
+
+
+class WebhookBuffer:
+    """
+    Sits between webhook delivery and handlers, so that handlers do the minimum work.
+
+    - Duplicates: an event whose payload was already seen in the last `window`
+      seconds is dropped. Only a 64-bit fingerprint per payload is kept.
+    - Ordering and collapsing: events are buffered per entity (kind and id) for
+      `delay` seconds after the first one arrives. Only the newest is then
+      passed on (by `version`, else by arrival). A delete supersedes updates.
+    - Stale events: an event older than the last one passed on for the same
+      entity (within `window`) is dropped.
+
+    Events with several objects are split into one event per object; events
+    of unknown kinds (or without an object id) are passed on after the delay
+    without collapsing.
+
+    Example:
+        buffer = WebhookBuffer(WebhookApplier(client, mirror).apply, delay=1.0)
+        receiver.on("*", buffer.push)
+        asyncio.ensure_future(buffer.run()) # flushes every delay / 4 seconds
+    """
+    def __init__(self, handler=None, window=300.0, delay=0.5, version=event_version, clock=time.monotonic):
+        """
+        Initializes the WebhookBuffer.
+
+        Args:
+            handler (callable, optional): Called with each event passed on by `flush`.
+            window (float, optional): Seconds duplicates and stale events are detected for.
+                                      Defaults to 300.
+            delay (float, optional): Seconds events of an entity are held for reordering.
+                                     Defaults to 0.5.
+            version (callable, optional): Returns the ordering key of an event, or None.
+                                          Defaults to `event_version`.
+            clock (callable, optional): Time source. Defaults to `time.monotonic`.
+        """
+        self.handler = handler
+        self.window = window
+        self.delay = delay
+        self.version = version
+        self.clock = clock
+        self.stats = {"received": 0, "duplicates": 0, "collapsed": 0, "stale": 0, "emitted": 0}
+        self._lock = threading.Lock()
+        self._seen = set()
+        self._expiry = collections.deque()        # (expires_at, fingerprint)
+        self._pending = collections.OrderedDict() # entity -> (first arrival, [(version, sequence, event)])
+        self._emitted = {}                        # entity -> (version, expires_at)
+        self._sequence = 0
+
+    def push(self, event):
+        """
+        Adds an event (`WebhookEvent`, or a webhook body as accepted by `parse_event`).
+
+        Returns:
+            bool: False if the event was dropped as a duplicate.
+        """
+        if not isinstance(event, WebhookEvent):
+            event = parse_event(event)
+        now = self.clock()
+        key = fingerprint(event.payload)
+        with self._lock:
+            self.stats["received"] += 1
+            self._expire(now)
+            if key in self._seen:
+                self.stats["duplicates"] += 1
+                return False
+            self._seen.add(key)
+            self._expiry.append((now + self.window, key))
+
+            for single in self._split(event):
+                self._sequence += 1
+                object_id = single.data[0].get("id") if single.data else None
+                entity = (single.kind, object_id) if single.kind and object_id is not None else ("", self._sequence)
+                _, events = self._pending.setdefault(entity, (now, []))
+                events.append((self.version(single), self._sequence, single))
+        return True
+
+    def flush(self, force=False):
+        """
+        Passes on the events whose buffering delay is over.
+
+        Args:
+            force (bool, optional): Pass on everything buffered (e.g., on shutdown). Defaults to False.
+
+        Returns:
+            list[WebhookEvent]: The events passed on, in the order they were handled.
+        """
+        ready = self._take(force)
+        if self.handler is not None:
+            for event in ready:
+                self.handler(event)
+        return ready
+
+    @property
+    def pending(self):
+        """int: Entities with buffered events."""
+        with self._lock:
+            return len(self._pending)
+
+    async def run(self, interval=None):
+        """
+        Flushes periodically until cancelled; buffered events are flushed on cancellation.
+        Coroutine handlers are awaited, others run in the loop's default executor.
+
+        Args:
+            interval (float, optional): Seconds between flushes. Defaults to `delay / 4`.
+        """
+        loop = asyncio.get_event_loop()
+
+        async def deliver(events):
+            for event in events:
+                if asyncio.iscoroutinefunction(self.handler):
+                    await self.handler(event)
+                elif self.handler is not None:
+                    await loop.run_in_executor(None, self.handler, event)
+        try:
+            while True:
+                await asyncio.sleep(interval or self.delay / 4)
+                await deliver(self._take(False))
+        finally:
+            await asyncio.shield(deliver(self._take(True)))
+
+    def _take(self, force):
+        now = self.clock()
+        ready = []
+        with self._lock:
+            self._expire(now)
+            for entity, (first, events) in list(self._pending.items()):
+                if not force and first + self.delay > now:
+                    break # Entities are kept in first-arrival order.
+                del self._pending[entity]
+                event = self._newest(entity, events, now)
+                if event is not None:
+                    ready.append(event)
+            self.stats["emitted"] += len(ready)
+        return ready
+
+    def _split(self, event):
+        if len(event.data) <= 1:
+            return [event]
+        return [WebhookEvent(event.name, event.kind, event.action, [data], event.payload) for data in event.data]
+
+    def _newest(self, entity, events, now):
+        """Collapses the buffered events of an entity into the one to pass on (or None if stale)."""
+        if all(version is not None for version, _, _ in events):
+            try:
+                events.sort(key=lambda item: (item[0], item[1]))
+            except TypeError: # Versions of different types: keep the arrival order.
+                pass
+        deletes = [item for item in events if item[2].action == "delete"]
+        version, _, event = deletes[-1] if deletes else events[-1]
+        self.stats["collapsed"] += len(events) - 1
+        if not entity[0]:
+            return event
+        last = self._emitted.get(entity)
+        if last is not None and version is not None and last[0] is not None:
+            try:
+                if version < last[0]:
+                    self.stats["stale"] += 1
+                    return None
+            except TypeError: # Versions of different types cannot be ordered.
+                pass
+        self._emitted[entity] = (version, now + self.window)
+        return event
+
+    def _expire(self, now):
+        while self._expiry and self._expiry[0][0] <= now:
+            self._seen.discard(self._expiry.popleft()[1])
+        if len(self._emitted) > 2 * len(self._seen) + 1024:
+            self._emitted = {entity: last for entity, last in self._emitted.items() if last[1] > now}
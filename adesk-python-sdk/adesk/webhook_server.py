@@ -0,0 +1,218 @@
+# adesk/webhook_server.py
+import asyncio
+import fnmatch
+import functools
+import json
+import logging
+from urllib.parse import parse_qsl, urlsplit
+
+from .webhook_sync import parse_event
+
+logger = logging.getLogger(__name__)
+
+_REASONS = {202: "Accepted", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            411: "Length Required", 413: "Payload Too Large", 503: "Service Unavailable"}
+
+
+class WebhookReceiver:
+    """
+    Lightweight asyncio HTTP server receiving Adesk webhooks.
+
+    Each POST is parsed into a `WebhookEvent` (whose `objects` are models such
+    as `Operation` or `Project`), put on a bounded queue and acknowledged with
+    202 right away; a pool of workers then calls the handlers registered for
+    the event. When the queue stays full longer than `enqueue_timeout`, the
+    request is answered 503 with `Retry-After`, so bursts slow the sender down
+    instead of exhausting memory. A client that does not send its request
+    within `read_timeout` is disconnected.
+
+    Handlers may be coroutines, or plain functions which run in the loop's
+    default executor so they do not block receiving.
+
+    Example:
+        receiver = WebhookReceiver(port=8080, path="/adesk-webhook", workers=8)
+
+        @receiver.on("transaction_*")
+        def on_transaction(event):
+            print(event.name, event.objects)
+
+        receiver.on("*", WebhookApplier(client, mirror).apply)
+        receiver.run()
+    """
+    def __init__(self, host="127.0.0.1", port=8080, path="/", workers=4, queue_size=1000,
+                 enqueue_timeout=1.0, max_body_size=1024 * 1024, read_timeout=10.0, on_error=None):
+        """
+        Initializes the WebhookReceiver.
+
+        Args:
+            host (str, optional): Interface to listen on. Defaults to "127.0.0.1".
+            port (int, optional): Port to listen on; 0 picks a free one. Defaults to 8080.
+            path (str, optional): URL path webhooks are posted to. Defaults to "/".
+            workers (int, optional): Events processed at the same time. Defaults to 4.
+            queue_size (int, optional): Events waiting for a worker at most. Defaults to 1000.
+            enqueue_timeout (float, optional): Seconds a request may wait for room in the queue
+                                               before being answered 503. Defaults to 1.0.
+            max_body_size (int, optional): Largest accepted body in bytes. Defaults to 1 MiB.
+            read_timeout (float, optional): Seconds allowed to read the request head, and then
+                                            its body, before the connection is closed.
+                                            Defaults to 10.
+            on_error (callable, optional): Called as `on_error(event, exception)` when a handler
+                                           fails. Failures are logged by default.
+        """
+        self.host = host
+        self.port = port
+        self.path = path
+        self.workers = workers
+        self.queue_size = queue_size
+        self.enqueue_timeout = enqueue_timeout
+        self.max_body_size = max_body_size
+        self.read_timeout = read_timeout
+        self.on_error = on_error
+        self.stats = {"received": 0, "rejected": 0, "processed": 0, "failed": 0}
+        self._handlers = []
+        self._queue = None
+        self._server = None
+        self._tasks = []
+
+    def on(self, event, handler=None):
+        """
+        Registers a handler for events whose name matches `event`.
+
+        Args:
+            event (str): Event name or shell-style pattern (e.g., "transaction_created",
+                         "project_*", "*").
+            handler (callable, optional): Called with the `WebhookEvent`. If omitted,
+                                          `on` returns a decorator.
+
+        Returns:
+            callable: The handler.
+        """
+        if handler is None:
+            return functools.partial(self.on, event)
+        self._handlers.append((event, handler))
+        return handler
+
+    @property
+    def queued(self):
+        """int: Events waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self):
+        """Starts listening and the worker pool. `port` is updated if 0 was given."""
+        self._queue = asyncio.Queue(self.queue_size)
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+        return self
+
+    async def stop(self, drain=True):
+        """
+        Stops listening and the worker pool.
+
+        Args:
+            drain (bool, optional): Process the queued events first. Defaults to True.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if drain and self._tasks:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def serve_forever(self):
+        """Starts the receiver and serves until cancelled."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    def run(self):
+        """Serves in a new event loop until interrupted (blocking)."""
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            pass
+
+    async def _serve(self, reader, writer):
+        try:
+            status, headers = await self._receive(reader)
+        except asyncio.TimeoutError: # A stalled (or slowloris) client: drop it.
+            writer.close()
+            return
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            status, headers = 400, {}
+        head = f"HTTP/1.1 {status} {_REASONS[status]}\r\nContent-Length: 0\r\nConnection: close\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        try:
+            writer.write((head + "\r\n").encode("latin-1"))
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _receive(self, reader):
+        """Reads one request and queues its event; returns the response status and headers."""
+        method, target, headers = await asyncio.wait_for(self._read_head(reader), self.read_timeout)
+
+        if urlsplit(target).path != self.path:
+            return 404, {}
+        if method != "POST":
+            return 405, {"Allow": "POST"}
+        if "content-length" not in headers:
+            return 411, {}
+        length = int(headers["content-length"])
+        if length > self.max_body_size:
+            return 413, {}
+        body = await asyncio.wait_for(reader.readexactly(length), self.read_timeout)
+        if headers.get("content-type", "").startswith("application/x-www-form-urlencoded"):
+            body = {name: json.loads(value) if value[:1] in ("{", "[") else value
+                    for name, value in parse_qsl(body.decode("utf-8"))}
+        event = parse_event(body)
+
+        self.stats["received"] += 1
+        try:
+            await asyncio.wait_for(self._queue.put(event), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            self.stats["rejected"] += 1
+            return 503, {"Retry-After": max(1, round(self.enqueue_timeout))}
+        return 202, {}
+
+    @staticmethod
+    async def _read_head(reader):
+        method, target, _ = (await reader.readuntil(b"\r\n")).decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = (await reader.readuntil(b"\r\n")).decode("latin-1")
+            if line == "\r\n":
+                return method, target, headers
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    async def _work(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            event = await self._queue.get()
+            try:
+                for pattern, handler in self._handlers:
+                    if not fnmatch.fnmatchcase(event.name, pattern):
+                        continue
+                    try:
+                        if asyncio.iscoroutinefunction(handler):
+                            await handler(event)
+                        else:
+                            await loop.run_in_executor(None, handler, event)
+                    except Exception as e:
+                        self.stats["failed"] += 1
+                        if self.on_error is not None:
+                            self.on_error(event, e)
+                        else:
+                            logger.exception("Webhook handler %r failed for %r", handler, event)
+                self.stats["processed"] += 1
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,225 @@
+# adesk/webhook_sync.py
+import json
+
+from .exceptions import AdeskNotFoundError
+
+
+def _find_by_id(objects, object_id):
+    return next((obj for obj in objects or [] if obj.id == object_id), None)
+
+
+# Mirror kind -> (webhook entity names, fields of a complete object, refetch(client, id)).
+# Projects and categories have no single-object endpoint, so they are looked up in the list.
+_KINDS = {
+    "operations": (("transaction", "operation"), ("id", "amount", "type", "bankAccount"),
+                   lambda client, object_id: client.operations.get(object_id)),
+    "projects": (("project",), ("id", "name"),
+                 lambda client, object_id: _find_by_id(client.projects.list(), object_id)),
+    "contractors": (("contractor",), ("id", "name"),
+                    lambda client, object_id: client.contractors.get(object_id)),
+    "bank_accounts": (("bank_account", "bankaccount"), ("id", "name"),
+                      lambda client, object_id: client.bank_accounts.get(object_id)),
+    "categories": (("category", "transaction_category"), ("id", "name"),
+                   lambda client, object_id: _find_by_id(client.transaction_categories.list(), object_id)),
+}
+# Other operation fields stored by the mirror: a payload must carry them, even as null, to be complete.
+_OPERATION_FIELDS = ("description", "category", "contractor", "project")
+_ENTITIES = {entity: kind for kind, (entities, _, _) in _KINDS.items() for entity in entities}
+_UPSERT_ACTIONS = ("created", "updated", "changed", "restored", "completed")
+_DELETE_ACTIONS = ("deleted", "removed")
+
+
+def _is_complete(kind, obj, required):
+    if any(obj.get(field) is None for field in required):
+        return False
+    if kind == "operations":
+        return bool(obj.get("dateIso") or obj.get("date")) and all(field in obj for field in _OPERATION_FIELDS)
+    return True
+
+
+def _camel(name):
+    head, *rest = name.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+def _models():
+    # Imported here, like the client's lazy resources.
+    from .models import Operation, Project, Contractor, BankAccount, TransactionCategory
+    return {"operations": Operation, "projects": Project, "contractors": Contractor,
+            "bank_accounts": BankAccount, "categories": TransactionCategory}
+
+
+class WebhookEvent:
+    """
+    A parsed Adesk webhook event.
+
+    Attributes:
+        name (str): The event name (e.g., "transaction_updated").
+        kind (str | None): The kind of object concerned ("operations", "projects", "contractors",
+                           "bank_accounts", "categories"), or None if unknown.
+        action (str | None): "upsert" for created/updated objects, "delete" for deleted ones,
+                             or None if unknown.
+        data (list[dict]): Raw data of the objects carried (at least their `id`).
+        payload (dict): The whole webhook body.
+    """
+    def __init__(self, name, kind, action, data, payload):
+        self.name = name
+        self.kind = kind
+        self.action = action
+        self.data = data
+        self.payload = payload
+
+    @property
+    def objects(self):
+        """list[BaseModel]: The objects carried, as models (`Operation`, `Project`, ...)."""
+        model_class = _models().get(self.kind)
+        return [model_class(data) for data in self.data] if model_class else []
+
+    def __repr__(self):
+        return f"<WebhookEvent(name='{self.name}', kind='{self.kind}', ids={[d.get('id') for d in self.data]})>"
+
+
+def parse_event(payload):
+    """
+    Parses a webhook body.
+
+    The event name is read from the `event` (or `type`) field; the objects from `data`,
+    `object` or a field named after the entity (e.g., `transaction`, `bankAccounts`), or
+    the `id` of the payload itself.
+
+    Args:
+        payload (dict | str | bytes): The webhook body, parsed or as received.
+
+    Returns:
+        WebhookEvent: The event; `kind` and `action` are None for unknown events.
+
+    Raises:
+        ValueError: If the body is not a JSON object.
+    """
+    if isinstance(payload, (bytes, str)):
+        payload = json.loads(payload)
+    if not isinstance(payload, dict):
+        raise ValueError("A webhook body must be a JSON object.")
+    name = payload.get("event") or payload.get("type") or ""
+    entity, _, verb = name.lower().rpartition("_")
+    kind = _ENTITIES.get(entity)
+    if kind is None or verb not in _UPSERT_ACTIONS + _DELETE_ACTIONS:
+        return WebhookEvent(name, None, None, [], payload)
+    action = "delete" if verb in _DELETE_ACTIONS else "upsert"
+
+    names = ("data", "object") + tuple(field for entity in _KINDS[kind][0]
+                                       for field in (entity, _camel(entity), entity + "s", _camel(entity) + "s"))
+    objects = next((payload[field] for field in names if payload.get(field) is not None),
+                   [payload["id"]] if payload.get("id") is not None else [])
+    objects = objects if isinstance(objects, list) else [objects]
+    return WebhookEvent(name, kind, action, [obj if isinstance(obj, dict) else {"id": obj} for obj in objects], payload)
+
+
+class WebhookChange:
+    """
+    What `WebhookApplier.apply` did for one webhook event.
+
+    Attributes:
+        event (str): The event name (e.g., "transaction_updated").
+        kind (str): The mirror table affected ("operations", "projects", ...).
+        action (str): "upsert" or "delete".
+        ids (list[int]): IDs of the objects upserted or deleted.
+        refetched (list[int]): IDs whose payload was partial and that were fetched from the API.
+    """
+    def __init__(self, event, kind, action):
+        self.event = event
+        self.kind = kind
+        self.action = action
+        self.ids = []
+        self.refetched = []
+
+    def __repr__(self):
+        return (f"<WebhookChange(event='{self.event}', kind='{self.kind}', action='{self.action}', "
+                f"ids={self.ids}, refetched={self.refetched})>")
+
+
+class WebhookApplier:
+    """
+    Applies Adesk webhook payloads to local state, so a mirror stays current
+    without polling.
+
+    The event name (e.g., "transaction_created", "project_deleted", as
+    subscribed with `client.webhooks.create`) selects the object kind and
+    whether to upsert or delete it. The object(s) are read from the payload's
+    `data` (or entity-named) field. Objects missing fields needed locally are
+    fetched from the API; an object that no longer exists is deleted.
+
+    The target is a `LocalMirror`, or any object with the same
+    `upsert_operations`, `delete_operations`, `upsert_references` and
+    `delete_references` methods (e.g., an in-memory cache).
+
+    Example:
+        applier = WebhookApplier(client, mirror)
+
+        @app.post("/adesk-webhook")
+        def adesk_webhook(request):
+            applier.apply(request.body)
+    """
+    def __init__(self, client, target):
+        """
+        Initializes the WebhookApplier.
+
+        Args:
+            client (AdeskClient): The client used to fetch objects sent partially.
+            target (LocalMirror): Where changes are applied.
+        """
+        self.client = client
+        self.target = target
+
+    def apply(self, payload):
+        """
+        Applies one webhook event.
+
+        Args:
+            payload (WebhookEvent | dict | str | bytes): The event, or the webhook body (parsed
+                                                         or as received).
+
+        Returns:
+            WebhookChange | None: What was applied, or None for events of unknown kinds.
+        """
+        event = payload if isinstance(payload, WebhookEvent) else parse_event(payload)
+        if event.kind is None:
+            return None
+        kind = event.kind
+        change = WebhookChange(event.name, kind, event.action)
+        if event.action == "delete":
+            change.ids = [obj["id"] for obj in event.data]
+            self._delete(kind, change.ids)
+            return change
+
+        model_class = _models()[kind]
+        _, required, refetch = _KINDS[kind]
+        complete, gone = [], []
+        for obj in event.data:
+            if _is_complete(kind, obj, required):
+                complete.append(model_class(obj))
+                continue
+            try:
+                fetched = refetch(self.client, obj["id"])
+            except AdeskNotFoundError:
+                fetched = None
+            change.refetched.append(obj["id"])
+            if fetched is None:
+                gone.append(obj["id"])
+            else:
+                complete.append(fetched)
+        if complete:
+            if kind == "operations":
+                self.target.upsert_operations(complete)
+            else:
+                self.target.upsert_references(kind, complete)
+        if gone:
+            self._delete(kind, gone)
+        change.ids = [obj.id for obj in complete]
+        return change
+
+    def _delete(self, kind, ids):
+        if kind == "operations":
+            self.target.delete_operations(ids)
+        else:
+            self.target.delete_references(kind, ids)
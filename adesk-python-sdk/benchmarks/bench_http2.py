@@ -0,0 +1,191 @@
+"""
+Compares HTTP/1.1 connection pooling with HTTP/2 multiplexing when fanning out
+many `transaction/{id}` GETs, against local stand-ins of the Adesk API.
+
+Two stand-in servers run in a background event loop: a keep-alive HTTP/1.1
+server and a cleartext HTTP/2 (h2c) server. Both answer
+`GET /v1/transaction/<id>` after a simulated server-side latency and count the
+TCP connections they accept. The client side uses `AsyncHTTPXTransport`
+(HTTP/1.1) and `AsyncHTTP2Transport` (HTTP/2) through `AdeskClient.aget`, plus
+`Urllib3Transport` driven by a thread pool as a second HTTP/1.1 baseline.
+
+Usage:
+    python benchmarks/bench_http2.py --requests 500 --concurrency 50 --latency 0.02 --handshake 0.05
+
+Requires `httpx[http2]`. Connections are cleartext; `--handshake` delays the first
+response on every new connection to emulate TCP+TLS setup round-trips, which is
+where a single multiplexed HTTP/2 connection saves the most on a real network.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import h2.config # noqa: E402
+import h2.connection # noqa: E402
+import h2.events # noqa: E402
+
+from adesk import AdeskClient # noqa: E402
+from adesk.transports import AsyncHTTPXTransport, AsyncHTTP2Transport, Urllib3Transport # noqa: E402
+
+_PATH_ID = re.compile(rb"/transaction/(\d+)")
+
+
+def _body(path):
+    match = _PATH_ID.search(path)
+    operation_id = int(match.group(1)) if match else 0
+    return json.dumps({"transaction": {"id": operation_id, "amount": "100.00", "type": 1}}).encode("utf-8")
+
+
+class _StandInProtocol(asyncio.Protocol):
+    """Counts connections and emulates per-connection setup cost and per-request latency."""
+    def __init__(self, stats, latency, handshake):
+        self.stats = stats
+        self.latency = latency
+        self.handshake = handshake
+
+    def connection_made(self, transport):
+        self.stats["connections"] += 1
+        self.transport = transport
+        self.ready_at = asyncio.get_event_loop().time() + self.handshake
+
+    async def wait(self):
+        delay = self.ready_at - asyncio.get_event_loop().time()
+        await asyncio.sleep(max(delay, 0) + self.latency)
+
+
+class Http1Protocol(_StandInProtocol):
+    """Minimal keep-alive HTTP/1.1 server answering GET requests."""
+    def __init__(self, stats, latency, handshake):
+        super().__init__(stats, latency, handshake)
+        self.buffer = b""
+
+    def data_received(self, data):
+        self.buffer += data
+        while b"\r\n\r\n" in self.buffer:
+            head, self.buffer = self.buffer.split(b"\r\n\r\n", 1)
+            path = head.split(b" ", 2)[1]
+            asyncio.ensure_future(self.respond(path))
+
+    async def respond(self, path):
+        await self.wait()
+        body = _body(path)
+        self.transport.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                             b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+
+
+class Http2Protocol(_StandInProtocol):
+    """Minimal cleartext HTTP/2 server answering GET requests on concurrent streams."""
+    def __init__(self, stats, latency, handshake):
+        super().__init__(stats, latency, handshake)
+        self.conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+
+    def connection_made(self, transport):
+        super().connection_made(transport)
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                path = dict(event.headers)[b":path"]
+                asyncio.ensure_future(self.respond(event.stream_id, path))
+            elif isinstance(event, h2.events.DataReceived):
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self.transport.close()
+        self.transport.write(self.conn.data_to_send())
+
+    async def respond(self, stream_id, path):
+        await self.wait()
+        body = _body(path)
+        self.conn.send_headers(stream_id, [(":status", "200"), ("content-type", "application/json"),
+                                           ("content-length", str(len(body)))])
+        self.conn.send_data(stream_id, body, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+def start_servers(latency, handshake):
+    """Starts both stand-ins in a background loop; returns their ports and connection counters."""
+    loop = asyncio.new_event_loop()
+    stats = {"http1": {"connections": 0}, "http2": {"connections": 0}}
+    ports = {}
+
+    async def serve():
+        for name, protocol in (("http1", Http1Protocol), ("http2", Http2Protocol)):
+            server = await loop.create_server(lambda p=protocol, s=stats[name]: p(s, latency, handshake), "127.0.0.1", 0)
+            ports[name] = server.sockets[0].getsockname()[1]
+
+    loop.run_until_complete(serve())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return ports, stats
+
+
+async def fan_out(async_transport, port, requests, concurrency):
+    client = AdeskClient("bench-token", base_url=f"http://127.0.0.1:{port}/v1/",
+                         base_url_v2=f"http://127.0.0.1:{port}/v2/", async_transport=async_transport)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(operation_id):
+        async with semaphore:
+            return await client.aget(f"transaction/{operation_id}")
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(fetch(i) for i in range(1, requests + 1)))
+    elapsed = time.perf_counter() - started
+    assert all(r["transaction"]["id"] == i for i, r in enumerate(results, 1))
+    # One more request to report which protocol the transport actually negotiated.
+    probe = await async_transport.request("GET", f"{client.base_url}transaction/0")
+    await client.aclose()
+    return elapsed, probe.http_version
+
+
+def fan_out_threads(transport, port, requests, concurrency):
+    client = AdeskClient("bench-token", base_url=f"http://127.0.0.1:{port}/v1/",
+                         base_url_v2=f"http://127.0.0.1:{port}/v2/", transport=transport)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda i: client.get(f"transaction/{i}"), range(1, requests + 1)))
+    elapsed = time.perf_counter() - started
+    assert all(r["transaction"]["id"] == i for i, r in enumerate(results, 1))
+    client.close()
+    return elapsed, "HTTP/1.1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated server latency, seconds")
+    parser.add_argument("--handshake", type=float, default=0.0, help="simulated connection setup, seconds")
+    args = parser.parse_args()
+
+    ports, stats = start_servers(args.latency, args.handshake)
+    runs = (
+        ("HTTP/1.1 urllib3+threads", "http1",
+         lambda: fan_out_threads(Urllib3Transport(maxsize=args.concurrency), ports["http1"], args.requests, args.concurrency)),
+        ("HTTP/1.1 httpx pool", "http1",
+         lambda: asyncio.run(fan_out(AsyncHTTPXTransport(http2=False, max_connections=args.concurrency),
+                                     ports["http1"], args.requests, args.concurrency))),
+        ("HTTP/2 multiplexed", "http2",
+         lambda: asyncio.run(fan_out(AsyncHTTP2Transport(prior_knowledge=True, max_connections=args.concurrency),
+                                     ports["http2"], args.requests, args.concurrency))),
+    )
+    print(f"{args.requests} GETs, concurrency {args.concurrency}, server latency {args.latency * 1000:.0f} ms, "
+          f"connection setup {args.handshake * 1000:.0f} ms")
+    for label, name, run in runs:
+        connections_before = stats[name]["connections"]
+        elapsed, version = run()
+        print(f"{label:<26} {elapsed:7.3f} s  {args.requests / elapsed:8.0f} req/s  "
+              f"connections: {stats[name]['connections'] - connections_before:<4} protocol: {version}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Measures the start-up cost of the SDK with `python -X importtime` and checks it
+against a budget, so that regressions in import time fail CI.
+
+The statement (by default `import adesk; adesk.AdeskClient('token')`) runs in a
+fresh interpreter a few times; the cumulative import time of the `adesk`
+package is taken from the best run, and the slowest modules imported along the
+way are listed to help find what made it regress.
+
+Usage:
+    python benchmarks/bench_import.py --budget-ms 25
+    python benchmarks/bench_import.py --statement "import adesk; adesk.AdeskClient('t').projects" --top 15
+
+Exits with status 1 if the measured time exceeds `--budget-ms`.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+DEFAULT_STATEMENT = "import adesk; adesk.AdeskClient('token')"
+DEFAULT_BUDGET_MS = 25.0
+
+# "import time:  self [us] | cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def import_times(statement):
+    """
+    Runs `statement` in a fresh interpreter with `-X importtime`.
+
+    Returns:
+        tuple[float, dict]: Seconds spent importing the `adesk` package (and everything it
+                            imported) plus the imports triggered later by the statement,
+                            and `{module: (self_us, cumulative_us)}` for those imports.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    modules = {}
+    group = {}
+    total_us = 0
+    started = False
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = int(match.group(1)), int(match.group(2)), match.group(3), match.group(4)
+        group[name] = (self_us, cumulative_us)
+        if len(indent) > 1:
+            continue
+        # Imports are reported children-first, so a top-level entry closes a group. The
+        # `adesk` entry closes the import of the SDK; every later group was triggered
+        # by the statement itself (client construction, resource access, ...).
+        if started or name == "adesk":
+            started = True
+            total_us += cumulative_us
+            modules.update(group)
+        group = {}
+    return total_us / 1e6, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statement", default=DEFAULT_STATEMENT, help="code to time in a fresh interpreter")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="maximum allowed import time")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to start; the best run counts")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest modules to list")
+    args = parser.parse_args()
+
+    runs = [import_times(args.statement) for _ in range(args.runs)]
+    best, modules = min(runs, key=lambda run: run[0])
+    print(f"{args.statement!r}: {best * 1000:.1f} ms (best of {args.runs}), budget {args.budget_ms:.1f} ms")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for name, (self_us, cumulative_us) in sorted(modules.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"{self_us / 1000:9.2f} {cumulative_us / 1000:9.2f}  {name}")
+    if best * 1000 > args.budget_ms:
+        print(f"FAIL: import time {best * 1000:.1f} ms exceeds the budget of {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
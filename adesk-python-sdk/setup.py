@@ -30,6 +30,10 @@ setuptools.setup(
     install_requires=[
         'requests', # From requirements.txt
     ],
+    extras_require={
+        'http2': ['httpx[http2]'], # HTTPXTransport / AsyncHTTPXTransport
+        'pandas': ['pandas'], # LocalMirror.list_frame
+    },
     classifiers=[
         'Development Status :: 3 - Alpha', # Initial version
         'Intended Audience :: Developers',
@@ -0,0 +1,8 @@
+class FakeClock:
+    """Time source for `clock=` arguments; tests move it by setting `now`."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
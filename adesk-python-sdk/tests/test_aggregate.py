@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from adesk_python_sdk.adesk.aggregate import DIMENSIONS, PERIODS, Aggregation, aggregate
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.mirror import LocalMirror
+from adesk_python_sdk.adesk.models import Operation
+from adesk_python_sdk.adesk.transports import FakeTransport
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+class TestAggregate(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.operations = [
+            {"id": 1, "dateIso": "2024-01-31", "type": 1, "amount": "100.10", "category": {"id": 5}, "project": {"id": 7}},
+            {"id": 2, "dateIso": "2024-02-05", "type": 2, "amount": "40", "category": {"id": 6}, "project": {"id": 7}},
+            {"id": 3, "dateIso": "2024-02-07", "type": 1, "amount": "60", "category": {"id": 5}},
+            {"id": 4, "date": "01.04.2024", "type": 2, "amount": "15.5", "category": {"id": 6},
+             "bankAccount": {"id": 3, "legalEntity": {"id": 9}}},
+        ]
+        client = AdeskClient(api_token="token", transport=FakeTransport())
+        self.mirror = LocalMirror(client, os.path.join(self.tmp, "mirror.db"))
+        self.mirror.upsert_operations(Operation.from_list(self.operations))
+
+    def tearDown(self):
+        self.mirror.close()
+        shutil.rmtree(self.tmp)
+
+    def sources(self):
+        yield "mirror", self.mirror
+        yield "operations", Operation.from_list(self.operations)
+        yield "dicts", self.operations
+        if pandas is not None:
+            yield "frame", self.mirror.list_frame()
+
+    def test_group_by_category_and_month(self):
+        for name, source in self.sources():
+            with self.subTest(source=name):
+                result = aggregate(source, by="category", period="month")
+                self.assertEqual(result.keys, ("period", "category"))
+                self.assertEqual(result.rows(), [
+                    {"period": "2024-01", "category": 5, "count": 1, "income": 100.1, "outcome": 0.0, "net": 100.1},
+                    {"period": "2024-02", "category": 5, "count": 1, "income": 60.0, "outcome": 0.0, "net": 60.0},
+                    {"period": "2024-02", "category": 6, "count": 1, "income": 0.0, "outcome": 40.0, "net": -40.0},
+                    {"period": "2024-04", "category": 6, "count": 1, "income": 0.0, "outcome": 15.5, "net": -15.5},
+                ])
+
+    def test_periods_and_dimensions_agree_across_sources(self):
+        for period in ("day", "week", "quarter", "year"):
+            expected = aggregate(self.operations, by=("project", "legal_entity", "type"), period=period).groups
+            for name, source in self.sources():
+                with self.subTest(source=name, period=period):
+                    self.assertEqual(aggregate(source, by=("project", "legal_entity", "type"), period=period).groups,
+                                     expected)
+        weeks = aggregate(self.operations, period="week")
+        self.assertEqual(sorted(key for key, in weeks.groups), ["2024-01-29", "2024-02-05", "2024-04-01"])
+        self.assertEqual(sorted(key for key, in aggregate(self.mirror, period="quarter").groups),
+                         ["2024-Q1", "2024-Q2"])
+
+    def test_pivot_rollup_and_total(self):
+        result = self.mirror.aggregate(by=("category", "project"), period="month")
+        self.assertEqual(result.pivot("category", "period"),
+                         {5: {"2024-01": 100.1, "2024-02": 60.0}, 6: {"2024-02": -40.0, "2024-04": -15.5}})
+        self.assertEqual(result.rollup("project").groups, {(7,): (2, 100.1, 40.0), (None,): (2, 60.0, 15.5)})
+        self.assertEqual(result.total, {"count": 4, "income": 160.1, "outcome": 55.5, "net": 104.6})
+
+    def test_mirror_filters(self):
+        result = self.mirror.aggregate(by="category", range_start="2024-02-01", type="outcome")
+        self.assertEqual(result.groups, {(6,): (2, 0.0, 55.5)})
+        self.assertEqual(len(self.mirror.aggregate(category=99)), 0)
+        with self.assertRaises(ValueError):
+            aggregate(self.operations, category=5)
+        with self.assertRaises(ValueError):
+            aggregate(self.operations, by="colour")
+
+    @unittest.skipIf(pandas is None, "pandas is not installed")
+    def test_frame_matches_operations(self):
+        frame = self.mirror.list_frame()
+        for by in ((), ("category",), ("project", "legal_entity", "type"), tuple(sorted(DIMENSIONS))):
+            for period in (None,) + tuple(PERIODS):
+                with self.subTest(by=by, period=period):
+                    expected = aggregate(self.operations, by=by, period=period)
+                    result = aggregate(frame, by=by, period=period)
+                    self.assertEqual(result.rows(), expected.rows())
+        table = aggregate(frame, by="category", period="month").to_frame()
+        self.assertEqual(list(table.columns), ["period", "category", "count", "income", "outcome", "net"])
+        self.assertEqual(len(aggregate(frame.iloc[0:0], by="category")), 0)
+
+    def test_empty(self):
+        self.assertEqual(aggregate([]).total, {"count": 0, "income": 0.0, "outcome": 0.0, "net": 0.0})
+        self.assertIsInstance(aggregate([], by="category"), Aggregation)
+
+
+if __name__ == '__main__':
+    unittest.main()
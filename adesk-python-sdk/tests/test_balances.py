@@ -0,0 +1,91 @@
+import random
+import unittest
+
+from adesk_python_sdk.adesk.balances import BalanceIndex, _Fenwick
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.models import BankAccount, Operation
+from adesk_python_sdk.adesk.transports import FakeTransport
+
+
+def operation(id, date, type, amount, account=1, **extra):
+    data = {"id": id, "dateIso": date, "type": type, "amount": amount, "bankAccount": {"id": account}}
+    data.update(extra)
+    return Operation(data)
+
+
+class TestBalanceIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.accounts = [BankAccount({"id": 1, "initialAmount": "1000", "initialAmountDate": "01.01.2024"}),
+                         BankAccount({"id": 2, "initialAmount": "50", "currency": "USD"})]
+        self.balances = BalanceIndex(self.accounts, [
+            operation(1, "2024-01-05", 1, "200"),
+            operation(2, "2024-01-10", 2, "50.5"),
+            operation(3, "2023-12-31", 1, "999"),                        # before the opening date
+            operation(4, "2024-02-01", 1, "70", isPlanned=True),
+            operation(5, "2024-01-07", 1, "9000", account=2, bankAccountAmount="100"),
+        ])
+
+    def test_balance_at_date(self):
+        self.assertIsNone(self.balances.balance(1, "2023-12-31"))
+        self.assertEqual(self.balances.balance(1, "2024-01-01"), 1000.0)
+        self.assertEqual(self.balances.balance(1, "05.01.2024"), 1200.0)
+        self.assertEqual(self.balances.balance(1, "2024-01-10"), 1149.5)
+        self.assertEqual(self.balances.balance(1, "2030-01-01"), 1149.5)
+        self.assertEqual(self.balances.balances(), {1: 1149.5, 2: 150.0})
+        self.assertEqual(self.balances.balance(2, "2024-01-06"), 50.0)
+        self.assertIsNone(self.balances.balance(99))
+
+    def test_incremental_updates(self):
+        self.balances.add([operation(6, "2025-06-01", 2, "100"),          # beyond the indexed days
+                           operation(1, "2024-01-05", 1, "300")])         # replaces operation 1
+        self.assertEqual(self.balances.balance(1, "2024-01-05"), 1300.0)
+        self.assertEqual(self.balances.balance(1), 1149.5)
+        self.assertEqual(self.balances.remove([2, 6, 42]), 2)
+        self.assertEqual(self.balances.balance(1), 1300.0)
+
+        self.balances.add([operation(7, "2023-06-01", 1, "5", account=3), operation(8, "2023-05-01", 1, "1", account=3)])
+        self.assertEqual(self.balances.balance(3, "2023-05-31"), 1.0)
+        self.balances.set_accounts([BankAccount({"id": 3, "initialAmount": 10, "initialAmountDate": "2023-05-15"})])
+        self.assertEqual(self.balances.balance(3), 15.0)
+
+    def test_series(self):
+        self.assertEqual(self.balances.series(1, "2024-01-04", "2024-01-06"),
+                         [("2024-01-04", 1000.0), ("2024-01-05", 1200.0), ("2024-01-06", 1200.0)])
+        self.assertEqual(self.balances.series(1, "2024-01-01", "2024-01-16", step="week"),
+                         [("2024-01-07", 1200.0), ("2024-01-14", 1149.5), ("2024-01-16", 1149.5)])
+        self.assertEqual([day for day, _ in self.balances.series(1, "2024-01-15", "2024-03-10", step="month")],
+                         ["2024-01-31", "2024-02-29", "2024-03-10"])
+
+    def test_include_planned(self):
+        balances = BalanceIndex(self.accounts, [operation(4, "2024-02-01", 1, "70", isPlanned=True)],
+                                include_planned=True)
+        self.assertEqual(balances.balance(1), 1070.0)
+
+    def test_from_client_pages_through_operations(self):
+        operations = [{"id": n, "dateIso": "2024-01-05", "type": 1, "amount": 1, "bankAccount": {"id": 1}}
+                      for n in range(1, 6)]
+
+        def page(request):
+            start, length = int(request.params["start"]), int(request.params["length"])
+            return {"transactions": operations[start:start + length]}
+
+        fake = FakeTransport()
+        fake.add("GET", "bank-accounts", {"bankAccounts": [{"id": 1, "initialAmount": "10"}]})
+        fake.add("GET", "transactions", handler=page)
+        balances = BalanceIndex.from_client(AdeskClient(api_token="token", transport=fake), page_size=2)
+
+        self.assertEqual(balances.balance(1), 15.0)
+        self.assertEqual(len([call for call in fake.calls if call.path.endswith("transactions")]), 3)
+
+    def test_fenwick_prefix_sums(self):
+        values = [random.randint(-100, 100) for _ in range(100)]
+        tree = _Fenwick(values)
+        tree.add(10, 5)
+        values[10] += 5
+        for index in (0, 10, 57, 99, 150):
+            self.assertEqual(tree.prefix(index), sum(values[:index + 1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
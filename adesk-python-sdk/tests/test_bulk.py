@@ -0,0 +1,142 @@
+import threading
+import time
+import unittest
+
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.bulk import run_bulk
+from adesk_python_sdk.adesk.rate_limit import RateLimiter
+from adesk_python_sdk.adesk.exceptions import AdeskBadRequestError
+from adesk_python_sdk.adesk.models import Operation
+from adesk_python_sdk.adesk.transports import FakeTransport
+
+
+class TestRunBulk(unittest.TestCase):
+
+    def test_results_keep_input_order_with_bounded_concurrency(self):
+        in_flight, peak, lock = [0], [0], threading.Lock()
+
+        def work(n):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.001 * (n % 3))
+            with lock:
+                in_flight[0] -= 1
+            if n == 5:
+                raise RuntimeError("boom")
+            return n * 10
+
+        progress = []
+        results = list(run_bulk(work, iter(range(20)), concurrency=3, on_result=progress.append))
+
+        self.assertEqual([r.index for r in results], list(range(20)))
+        self.assertEqual([r.result for r in results if r.ok], [n * 10 for n in range(20) if n != 5])
+        self.assertIsInstance(results[5].error, RuntimeError)
+        self.assertEqual(progress, results)
+        self.assertLessEqual(peak[0], 3)
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            list(run_bulk(str, [1], concurrency=0))
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_reserve_spaces_requests_after_burst(self):
+        now = [0.0]
+        limiter = RateLimiter(2, burst=3, clock=lambda: now[0])
+        self.assertEqual([limiter.reserve() for _ in range(5)], [0.0, 0.0, 0.0, 0.5, 1.0])
+        now[0] = 10.0
+        self.assertEqual(limiter.reserve(), 0.0)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
+
+
+class TestOperationsBulkCreate(unittest.TestCase):
+
+    def setUp(self):
+        self.fake = FakeTransport()
+        self.next_id = iter(range(100, 1000))
+
+        def create(request):
+            if request.data["amount"] == "-1":
+                return 400, {"success": False, "message": "Invalid amount"}
+            return {"success": True, "transaction": {"id": next(self.next_id), "amount": request.data["amount"],
+                                                     "description": request.data.get("description")}}
+
+        self.fake.add("POST", "transaction", handler=create)
+        self.client = AdeskClient(api_token="token", transport=self.fake, rate_limit=1000)
+
+    def test_partial_failure_keeps_successes(self):
+        rows = [{"date": "2024-01-15", "type": "income", "amount": str(n), "bank_account": 1, "description": f"row {n}"}
+                for n in (10, -1, 30)]
+        rows.append({"date": "2024-01-15", "type": "income"}) # missing amount/bank_account
+
+        results = list(self.client.operations.bulk_create(rows, concurrency=2))
+
+        self.assertEqual([r.ok for r in results], [True, False, True, False])
+        self.assertIsInstance(results[0].result, Operation)
+        self.assertEqual(results[2].result.description, "row 30")
+        self.assertIsInstance(results[1].error, AdeskBadRequestError)
+        self.assertIsInstance(results[3].error, TypeError)
+        self.assertEqual(len(self.fake.calls), 3)
+
+    def test_rows_as_objects(self):
+        source = Operation({"amount": "12.5", "date": "01.02.2024", "dateIso": "2024-02-01T00:00:00",
+                            "type": 2, "description": "copy",
+                            "bankAccount": {"id": 7}, "tags": [{"id": 1}, {"id": 2}]})
+
+        result = next(self.client.operations.bulk_create([source]))
+
+        self.assertTrue(result.ok, result.error)
+        sent = self.fake.calls[0].data
+        self.assertEqual((sent["type"], sent["bank_account"], sent["tags"], sent["amount"]), ("outcome", 7, "1,2", 12.5))
+        self.assertEqual(sent["date"], "2024-02-01")
+
+
+class TestOperationsBulkUpdateDelete(unittest.TestCase):
+
+    def setUp(self):
+        self.fake = FakeTransport()
+        self.fake.add("GET", "transaction/{id}", handler=lambda request, id: {"transaction": {
+            "id": int(id), "amount": "50.00", "dateIso": "2024-03-01T00:00:00", "bankAccount": {"id": 3}}})
+        self.fake.add("POST", "transaction/{id}", handler=lambda request, id: {"transaction": {"id": int(id)}})
+        self.fake.add("POST", "transaction/{id}/remove", {"success": True})
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+
+    def posted(self):
+        return {int(c.path.split("/")[-1]): c.data for c in self.fake.calls if c.method == "POST"}
+
+    def test_update_fills_required_fields_from_cache_or_get(self):
+        cache = {1: Operation({"id": 1, "amount": "10", "dateIso": "2024-01-02T00:00:00", "bankAccount": {"id": 9}})}
+        progress = []
+
+        results = list(self.client.operations.bulk_update(
+            [(1, {"category": 5}), (2, {"category": 5}), (3, {"category": 5, "date": "2024-05-05", "amount": 1,
+                                                              "bank_account": 1})],
+            cache=cache, periodic_edit_type="this", on_progress=progress.append))
+
+        self.assertTrue(all(r.ok for r in results), results)
+        self.assertEqual(len(progress), 3)
+        sent = self.posted()
+        self.assertEqual((sent[1]["date"], sent[1]["bank_account"], sent[1]["amount"]), ("2024-01-02", 9, 10.0))
+        self.assertEqual((sent[2]["date"], sent[2]["bank_account"], sent[2]["amount"]), ("2024-03-01", 3, 50.0))
+        self.assertEqual(sent[3]["date"], "2024-05-05")
+        self.assertTrue(all(data["periodic_edit_type"] == "this" for data in sent.values()))
+        self.assertIn(2, cache)
+        self.assertEqual([c.method for c in self.fake.calls].count("GET"), 1)
+
+    def test_delete_sends_periodic_edit_type(self):
+        results = list(self.client.operations.bulk_delete(
+            [1, (2, {"periodic_edit_type": "this"})], periodic_edit_type="this-and-following"))
+
+        self.assertTrue(all(r.ok for r in results))
+        calls = {c.path.split("/")[-2]: c.data for c in self.fake.calls}
+        self.assertEqual(calls["1"]["periodic_edit_type"], "this-and-following")
+        self.assertEqual(calls["2"]["periodic_edit_type"], "this")
+
+
+if __name__ == '__main__':
+    unittest.main()
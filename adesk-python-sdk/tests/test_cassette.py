@@ -0,0 +1,112 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.models import Operation, CustomReportValueList
+from adesk_python_sdk.adesk.transports import RecordingTransport, ReplayTransport, CassetteMissError
+from adesk_python_sdk.adesk.transports.cassette import _Scrubber
+
+
+def make_response(payload, status_code=200):
+    response = requests.models.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode("utf-8")
+    response.headers["Content-Type"] = "application/json"
+    response.encoding = "utf-8"
+    return response
+
+
+class TestCassetteTransports(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "cassette.jsonl.gz")
+        self.operations_payload = {"transactions": [{"id": 1, "amount": "10.5", "type": 1}, {"id": 2, "amount": "3"}]}
+        self.values_payload = {"success": True, "itemsCount": 1, "values": [{"id": 7, "entryId": 3, "amount": "1"}]}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def record(self):
+        responses = [make_response(self.operations_payload), make_response(self.values_payload)]
+        with patch("requests.request", side_effect=responses):
+            with RecordingTransport(self.path) as transport:
+                client = AdeskClient(api_token="secret-token", transport=transport)
+                client.operations.list_all(range_start="2024-01-01")
+                client.v2.custom_report_values.list(month="2024-01")
+
+    def test_record_scrubs_token(self):
+        self.record()
+        with open(self.path, "rb") as fh:
+            raw = fh.read()
+        import gzip
+        text = gzip.decompress(raw).decode("utf-8")
+        self.assertNotIn("secret-token", text)
+        self.assertEqual(len(text.strip().splitlines()), 3) # header + 2 interactions
+
+    def test_scrubber_is_thread_safe(self):
+        scrubber, errors = _Scrubber(), []
+
+        def collect(n):
+            for i in range(300):
+                scrubber.collect({"api_token": f"token-{n}-{i:04d}"}, None, None)
+
+        def scrub():
+            try:
+                for _ in range(300):
+                    scrubber.text("https://api.adesk.ru/v1/transactions?api_token=token-0-0000")
+            except RuntimeError as e: # "Set changed size during iteration"
+                errors.append(e)
+
+        threads = [threading.Thread(target=collect, args=(n,)) for n in range(4)] + [threading.Thread(target=scrub)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertNotIn("token-3-0299", scrubber.text("?api_token=token-3-0299"))
+
+    def test_replay_with_any_token(self):
+        self.record()
+        client = AdeskClient(api_token="other-token", transport=ReplayTransport(self.path))
+        with patch("requests.request") as mock_request:
+            operations = client.operations.list_all(range_start="2024-01-01")
+            values = client.v2.custom_report_values.list(month="2024-01")
+            mock_request.assert_not_called()
+
+        self.assertEqual([op.id for op in operations], [1, 2])
+        self.assertTrue(all(isinstance(op, Operation) for op in operations))
+        self.assertEqual(operations[0].amount, 10.5)
+        self.assertIsInstance(values, CustomReportValueList)
+        self.assertEqual(values.values[0].entry_id, 3)
+
+    def test_replay_repeats_last_response(self):
+        self.record()
+        client = AdeskClient(api_token="t", transport=ReplayTransport(self.path))
+        for _ in range(3):
+            self.assertEqual(len(client.operations.list_all(range_start="2024-01-01")), 2)
+
+    def test_replay_miss(self):
+        self.record()
+        client = AdeskClient(api_token="t", transport=ReplayTransport(self.path))
+        with self.assertRaises(CassetteMissError):
+            client.operations.list_all(range_start="2030-01-01")
+
+    def test_replay_realtime_sleeps(self):
+        self.record()
+        transport = ReplayTransport(self.path, realtime=True, speed=2.0)
+        client = AdeskClient(api_token="t", transport=transport)
+        with patch("time.sleep") as mock_sleep:
+            client.operations.list_all(range_start="2024-01-01")
+        self.assertEqual(mock_sleep.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,7 @@ from adesk_python_sdk.adesk.custom_reports import (
     CustomReportValues, 
     CustomReportDebtEntries
 )
+from adesk_python_sdk.adesk.exceptions import AdeskAPIError, AdeskBadRequestError, AdeskBulkError
 from adesk_python_sdk.adesk.models import (
     CustomReportGroup, 
     CustomReportEntry, 
@@ -161,5 +162,81 @@ class TestCustomReportValuesResource(unittest.TestCase): # New Test Class
         self.assertEqual(result.business_units_data[0]['name'], "BU Alpha")
 
 
+    def _fake_post_v2(self, endpoint, json_data=None):
+        if len(json_data) > 2:
+            raise AdeskAPIError("Payload Too Large", status_code=413)
+        if any(value.get("value") == "bad" for value in json_data):
+            raise AdeskBadRequestError("Invalid value", status_code=400)
+        return {"success": True, "data": [dict(value, id=value.get("id", 1000 + value["entryId"])) for value in json_data]}
+
+    def test_upsert_values_splits_and_routes(self):
+        self.mock_client.post_v2.side_effect = self._fake_post_v2
+        values = [{"entryId": n, "date": "2024-01-01", "value": n} for n in range(1, 6)]
+        values.append({"id": 77, "entryId": 9, "date": "2024-01-01", "value": 1})
+        index = {(2, "2024-01-01", None, None): 55}
+
+        result = self.custom_report_values_resource.upsert_values(values, chunk_size=4, concurrency=2, index=index)
+
+        self.assertTrue(all(isinstance(v, CustomReportValue) for v in result))
+        self.assertEqual(sorted(v.id for v in result), [55, 77, 1001, 1003, 1004, 1005])
+        updated = [c.kwargs["json_data"] for c in self.mock_client.post_v2.call_args_list
+                   if c.args[0] == "custom-report-values/update"]
+        self.assertEqual(updated, [[{"entryId": 2, "date": "2024-01-01", "value": 2, "id": 55},
+                                    {"id": 77, "entryId": 9, "date": "2024-01-01", "value": 1}]])
+        self.assertNotIn("id", values[1]) # inputs are not modified
+
+    def test_upsert_values_reports_failures_with_successes(self):
+        self.mock_client.post_v2.side_effect = self._fake_post_v2
+        values = [{"entryId": 1, "value": 1}, {"entryId": 2, "value": "bad"}, {"entryId": 3, "value": 3}]
+
+        with self.assertRaises(AdeskBulkError) as cm:
+            self.custom_report_values_resource.upsert_values(values)
+
+        self.assertEqual([v.id for v in cm.exception.results], [1001, 1003])
+        self.assertEqual([value for value, _ in cm.exception.failures], [values[1]])
+        self.assertIsInstance(cm.exception.failures[0][1], AdeskBadRequestError)
+
+    def test_sync_values_sends_only_changes(self):
+        stored = [
+            {"id": 1, "entryId": 1, "date": "2024-01-01", "amount": "100.00"},
+            {"id": 2, "entryId": 1, "date": "2024-02-01", "amount": "200.00"},
+            {"id": 3, "entryId": 1, "date": "2024-03-01", "amount": "300.00"},
+            {"id": 4, "entryId": 2, "date": "2024-01-01", "amount": "5.00", "projectId": 7},
+        ]
+
+        def get_v2(endpoint, params=None):
+            matching = [v for v in stored if v["entryId"] == params["entryId"]
+                        and params["dateFrom"] <= v["date"] <= params["dateTo"]]
+            start = (params["page"] - 1) * params["pageSize"]
+            return {"success": True, "totalItemsCount": len(matching), "values": matching[start:start + params["pageSize"]]}
+
+        self.mock_client.get_v2.side_effect = get_v2
+        self.mock_client.post_v2.side_effect = lambda endpoint, json_data=None: {
+            "success": True, "data": [dict(v, id=v.get("id", 99)) for v in json_data] if endpoint.endswith(("create", "update")) else []}
+        desired = [
+            {"entryId": 1, "date": "2024-01-01", "amount": 100},
+            {"entryId": 1, "date": "2024-02-01", "amount": 250},
+            {"entryId": 1, "date": "2024-04-01", "amount": 400},
+            {"entryId": 2, "date": "2024-01-01", "amount": 5, "project": 7},
+        ]
+
+        result = self.custom_report_values_resource.sync_values(desired)
+
+        self.assertEqual((len(result.creates), len(result.updates), result.removes, result.unchanged), (1, 1, [3], 2))
+        self.assertEqual(result.writes, 3)
+        posted = {c.args[0]: c.kwargs["json_data"] for c in self.mock_client.post_v2.call_args_list}
+        self.assertEqual(posted["custom-report-values/create"], [desired[2]])
+        self.assertEqual(posted["custom-report-values/update"], [dict(desired[1], id=2)])
+        self.assertEqual(posted["custom-report-values/remove"], [3])
+
+    def test_sync_values_dry_run_sends_nothing(self):
+        self.mock_client.get_v2.return_value = {"success": True, "totalItemsCount": 0, "values": []}
+
+        result = self.custom_report_values_resource.sync_values([{"entryId": 1, "date": "2024-01-01", "amount": 1}],
+                                                                dry_run=True)
+
+        self.assertEqual(len(result.creates), 1)
+        self.mock_client.post_v2.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
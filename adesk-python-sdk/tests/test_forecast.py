@@ -0,0 +1,81 @@
+import random
+import unittest
+from datetime import date
+
+from adesk_python_sdk.adesk.forecast import CashFlowForecast, RecurringChain, _IntervalIndex
+from adesk_python_sdk.adesk.models import Operation
+
+
+def periodic(id, day, chain, period, amount, type=2, **extra):
+    data = {"id": id, "dateIso": day, "type": type, "amount": amount, "isPeriodic": True,
+            "periodicChain": chain, "period": period}
+    data.update(extra)
+    return Operation(data)
+
+
+class TestCashFlowForecast(unittest.TestCase):
+
+    def setUp(self):
+        self.forecast = CashFlowForecast([
+            periodic(1, "2024-01-31", "rent", "month", "1000"),
+            periodic(2, "2024-02-29", "rent", "month", "1000"),          # the latest known: projected from here
+            periodic(3, "2024-03-04", "salary", "week", "500", type=1, repetitionEndDate="2024-03-25"),
+            periodic(4, "2024-01-15", "tax", "quarterly", "300"),
+            periodic(5, "2024-01-01", "odd", "fortnightly", "1"),         # unknown period: not projected
+            Operation({"id": 6, "dateIso": "2024-03-10", "type": 1, "amount": "2000"}),
+        ])
+
+    def test_chains(self):
+        chains = self.forecast.chains
+        self.assertEqual(sorted(chains), ["odd", "rent", "salary", "tax"])
+        self.assertEqual(chains["rent"].last, date(2024, 2, 29))
+        self.assertIsNone(chains["odd"].next_date)
+        def active(start, end):
+            return [chain.chain_id for chain in self.forecast.active_chains(start, end)]
+        self.assertEqual(active("2024-03-01", "2024-03-10"), [])
+        self.assertEqual(active("2024-03-12", "2024-03-20"), ["salary"])
+        self.assertEqual(active("2024-06-01", "2024-06-30"), ["rent", "tax"])
+
+    def test_occurrences_are_merged_by_date(self):
+        occurrences = [(operation.date_iso, operation._data["periodicChain"])
+                       for operation in self.forecast.occurrences("2024-05-31", start="2024-03-01")]
+        self.assertEqual(occurrences, [
+            ("2024-03-11", "salary"), ("2024-03-18", "salary"), ("2024-03-25", "salary"),
+            ("2024-03-29", "rent"), ("2024-04-15", "tax"), ("2024-04-29", "rent"), ("2024-05-29", "rent")])
+        operation = next(self.forecast.occurrences("2024-12-31", start="2024-03-20"))
+        self.assertIsNone(operation.id)
+        self.assertTrue(operation.is_planned)
+        self.assertEqual(operation.amount, 500.0)
+
+    def test_first_occurrence_is_computed_directly(self):
+        chain = RecurringChain("c", {"dateIso": "2000-01-31", "period": "month"})
+        self.assertEqual(list(chain.dates(date(2030, 2, 1), date(2030, 4, 30))),
+                         [date(2030, 2, 28), date(2030, 3, 31), date(2030, 4, 30)])
+        daily = RecurringChain("d", {"dateIso": "2000-01-01", "period": "daily"})
+        self.assertEqual(next(daily.dates(date(2030, 1, 1), date(2030, 1, 1))), date(2030, 1, 1))
+
+    def test_series(self):
+        series = self.forecast.series("2024-03-01", "2024-04-30", step="month", opening_balance=100)
+        self.assertEqual(series, [
+            {"period": "2024-03", "income": 4000.0, "outcome": 1000.0, "net": 3000.0, "balance": 3100.0},
+            {"period": "2024-04", "income": 0.0, "outcome": 1300.0, "net": -1300.0, "balance": 1800.0},
+        ])
+        self.forecast.remove([6])
+        self.assertEqual(self.forecast.series("2024-03-10", "2024-03-10"), [])
+
+
+class TestIntervalIndex(unittest.TestCase):
+
+    def test_matches_a_linear_scan(self):
+        intervals = []
+        for item in range(300):
+            start = random.randint(0, 1000)
+            intervals.append((start, start + random.randint(0, 200), item))
+        index = _IntervalIndex(intervals)
+        for start, end in [(0, 0), (100, 150), (500, 2000), (1300, 1400)]:
+            expected = sorted(item for low, high, item in intervals if low <= end and high >= start)
+            self.assertEqual(sorted(index.overlapping(start, end)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from adesk_python_sdk.adesk.batch_get import MissCache
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.exceptions import AdeskBulkError
+from adesk_python_sdk.adesk.mirror import LocalMirror
+from adesk_python_sdk.adesk.transports import FakeTransport
+
+from tests.helpers import FakeClock
+
+
+class TestGetMany(unittest.TestCase):
+
+    def setUp(self):
+        self.operations = {i: {"id": i, "dateIso": "2024-03-01", "type": 1, "amount": "10"} for i in range(1, 6)}
+        self.fake = FakeTransport()
+
+        def transaction(request, transaction_id):
+            if transaction_id == "99":
+                return 500, {"message": "Boom"}
+            operation = self.operations.get(int(transaction_id))
+            return (200, {"transaction": operation}) if operation else (404, {"message": "Not found"})
+
+        self.fake.add("GET", "transaction/{transaction_id}", handler=transaction)
+        self.fake.add("GET", "transactions", handler=lambda request: {"transactions": list(self.operations.values())})
+        self.fake.add("GET", "contractors", {"contractors": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]})
+        self.fake.add("GET", "contractor/{contractor_id}",
+                      handler=lambda request, contractor_id: (404, {"message": "Not found"}))
+        self.fake.add("GET", "projects", {"projects": [{"id": 30, "name": "Site"}]})
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+
+    def calls_to(self, prefix):
+        return [call.path for call in self.fake.calls if prefix in call.path]
+
+    def test_operations_are_fetched_once_and_misses_remembered(self):
+        cache = {}
+        found = self.client.operations.get_many([1, 2, 2, 42, None], cache=cache)
+
+        self.assertEqual(sorted(found), [1, 2])
+        self.assertEqual(found[2].id, 2)
+        self.assertEqual(sorted(cache), [1, 2])
+        self.assertEqual(len(self.calls_to("/transaction/")), 3)
+
+        self.fake.calls.clear()
+        self.assertEqual(sorted(self.client.operations.get_many([1, 2, 3, 42], cache=cache)), [1, 2, 3])
+        self.assertEqual(self.calls_to("/transaction/"), ["/v1/transaction/3"])
+
+    def test_operations_are_read_from_a_mirror(self):
+        tmp = tempfile.mkdtemp()
+        mirror = LocalMirror(self.client, os.path.join(tmp, "mirror.db"))
+        try:
+            mirror.upsert_operations([self.client.operations.get(i) for i in (1, 2, 3)])
+            self.fake.calls.clear()
+            found = self.client.operations.get_many([1, 2, 3, 4], mirror=mirror)
+            self.assertEqual(sorted(found), [1, 2, 3, 4])
+            self.assertEqual(len(self.calls_to("/transaction/")), 1)
+        finally:
+            mirror.close()
+            shutil.rmtree(tmp)
+
+    def test_failures_keep_partial_results(self):
+        with self.assertRaises(AdeskBulkError) as cm:
+            self.client.operations.get_many([1, 99])
+        self.assertEqual(list(cm.exception.results), [1])
+        self.assertEqual([object_id for object_id, _ in cm.exception.failures], [99])
+
+    def test_references_use_the_list_once(self):
+        found = self.client.contractors.get_many([1, 2, 3])
+        self.assertEqual(sorted(found), [1, 2])
+        self.assertEqual(len(self.calls_to("/contractors")), 1)
+        self.assertEqual(self.calls_to("/contractor/"), ["/v1/contractor/3"])
+
+        # The list is now cached in the registry and 3 is known to be missing.
+        self.fake.calls.clear()
+        self.assertEqual(sorted(self.client.contractors.get_many([2, 3])), [2])
+        self.assertEqual(self.fake.calls, [])
+
+    def test_projects(self):
+        self.assertEqual(sorted(self.client.projects.get_many([30, 31])), [30])
+
+
+class TestMissCache(unittest.TestCase):
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        misses = MissCache(ttl=10, clock=clock)
+        misses.add(1)
+        self.assertIn(1, misses)
+        clock.now = 10
+        self.assertNotIn(1, misses)
+        misses.add(2)
+        misses.discard(2)
+        self.assertNotIn(2, misses)
+
+
+class TestPrefetch(unittest.TestCase):
+
+    def setUp(self):
+        self.fake = FakeTransport()
+        self.fake.add("GET", "contractors", {"contractors": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]})
+        self.fake.add("GET", "contractor/{contractor_id}/commitments",
+                      handler=lambda request, contractor_id: {"commitments": [{"id": int(contractor_id) * 10}]})
+        self.fake.add("GET", "contractor/{contractor_id}/requisites",
+                      handler=lambda request, contractor_id: (500, {"message": "Boom"}) if contractor_id == "2"
+                      else {"requisites": [{"id": 7, "inn": "7701234567"}]})
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+
+    def test_list_attaches_related_data(self):
+        contractors = self.client.contractors.list_all(prefetch=["commitments"])
+        self.assertEqual([[c.id for c in contractor.commitments] for contractor in contractors], [[10], [20]])
+        self.assertIsNone(contractors[0].requisites)
+        self.assertEqual(len(self.fake.calls), 3)
+
+    def test_failures_are_reported_per_contractor(self):
+        with self.assertRaises(AdeskBulkError) as cm:
+            self.client.contractors.get_many([1, 2], prefetch=["commitments", "requisites"])
+        self.assertEqual([key for key, _ in cm.exception.failures], [(2, "requisites")])
+        contractor = self.client.registry.get("contractors", 1)
+        self.assertEqual(contractor.requisites[0].id, 7)
+        self.assertEqual(contractor.commitments[0].id, 10)
+
+    def test_unknown_related_data(self):
+        with self.assertRaises(ValueError):
+            self.client.contractors.prefetch([], ["balance"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.exceptions import AdeskBadRequestError, AdeskOutcomeUnknownError, AdeskRateLimitError
+from adesk_python_sdk.adesk.idempotency import (
+    IdempotentCreator, MemoryIdempotencyStore, SQLiteIdempotencyStore, marker_for, PENDING
+)
+from adesk_python_sdk.adesk.models import Operation
+from adesk_python_sdk.adesk.transports import FakeTransport
+
+
+class TestIdempotentCreator(unittest.TestCase):
+
+    def setUp(self):
+        self.fake = FakeTransport()
+        self.operations = []
+        self.failures = [] # statuses returned after applying the create
+
+        def create(request):
+            if request.data.get("amount") == "0":
+                return 400, {"message": "Invalid amount"}
+            operation = {"id": len(self.operations) + 1, "description": request.data.get("description"),
+                         "amount": request.data["amount"]}
+            self.operations.append(operation)
+            if self.failures:
+                return self.failures.pop(0), {"message": "Bad gateway"}
+            return {"success": True, "transaction": operation}
+
+        self.fake.add("POST", "transaction", handler=create)
+        self.fake.add("GET", "transactions", handler=lambda request: {"transactions": self.operations})
+        self.fake.add("POST", "transfer", 502, status=502)
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+        self.kwargs = {"date": "2024-01-15", "type": "income", "amount": "10", "bank_account": 1, "description": "Inv"}
+
+    def test_ambiguous_failure_is_resolved_by_lookup(self):
+        self.failures = [502]
+        creator = IdempotentCreator(self.client, backoff=0)
+
+        operation = creator.operation(key="k1", **self.kwargs)
+
+        self.assertEqual(len(self.operations), 1)
+        self.assertEqual(operation.id, 1)
+        self.assertEqual(operation.description, "Inv " + marker_for("k1"))
+
+    def test_same_key_returns_stored_result(self):
+        store = MemoryIdempotencyStore()
+        creator = IdempotentCreator(self.client, store)
+
+        first = creator.operation(key="k2", **self.kwargs)
+        second = creator.operation(key="k2", **self.kwargs)
+
+        self.assertEqual(len(self.operations), 1)
+        self.assertIsInstance(second, Operation)
+        self.assertEqual(second.id, first.id)
+
+    def test_rejected_create_forgets_key(self):
+        store = MemoryIdempotencyStore()
+        with self.assertRaises(AdeskBadRequestError):
+            IdempotentCreator(self.client, store).operation(key="k3", **dict(self.kwargs, amount="0"))
+        self.assertIsNone(store.get("k3"))
+
+    def test_unverifiable_transfer_stays_pending(self):
+        store = MemoryIdempotencyStore()
+        creator = IdempotentCreator(self.client, store, retries=0, backoff=0)
+        for _ in range(2): # the second call with the same key must not send the create again
+            with self.assertRaises(AdeskOutcomeUnknownError):
+                creator.transfer(key="t1", amount=5, from_bank_account=1, to_bank_account=2)
+        self.assertEqual(store.get("t1")[0], PENDING)
+        self.assertEqual(len([c for c in self.fake.calls if c.path.endswith("transfer")]), 1)
+
+    def test_throttled_transfer_releases_key(self):
+        statuses = [429]
+        self.fake.add("POST", "transfer", handler=lambda request: (statuses.pop(0), {"message": "Too many requests"})
+                      if statuses else {"success": True, "transfer": {"id": 3}})
+        store = MemoryIdempotencyStore()
+        creator = IdempotentCreator(self.client, store, retries=0, backoff=0)
+
+        with self.assertRaises(AdeskRateLimitError):
+            creator.transfer(key="t2", amount=5, from_bank_account=1, to_bank_account=2)
+        self.assertIsNone(store.get("t2"))
+        self.assertEqual(creator.transfer(key="t2", amount=5, from_bank_account=1, to_bank_account=2).id, 3)
+
+        with self.assertRaises(ValueError): # raised before sending: the key is released too
+            creator.transfer(key="t3", amount=5, from_bank_account=1, to_bank_account=None)
+        self.assertIsNone(store.get("t3"))
+
+    def test_lookup_pages_through_operations(self):
+        self.operations.extend({"id": n, "description": "other", "amount": "1"} for n in range(1, 1001))
+        self.fake.add("GET", "transactions", handler=lambda request: {"transactions": self.operations[
+            int(request.params["start"]):int(request.params["start"]) + int(request.params["length"])]})
+        self.failures = [502]
+
+        operation = IdempotentCreator(self.client, backoff=0).operation(key="k5", **self.kwargs)
+
+        self.assertEqual(operation.id, 1001)
+        self.assertEqual(len(self.operations), 1001)
+
+    def test_contractor_lookup_fetches_missing_descriptions(self):
+        marker = marker_for("c1")
+        self.fake.add("GET", "contractors", {"contractors": [{"id": 7, "name": "ACME"}]})
+        self.fake.add("GET", "contractor/{id}", handler=lambda request, id: {
+            "contractor": {"id": 7, "name": "ACME", "description": marker}})
+        store = MemoryIdempotencyStore()
+        store.put("c1", PENDING)
+
+        contractor = IdempotentCreator(self.client, store).contractor(key="c1", name="ACME")
+
+        self.assertEqual(contractor.id, 7)
+        self.assertFalse([c for c in self.fake.calls if c.method == "POST"])
+
+    def test_sqlite_store_survives_restart(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "keys.db")
+            store = SQLiteIdempotencyStore(path)
+            IdempotentCreator(self.client, store).operation(key="k4", **self.kwargs)
+            store.close()
+
+            store = SQLiteIdempotencyStore(path)
+            again = IdempotentCreator(self.client, store).operation(key="k4", **self.kwargs)
+            store.close()
+        finally:
+            shutil.rmtree(tmp)
+        self.assertEqual(again.id, 1)
+        self.assertEqual(len(self.operations), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.importer import OperationImporter, ImportJournal, read_csv, read_1c
+from adesk_python_sdk.adesk.transports import FakeTransport
+
+CSV = """date;amount;description;contractor;contractor_inn
+15.01.2024;1 500,00;Payment for invoice 1;ACME;7701000001
+15.01.2024;-200,50;Office rent;Landlord;7701000002
+16.01.2024;abc;Broken amount;;
+16.01.2024;-200,50;Office rent;Landlord;7701000002
+17.01.2024;300;Refund;ACME;7701000001
+"""
+
+ONE_C = """1CClientBankExchange
+ВерсияФормата=1.03
+СекцияДокумент=Платежное поручение
+Дата=20.02.2024
+Сумма=1000.00
+ПлательщикСчет=40702810000000000001
+Плательщик1=ООО Ромашка
+ПлательщикИНН=7701000003
+ПолучательСчет=40702810000000000099
+Получатель1=ООО Поставщик
+ПолучательИНН=7701000004
+НазначениеПлатежа=Оплата по счету 5
+КонецДокумента
+КонецФайла
+"""
+
+
+class TestOperationImporter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmp, "statement.csv")
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write(CSV)
+        self.journal_path = os.path.join(self.tmp, "statement.journal")
+        self.fake = FakeTransport()
+        self.created = []
+        self.fail_descriptions = set()
+
+        self.applied_then_failed = set()
+
+        def create(request):
+            text = (request.data.get("description") or "").split(" [idem:")[0]
+            if text in self.fail_descriptions:
+                return 500, {"message": "Temporary failure"}
+            self.created.append(dict(request.data, description=text))
+            self.listed.append({"id": len(self.created), "description": request.data.get("description")})
+            if text in self.applied_then_failed:
+                self.applied_then_failed.discard(text)
+                return 502, {"message": "Bad gateway"}
+            return {"success": True, "transaction": {"id": len(self.created)}}
+
+        self.listed = []
+        self.fake.add("POST", "transaction", handler=create)
+        self.fake.add("GET", "transactions", handler=lambda request: {"transactions": self.listed})
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def run_import(self, resolve_contractor=lambda name, inn: int(inn[-1])):
+        importer = OperationImporter(self.client, bank_account=12, journal=self.journal_path, concurrency=3,
+                                     queue_size=2, resolve_contractor=resolve_contractor)
+        try:
+            return importer.run(read_csv(self.csv_path))
+        finally:
+            importer.close()
+
+    def test_streams_rows_into_creates(self):
+        report = self.run_import()
+
+        self.assertEqual((report.created, report.skipped, len(report.failed)), (4, 0, 0))
+        self.assertEqual([line for line, _ in report.invalid], [4])
+        rent = [data for data in self.created if data["description"] == "Office rent"]
+        self.assertEqual(len(rent), 2) # identical rows are distinct payments
+        self.assertEqual((rent[0]["type"], rent[0]["amount"], rent[0]["date"], rent[0]["contractor"]),
+                         ("outcome", 200.5, "2024-01-15", 2))
+        self.assertTrue(all(data["bank_account"] == 12 for data in self.created))
+
+    def test_resumes_from_journal(self):
+        self.fail_descriptions = {"Refund"}
+        first = self.run_import()
+        self.assertEqual((first.created, len(first.failed)), (3, 1))
+
+        self.fail_descriptions = set()
+        second = self.run_import()
+
+        self.assertEqual((second.created, second.skipped), (1, 3))
+        self.assertEqual([data["description"] for data in self.created].count("Refund"), 1)
+        self.assertEqual(len(ImportJournal(self.journal_path).done), 4)
+
+    def test_keys_do_not_depend_on_rejected_rows(self):
+        failures = ["Landlord"] # the first identical rent row fails to resolve, once
+
+        def resolve(name, inn):
+            if name in failures:
+                failures.remove(name)
+                raise ConnectionError("Registry unavailable")
+            return int(inn[-1])
+
+        first = self.run_import(resolve_contractor=resolve)
+        self.assertEqual((first.created, sorted(line for line, _ in first.invalid)), (3, [3, 4]))
+        second = self.run_import()
+        self.assertEqual((second.created, second.skipped), (1, 3))
+        self.assertEqual([data["description"] for data in self.created].count("Office rent"), 2)
+
+    def test_unknown_outcome_is_looked_up_not_resent(self):
+        self.applied_then_failed = {"Refund"}
+        first = self.run_import()
+        self.assertEqual((first.created, len(first.failed)), (3, 1))
+
+        second = self.run_import()
+
+        self.assertEqual((second.created, second.skipped), (1, 3))
+        self.assertEqual([data["description"] for data in self.created].count("Refund"), 1)
+
+    def test_category_names_resolved_with_registry(self):
+        self.fake.add("GET", "transactions/categories", {"categories": [
+            {"id": 10, "name": "Sales", "type": 1}, {"id": 11, "name": "Rent", "type": 2}]})
+        rows = [(2, {"date": "2024-01-15", "amount": "100", "category": "sales"}),
+                (3, {"date": "2024-01-15", "amount": "-100", "category": "Rent"}),
+                (4, {"date": "2024-01-15", "amount": "5", "category": "Unknown"})]
+
+        report = OperationImporter(self.client, bank_account=12).run(rows)
+
+        self.assertEqual(report.created, 3)
+        self.assertEqual(sorted((data["amount"], data["type"], data.get("category")) for data in self.created),
+                         [(5.0, "income", None), (100.0, "income", 10), (100.0, "outcome", 11)])
+
+    def test_rejected_rows_are_journaled(self):
+        self.run_import()
+        with open(self.journal_path, encoding="utf-8") as f:
+            statuses = [json.loads(line)["status"] for line in f]
+        self.assertEqual(sorted(statuses), ["created"] * 4 + ["invalid"] + ["sending"] * 4)
+
+    def test_read_1c(self):
+        path = os.path.join(self.tmp, "statement.txt")
+        with open(path, "w", encoding="cp1251") as f:
+            f.write(ONE_C)
+
+        (line, fields), = read_1c(path, account_number="40702810000000000001")
+
+        self.assertEqual(line, 3)
+        self.assertEqual((fields["amount"], fields["contractor"], fields["contractor_inn"]),
+                         ("-1000.00", "ООО Поставщик", "7701000004"))
+
+
+if __name__ == '__main__':
+    unittest.main()
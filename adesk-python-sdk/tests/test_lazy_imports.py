@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+from adesk_python_sdk.adesk import AdeskClient, Project
+from adesk_python_sdk.adesk.client import ApiV2Namespace
+from adesk_python_sdk.adesk.projects import Projects
+from adesk_python_sdk.adesk.custom_reports import CustomReportGroups
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def run_isolated(self, code):
+        """Runs `code` in a fresh interpreter with the current import path; returns its stdout."""
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, sys.path)))
+        result = subprocess.run([sys.executable, "-c", textwrap.dedent(code)], env=env,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout.split()
+
+    def test_client_construction_imports_no_resources(self):
+        loaded = self.run_isolated("""
+            import sys
+            import adesk_python_sdk.adesk as adesk
+            client = adesk.AdeskClient("token")
+            print("requests" in sys.modules, "adesk_python_sdk.adesk.projects" in sys.modules,
+                  "adesk_python_sdk.adesk.models.projects" in sys.modules)
+            client.projects
+            print("adesk_python_sdk.adesk.projects" in sys.modules, "adesk_python_sdk.adesk.operations" in sys.modules)
+        """)
+        self.assertEqual(loaded, ["False", "False", "False", "True", "False"])
+
+    def test_resources_are_created_once_on_access(self):
+        client = AdeskClient("token")
+        self.assertNotIn("projects", vars(client))
+
+        projects = client.projects
+
+        self.assertIsInstance(projects, Projects)
+        self.assertIs(client.projects, projects)
+        self.assertIs(projects.client, client)
+        self.assertIsInstance(client.v2, ApiV2Namespace)
+        self.assertIsInstance(client.v2.custom_report_groups, CustomReportGroups)
+        self.assertIs(client.v2.custom_report_groups.client, client)
+
+    def test_lazy_package_attributes(self):
+        import adesk_python_sdk.adesk as adesk
+        self.assertIs(adesk.Project, Project)
+        self.assertIn("AdeskClient", dir(adesk))
+        with self.assertRaises(AttributeError):
+            adesk.NoSuchName
+
+
+if __name__ == '__main__':
+    unittest.main()
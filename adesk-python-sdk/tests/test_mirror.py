@@ -0,0 +1,175 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import date
+
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.mirror import LocalMirror, _month_shards, _named_range
+from adesk_python_sdk.adesk.models import Operation
+
+try:
+    import pandas # noqa: F401
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+from adesk_python_sdk.adesk.transports import FakeTransport
+
+
+class _MirrorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "mirror.db")
+        self.operations = {
+            i: {"id": i, "dateIso": f"2024-0{1 + i % 3}-{10 + i:02d}", "type": 1 + i % 2, "amount": str(i * 10),
+                "category": {"id": 100 + i % 2}, "bankAccount": {"id": 7, "legalEntity": {"id": 3}},
+                "contractor": {"id": 50}, "isPlanned": False, "isTransfer": False}
+            for i in range(1, 13)
+        }
+        self.fake = FakeTransport()
+
+        def transactions(request):
+            params = request.params
+            matching = sorted((op for op in self.operations.values()
+                               if params["range_start"] <= op["dateIso"][:10] <= params["range_end"]),
+                              key=lambda op: op["id"])
+            start, length = int(params["start"]), int(params["length"])
+            return {"transactions": matching[start:start + length]}
+
+        self.fake.add("GET", "transactions", handler=transactions)
+        self.fake.add("GET", "projects", {"projects": [{"id": 1, "name": "P"}]})
+        self.fake.add("GET", "contractors", {"contractors": [{"id": 50, "name": "C"}]})
+        self.fake.add("GET", "bank-accounts", {"bankAccounts": [{"id": 7, "name": "Main"}]})
+        self.fake.add("GET", "transactions/categories", {"categories": [{"id": 100, "name": "Sales"}]})
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+        self.mirror = LocalMirror(self.client, self.path, page_size=2, concurrency=2)
+
+    def tearDown(self):
+        self.mirror.close()
+        shutil.rmtree(self.tmp)
+
+    def rows(self):
+        with sqlite3.connect(self.path) as conn:
+            return conn.execute("SELECT id, date, amount, category_id, bank_account_id, legal_entity_id "
+                                "FROM operations ORDER BY id").fetchall()
+
+    def transaction_calls(self):
+        return [call for call in self.fake.calls if call.path.endswith("/transactions")]
+
+
+class TestLocalMirror(_MirrorTestCase):
+
+    def test_month_shards(self):
+        self.assertEqual(list(_month_shards("2023-12-15", "2024-02-01")), [
+            ("2023-12", "2023-12-01", "2023-12-31"),
+            ("2024-01", "2024-01-01", "2024-01-31"),
+            ("2024-02", "2024-02-01", "2024-02-29"),
+        ])
+
+    def test_load_pages_through_shards(self):
+        seen = []
+        progress = self.mirror.load("2024-01-01", "2024-03-31", on_progress=lambda p: seen.append(p.shards_done))
+
+        self.assertEqual((progress.shards_done, progress.rows, progress.failed), (3, 12, []))
+        self.assertEqual(seen, [1, 2, 3])
+        self.assertEqual(self.rows()[0], (1, "2024-02-11", 10.0, 101, 7, 3))
+        self.assertEqual([s["rows"] for s in self.mirror.shards()], [4, 4, 4])
+        # 4 operations per month, 2 per page: 3 requests per shard (the last one empty).
+        self.assertEqual(len(self.transaction_calls()), 9)
+
+    def test_load_resumes_and_refresh_picks_up_changes(self):
+        self.mirror.load("2024-01-01", "2024-02-29")
+        self.fake.calls.clear()
+        self.mirror.load("2024-01-01", "2024-03-31")
+        self.assertTrue(all(call.params["range_start"] == "2024-03-01" for call in self.transaction_calls()))
+
+        del self.operations[3]                                 # January
+        self.operations[1]["amount"] = "11"                    # February
+        self.operations[2]["dateIso"] = "2024-01-25"           # moved from March to January
+        self.fake.calls.clear()
+        self.mirror.mark_dirty("2024-01-15")
+        progress = self.mirror.refresh(window_days=10, today="2024-03-31")
+
+        self.assertEqual(progress.shards_done, 2) # January (dirty) and March (window)
+        dates = {row[0]: row[1] for row in self.rows()}
+        self.assertNotIn(3, dates)
+        self.assertEqual(dates[2], "2024-01-25")
+        self.assertEqual(self.rows()[0][2], 10.0) # February was not refreshed yet
+        self.mirror.refresh(window_days=45, today="2024-03-31")
+        self.assertEqual(self.rows()[0][2], 11.0)
+        self.assertEqual(self.mirror.stats()["operations"], 11)
+        self.assertEqual(self.mirror.stats()["dirty_shards"], 0)
+
+    def test_failed_shard_is_reported(self):
+        self.fake.add("GET", "transactions", {"message": "Unavailable"}, status=503)
+        progress = self.mirror.load("2024-01-01", "2024-01-31")
+        self.assertEqual([shard for shard, _ in progress.failed], ["2024-01"])
+        self.assertEqual(self.mirror.shards(), [])
+
+    def test_sync_references(self):
+        counts = self.mirror.sync_references()
+        self.assertEqual(counts, {"projects": 1, "contractors": 1, "bank_accounts": 1, "categories": 1})
+        self.assertEqual(self.mirror.stats()["contractors"], 1)
+
+
+class TestMirrorQueries(_MirrorTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.operations[4]["contractor"] = {"id": 51, "inn": "7700000000"}
+        self.operations[5]["isPlanned"] = True
+        self.operations[6]["category"] = {"id": 102, "isOwnerTransfer": True}
+        self.operations[7]["relatedDate"] = "01.12.2023"
+        self.mirror.load("2024-01-01", "2024-03-31")
+        self.fake.calls.clear()
+
+    def ids(self, **filters):
+        return [operation.id for operation in self.mirror.list_all(**filters)]
+
+    def test_filters_match_list_all(self):
+        self.assertEqual(self.ids(range_start="2024-01-01", range_end="2024-01-31"), [12, 9, 6, 3])
+        self.assertEqual(self.ids(range_start="2024-01-01", range_end="2024-01-31", type="income"), [12, 6])
+        self.assertEqual(self.ids(category=101, bank_account=7, legal_entity=3), [11, 5, 7, 1, 9, 3])
+        self.assertEqual(self.ids(contractor_inn="7700000000"), [4])
+        self.assertEqual(self.ids(contractor=51), [4])
+        self.assertEqual(self.ids(status="planned"), [5])
+        self.assertEqual(self.ids(owner_transfer=True), [6])
+        self.assertEqual(self.ids(date_type="related", range_end="2023-12-31"), [7])
+        self.assertEqual(self.ids(start=2, length=3), [5, 2, 10])
+        self.assertEqual(self.fake.calls, [])
+
+        operation = self.mirror.list_all(contractor=51)[0]
+        self.assertIsInstance(operation, Operation)
+        self.assertEqual(operation.amount, 40.0)
+
+    def test_unsupported_filters(self):
+        with self.assertRaises(ValueError):
+            self.mirror.list_all(taxes=True)
+        with self.assertRaises(ValueError):
+            self.mirror.list_all(type="transfer")
+        with self.assertRaises(ValueError):
+            self.mirror.list_all(range_str="last_decade")
+
+    def test_named_ranges(self):
+        today = date(2024, 2, 14)
+        self.assertEqual(_named_range("this_month", today), (date(2024, 2, 1), date(2024, 2, 29)))
+        self.assertEqual(_named_range("last_month", today), (date(2024, 1, 1), date(2024, 1, 31)))
+        self.assertEqual(_named_range("last_quarter", today), (date(2023, 10, 1), date(2023, 12, 31)))
+        self.assertEqual(_named_range("this_week", today), (date(2024, 2, 12), date(2024, 2, 18)))
+
+    def test_filters_use_indexes(self):
+        sql, args = self.mirror._select(("data",), contractor=50, range_start="2024-01-01")
+        plan = " ".join(row[-1] for row in self.mirror._query("EXPLAIN QUERY PLAN " + sql, args))
+        self.assertIn("USING INDEX operations_contractor_id", plan)
+
+    @unittest.skipUnless(HAS_PANDAS, "pandas is not installed")
+    def test_list_frame(self):
+        frame = self.mirror.list_frame(project=None, type="outcome")
+        self.assertEqual(len(frame), 6)
+        self.assertEqual(frame["amount"].sum(), 360.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
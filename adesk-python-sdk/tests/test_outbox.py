@@ -0,0 +1,124 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.outbox import Outbox
+from adesk_python_sdk.adesk.transports import FakeTransport
+
+
+class TestOutbox(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "outbox.db")
+        self.fake = FakeTransport()
+        self.created = []
+        self.failures = []
+
+        def create(request):
+            if self.failures:
+                return self.failures.pop(0), {"message": "Unavailable"}
+            self.created.append(request.data)
+            return {"success": True, "transaction": {"id": len(self.created), "description": request.data["description"]}}
+
+        self.fake.add("POST", "transaction", handler=create)
+        self.fake.add("GET", "transactions", handler=lambda request: {"transactions": []})
+        self.fake.add("POST", "transaction/{id}", handler=lambda request, id: {"transaction": {"id": int(id)}})
+        self.fake.add("POST", "transaction/{id}/remove", {"success": True})
+        self.fake.add("POST", "custom-report-values/create",
+                      handler=lambda request: {"success": True, "data": [dict(v, id=i) for i, v in enumerate(request.json, 1)]})
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+        self.outbox = Outbox(self.client, self.path, backoff=0)
+
+    def tearDown(self):
+        self.outbox.close()
+        shutil.rmtree(self.tmp)
+
+    def operation(self, n):
+        return {"date": "2024-01-15", "type": "income", "amount": n, "bank_account": 1, "description": f"op {n}"}
+
+    def test_entries_survive_restart_and_drain_in_order(self):
+        first = self.outbox.operations.create(**self.operation(1))
+        self.outbox.operations.update(transaction_id=5, date="2024-01-15", bank_account=1, amount=2)
+        self.outbox.operations.delete(transaction_id=5)
+        self.outbox.custom_report_values.create([{"entryId": 1, "amount": 1}])
+        self.outbox.custom_report_values.create([{"entryId": 2, "amount": 2}, {"entryId": 3, "amount": 3}])
+        self.outbox.close()
+
+        self.outbox = Outbox(self.client, self.path, backoff=0)
+        self.assertEqual(self.outbox.stats()["pending"], 5)
+        self.assertGreaterEqual(self.outbox.lag(), 0)
+
+        self.assertEqual(self.outbox.drain(), 5)
+
+        self.assertEqual(self.outbox.stats(), {"pending": 0, "done": 5, "failed": 0})
+        paths = [c.path.split("/v1/")[-1].split("/v2/")[-1] for c in self.fake.calls if c.method == "POST"]
+        self.assertLess(paths.index("transaction/5"), paths.index("transaction/5/remove"))
+        self.assertEqual(paths.count("custom-report-values/create"), 1) # merged into one request
+        entries = {e.id: e for e in self.outbox.entries()}
+        self.assertEqual(entries[first].result["id"], 1)
+        self.assertEqual([v["entryId"] for v in entries[5].result], [2, 3])
+
+    def test_creates_are_sent_in_one_batch(self):
+        for n in range(10):
+            self.outbox.operations.create(**self.operation(n))
+        self.assertEqual(self.outbox.send_batch(), 10)
+        self.assertEqual(self.outbox.stats(), {"pending": 0, "done": 10, "failed": 0})
+
+    def test_retries_then_reports_stuck_entries(self):
+        self.outbox.max_attempts = 2
+        self.failures = [503, 503, 503]
+        self.outbox.operations.create(**self.operation(1))
+        self.outbox.drain()
+
+        stuck, = self.outbox.stuck()
+        self.assertEqual((stuck.status, stuck.attempts), ("failed", 2))
+        self.assertIn("503", stuck.last_error)
+
+        self.outbox.retry(stuck.id)
+        self.outbox.drain()
+        self.assertEqual(self.outbox.stats()["done"], 1)
+        self.assertEqual(len(self.created), 1)
+
+    def test_unverifiable_transfer_is_failed_not_retried(self):
+        self.fake.add("POST", "transfer", {"message": "Bad gateway"}, status=502)
+        self.outbox.transfers.create(amount=5, from_bank_account=1, to_bank_account=2)
+        self.outbox.drain()
+
+        stuck, = self.outbox.stuck()
+        self.assertEqual((stuck.status, stuck.attempts), ("failed", 1))
+        self.assertIn("AdeskOutcomeUnknownError", stuck.last_error)
+        self.assertEqual(len([c for c in self.fake.calls if c.path.endswith("transfer")]), 1)
+
+    def test_throttled_transfer_is_retried(self):
+        statuses = [429]
+        self.fake.add("POST", "transfer", handler=lambda request: (statuses.pop(0), {"message": "Too many requests"})
+                      if statuses else {"success": True, "transfer": {"id": 3}})
+        self.outbox.transfers.create(amount=5, from_bank_account=1, to_bank_account=2)
+        self.outbox.drain()
+
+        self.assertEqual(self.outbox.stats(), {"pending": 0, "done": 1, "failed": 0})
+        self.assertEqual(len([c for c in self.fake.calls if c.path.endswith("transfer")]), 2)
+
+    def test_background_thread(self):
+        self.outbox.poll_interval = 0.01
+        self.outbox.start()
+        self.outbox.operations.create(**self.operation(1))
+        deadline = time.time() + 5
+        while self.outbox.stats()["done"] < 1 and time.time() < deadline:
+            time.sleep(0.01)
+        self.outbox.stop()
+        self.assertEqual(self.outbox.stats()["done"], 1)
+
+    def test_unsupported_mutation(self):
+        with self.assertRaises(ValueError):
+            self.outbox.enqueue("transfers", "delete", transfer_id=1)
+        with self.assertRaises(AttributeError):
+            self.outbox.transfers.update
+
+
+if __name__ == '__main__':
+    unittest.main()
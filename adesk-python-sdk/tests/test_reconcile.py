@@ -0,0 +1,108 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.exceptions import AdeskAPIError
+from adesk_python_sdk.adesk.mirror import LocalMirror
+from adesk_python_sdk.adesk.reconcile import Reconciler, _runs
+from adesk_python_sdk.adesk.transports import FakeTransport
+
+from tests.helpers import FakeClock
+
+
+class TestReconciler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.operations = {i: {"id": i, "dateIso": f"2024-03-{i:02d}", "type": 1, "amount": "10",
+                               "category": {"id": 5}} for i in range(1, 11)}
+        self.contractors = [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]
+        self.fake = FakeTransport()
+
+        def transactions(request):
+            params = request.params
+            matching = [op for op in self.operations.values()
+                        if params["range_start"] <= op["dateIso"] <= params["range_end"]]
+            start, length = int(params["start"]), int(params["length"])
+            return {"transactions": matching[start:start + length]}
+
+        self.fake.add("GET", "transactions", handler=transactions)
+        self.fake.add("GET", "contractors", handler=lambda request: {"contractors": self.contractors})
+        self.fake.add("GET", "projects", {"projects": []})
+        self.fake.add("GET", "bank-accounts", {"bankAccounts": []})
+        self.fake.add("GET", "transactions/categories", {"categories": []})
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+        self.mirror = LocalMirror(self.client, os.path.join(self.tmp, "mirror.db"))
+        self.mirror.load("2024-03-01", "2024-03-31")
+        self.clock = FakeClock(1000.0)
+        self.reconciler = Reconciler(self.client, self.mirror, window_days=7, max_silence=60, clock=self.clock)
+
+    def tearDown(self):
+        self.mirror.close()
+        shutil.rmtree(self.tmp)
+
+    def test_consistent_mirror_writes_nothing(self):
+        report = self.reconciler.check("2024-03-01", "2024-03-31")
+        self.assertEqual((report.days_checked, report.mismatched, report.rows_written), (10, [], 0))
+
+    def test_only_differing_days_are_resynced(self):
+        self.operations[3]["amount"] = "11"                       # sum differs
+        self.operations[4]["category"] = {"id": 6}                # same count and sum, checksum differs
+        del self.operations[5]                                    # count differs
+        self.operations[11] = {"id": 11, "dateIso": "2024-03-09", "type": 2, "amount": "1"}
+
+        report = self.reconciler.check("2024-03-01", "2024-03-31")
+
+        self.assertEqual(report.mismatched, ["2024-03-03", "2024-03-04", "2024-03-05", "2024-03-09"])
+        self.assertEqual(report.rows_written, 4)
+        self.assertEqual([op.id for op in self.mirror.list_all(range_start="2024-03-09", range_end="2024-03-09")],
+                         [11, 9])
+        self.assertEqual(self.mirror.list_all(category=6)[0].id, 4)
+        self.assertEqual(self.reconciler.check("2024-03-01", "2024-03-31").mismatched, [])
+
+    def test_gaps_trigger_a_window_check(self):
+        self.assertIsNone(self.reconciler.run(today="2024-03-10"))
+
+        self.clock.now += 61 # No webhook for longer than max_silence.
+        self.assertTrue(self.reconciler.gap_detected)
+        del self.operations[2]
+        report = self.reconciler.run(today="2024-03-10")
+        self.assertEqual((report.range_start, report.range_end), ("2024-03-03", "2024-03-10"))
+        self.assertEqual(report.mismatched, [])       # the deleted operation is outside the window
+        self.assertEqual(report.references["contractors"], (2, 0))
+
+        self.reconciler.heartbeat()
+        self.reconciler.record_outage()
+        report = self.reconciler.run(today="2024-03-05", references=())
+        self.assertEqual(report.references, {})
+        self.assertEqual(report.mismatched, ["2024-03-02"])
+        self.assertIsNone(self.reconciler.run(today="2024-03-05"))
+
+    def test_failed_run_keeps_the_gap(self):
+        self.reconciler.record_outage()
+        down = [503]
+        self.fake.add("GET", "transactions", handler=lambda request: (down.pop(), {"message": "Unavailable"})
+                      if down else {"transactions": []})
+        with self.assertRaises(AdeskAPIError):
+            self.reconciler.run(today="2024-03-10", references=())
+
+        self.assertTrue(self.reconciler.gap_detected)
+        self.assertIsNotNone(self.reconciler.run(today="2024-03-10", references=()))
+        self.assertFalse(self.reconciler.gap_detected)
+
+    def test_references(self):
+        self.mirror.sync_references(["contractors"])
+        self.contractors = [{"id": 1, "name": "A2"}, {"id": 3, "name": "C"}]
+        report = self.reconciler.check_references(["contractors"])
+        self.assertEqual(report.references, {"contractors": (2, 1)})
+        self.assertEqual(self.mirror.references("contractors"), {1: {"id": 1, "name": "A2"}, 3: {"id": 3, "name": "C"}})
+
+    def test_runs(self):
+        self.assertEqual(_runs(["2024-02-28", "2024-02-29", "2024-03-01", "2024-03-05"]),
+                         [("2024-02-28", "2024-03-01"), ("2024-03-05", "2024-03-05")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import threading
+import unittest
+
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.exceptions import AdeskBulkError
+from adesk_python_sdk.adesk.registry import ReferenceRegistry
+from adesk_python_sdk.adesk.transports import FakeTransport
+
+from tests.helpers import FakeClock
+
+
+class TestReferenceRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.contractors = [{"id": 1, "name": "ACME", "inn": "7701234567"}]
+        self.fake = FakeTransport()
+        self.fake.add("GET", "transactions/categories", {"categories": [
+            {"id": 10, "name": "Sales", "type": 1}, {"id": 11, "name": "Rent", "type": 2},
+            {"id": 12, "name": "Other", "type": 1}, {"id": 13, "name": "Other", "type": 2}]})
+        self.fake.add("GET", "bank-accounts", {"bankAccounts": [{"id": 20, "name": "Main", "number": "40702810000000000001"}]})
+        self.fake.add("GET", "contractors", handler=lambda request: {"contractors": self.contractors})
+        self.fake.add("GET", "projects", {"projects": [{"id": 30, "name": "Website  Redesign"}]})
+        self.fake.add("GET", "tags", {"tags": [{"id": 40, "name": "Urgent"}]})
+        self.fake.add("GET", "warehouse/units", {"units": [{"id": 50, "name": "Piece", "code": "796"}]})
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+        self.clock = FakeClock()
+        self.registry = ReferenceRegistry(self.client, ttl=300, miss_refresh=60, clock=self.clock)
+
+    def calls_to(self, path):
+        return len([call for call in self.fake.calls if call.path.endswith(path)])
+
+    def test_resolves_natural_keys(self):
+        self.assertEqual(self.registry.category_id(" sales "), 10)
+        self.assertEqual(self.registry.category_id("Other", type="outcome"), 13)
+        self.assertEqual(self.registry.bank_account_id("40702 81000 00000 00001"), 20)
+        self.assertEqual(self.registry.contractor_id("7701234567"), 1)
+        self.assertEqual(self.registry.project_id("website redesign"), 30)
+        self.assertEqual(self.registry.tag_id("URGENT"), 40)
+        self.assertEqual(self.registry.unit_id("796"), 50)
+        self.assertEqual(self.registry.get("units", 50).name, "Piece")
+        with self.assertRaises(ValueError):
+            self.registry.category_id("Other")
+
+    def test_lists_are_loaded_once_and_batches_share_them(self):
+        self.assertEqual(self.registry.category_ids(["Sales", "Rent", "Missing", None], type=None), [10, 11, None, None])
+        self.assertEqual(self.registry.category_ids(["Sales", "Rent"]), [10, 11])
+        self.assertEqual(self.calls_to("/transactions/categories"), 1)
+
+    def test_ttl_invalidation_and_refresh_on_miss(self):
+        self.registry.contractor_id("7701234567")
+        self.contractors.append({"id": 2, "name": "New", "inn": "7707654321"})
+
+        self.assertIsNone(self.registry.contractor_id("7707654321")) # Loaded less than miss_refresh ago.
+        self.clock.now = 60
+        self.assertEqual(self.registry.contractor_id("7707654321"), 2) # Unknown key: reloaded once.
+        self.assertEqual(self.calls_to("/contractors"), 2)
+
+        self.registry.contractor_ids(["7701234567", "7707654321"])
+        self.assertEqual(self.calls_to("/contractors"), 2)
+        self.clock.now = 360
+        self.registry.contractor_id("7701234567") # TTL expired.
+        self.assertEqual(self.calls_to("/contractors"), 3)
+
+        self.registry.invalidate("contractors")
+        self.registry.contractor_id("7701234567")
+        self.assertEqual(self.calls_to("/contractors"), 4)
+
+    def test_available_on_client(self):
+        self.assertIs(self.client.registry, self.client.registry)
+        self.assertEqual(self.client.registry.tag_id("Urgent"), 40)
+
+
+class TestEnsure(unittest.TestCase):
+
+    def setUp(self):
+        self.tags = [{"id": 1, "name": "Urgent"}]
+        self.contractors = [{"id": 1, "name": "ACME", "inn": "7701234567"}]
+        self.requisites = []
+        self.lock = threading.Lock()
+        self.fake = FakeTransport()
+
+        def create_tag(request):
+            if request.data["name"] == "Broken":
+                return 400, {"message": "Invalid name"}
+            with self.lock:
+                tag = {"id": len(self.tags) + 1, "name": request.data["name"], "color": request.data["color"]}
+                self.tags.append(tag)
+            return {"success": True, "tag": tag}
+
+        def create_contractor(request):
+            with self.lock:
+                contractor = {"id": len(self.contractors) + 1, "name": request.data["name"]}
+                self.contractors.append(contractor)
+            return {"success": True, "contractor": contractor}
+
+        self.fake.add("GET", "tags", handler=lambda request: {"tags": self.tags})
+        self.fake.add("POST", "tag", handler=create_tag)
+        self.fake.add("GET", "contractors", handler=lambda request: {"contractors": self.contractors})
+        self.fake.add("POST", "contractor", handler=create_contractor)
+        self.fake.add("POST", "requisites", handler=lambda request: self.requisites.append(request.data) or {"success": True})
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+
+    def calls(self, method, path):
+        return [call for call in self.fake.calls if call.method == method and call.path.endswith(path)]
+
+    def test_tags_ensure_creates_each_missing_name_once(self):
+        ids = self.client.tags.ensure(["Urgent", "Q1", "q1 ", "Review", "urgent", ""])
+
+        self.assertEqual(ids["Urgent"], 1)
+        self.assertEqual(ids["urgent"], 1)
+        self.assertEqual(ids["Q1"], ids["q1 "])
+        self.assertEqual(sorted(tag["name"] for tag in self.tags[1:]), ["Q1", "Review"])
+        self.assertEqual(len(self.calls("GET", "/tags")), 1)
+
+        # Created tags are remembered: no further requests.
+        self.fake.calls.clear()
+        self.assertEqual(self.client.tags.ensure(["review"]), {"review": ids["Review"]})
+        self.assertEqual(self.fake.calls, [])
+
+    def test_tags_ensure_reports_failures(self):
+        with self.assertRaises(AdeskBulkError) as cm:
+            self.client.tags.ensure(["Urgent", "Broken", "New"])
+        self.assertEqual(cm.exception.results, {"Urgent": 1, "New": 2})
+        self.assertEqual([name for name, _ in cm.exception.failures], ["Broken"])
+
+    def test_contractors_ensure_by_inn(self):
+        records = [{"name": "ACME", "inn": "7701234567"},
+                   {"name": "Beta", "inn": "7707654321", "email": "b@example.com"},
+                   {"name": "Beta LLC", "inn": "7707 654321"}]
+
+        ids = self.client.contractors.ensure(records)
+
+        self.assertEqual(ids, {"7701234567": 1, "7707654321": 2, "7707 654321": 2})
+        self.assertEqual(len(self.calls("POST", "/contractor")), 1)
+        self.assertEqual(self.requisites[0]["inn"], "7707654321")
+        self.assertEqual(self.client.registry.contractor_id("7707654321"), 2)
+
+    def test_contractors_ensure_removes_contractor_without_requisites(self):
+        self.fake.add("POST", "requisites", {"message": "Unavailable"}, status=500)
+        self.fake.add("POST", "contractor/{id}/remove", handler=lambda request, id: self.contractors.pop() and {"success": True})
+        with self.assertRaises(AdeskBulkError) as cm:
+            self.client.contractors.ensure([{"name": "Beta", "inn": "7707654321"}])
+        self.assertEqual([record["inn"] for record, _ in cm.exception.failures], ["7707654321"])
+        self.assertEqual(self.contractors, [{"id": 1, "name": "ACME", "inn": "7701234567"}])
+
+        self.fake.add("POST", "requisites", handler=lambda request: self.requisites.append(request.data) or {"success": True})
+        self.assertEqual(self.client.contractors.ensure([{"name": "Beta", "inn": "7707654321"}]), {"7707654321": 2})
+        self.assertEqual(len(self.contractors), 2)
+
+    def test_contractors_ensure_by_name(self):
+        ids = self.client.contractors.ensure([{"name": "acme"}, {"name": "Gamma"}], key="name")
+        self.assertEqual(ids, {"acme": 1, "Gamma": 2})
+        self.assertEqual(self.requisites, [])
+        with self.assertRaises(ValueError):
+            self.client.contractors.ensure([{"name": "No INN"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import gc
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.models import Operation, CustomReportGroup
+from adesk_python_sdk.adesk.transports import FakeTransport, RequestsTransport
+
+THREADS = 32
+REQUESTS_PER_THREAD = 50
+
+
+class TestSharedClientStress(unittest.TestCase):
+
+    def setUp(self):
+        self.fake = FakeTransport()
+        self.fake.add("GET", "transaction/{id}",
+                      handler=lambda request, id: {"transaction": {"id": int(id), "amount": id}})
+        self.fake.add("GET", "custom-report-groups",
+                      handler=lambda request: {"data": [{"id": int(request.params["id"]), "name": request.params["id"]}]})
+        self.fake.add("GET", "tags", {"success": True, "tags": []})
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+
+    def test_many_threads_share_one_client(self):
+        barrier = threading.Barrier(THREADS)
+        shared_params = {"id": "0"}
+
+        def worker(thread_index):
+            barrier.wait()
+            # Concurrent first accesses of the same resources.
+            resources = (self.client.operations, self.client.v2, self.client.v2.custom_report_groups)
+            mismatches = []
+            for i in range(REQUESTS_PER_THREAD):
+                operation_id = thread_index * REQUESTS_PER_THREAD + i + 1
+                operation = self.client.operations.get(operation_id)
+                if not isinstance(operation, Operation) or operation.id != operation_id:
+                    mismatches.append(operation_id)
+                response = self.client.get_v2("custom-report-groups", params={"id": str(operation_id)})
+                group = CustomReportGroup.from_list(response["data"])[0]
+                if group.id != operation_id:
+                    mismatches.append(-operation_id)
+                self.client.get("tags", params=shared_params) # must not mutate the shared dict
+            return resources, mismatches
+
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            results = list(pool.map(worker, range(THREADS)))
+
+        self.assertEqual([m for _, mismatches in results for m in mismatches], [])
+        first = results[0][0]
+        for resources, _ in results:
+            for resource, expected in zip(resources, first):
+                self.assertIs(resource, expected)
+        self.assertEqual(shared_params, {"id": "0"})
+        self.assertEqual(len(self.fake.calls), THREADS * REQUESTS_PER_THREAD * 3)
+
+
+class TestRequestsTransportSessions(unittest.TestCase):
+
+    def test_one_session_per_thread_over_shared_pool(self):
+        transport = RequestsTransport.with_session(pool_maxsize=4)
+        barrier = threading.Barrier(8)
+
+        def session_of_thread(_):
+            barrier.wait()
+            session = transport._get_session()
+            self.assertIs(transport._get_session(), session)
+            return session
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sessions = list(pool.map(session_of_thread, range(8)))
+
+        self.assertEqual(len({id(session) for session in sessions}), 8)
+        self.assertEqual(len({id(session.get_adapter("https://api.adesk.ru/")) for session in sessions}), 1)
+        transport.close()
+        self.assertEqual(len(transport._sessions), 0)
+
+    def test_sessions_of_finished_threads_are_dropped(self):
+        class Session:
+            def close(self):
+                pass
+
+        transport = RequestsTransport(session_factory=Session)
+        threads = [threading.Thread(target=transport._get_session) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        gc.collect()
+        self.assertEqual(len(transport._sessions), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
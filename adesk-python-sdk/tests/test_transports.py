@@ -0,0 +1,179 @@
+import asyncio
+import json
+import threading
+import unittest
+import warnings
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.exceptions import (
+    AdeskAPIError,
+    AdeskAuthError,
+    AdeskRateLimitError,
+    AdeskPaymentRequiredError,
+    AdeskNotFoundError,
+    AdeskServerError
+)
+from adesk_python_sdk.adesk.models import Operation
+from adesk_python_sdk.adesk.transports import (
+    FakeTransport, AsyncFakeTransport, Urllib3Transport, HTTPXTransport, HTTP2Transport,
+    TransportError, Transport
+)
+from adesk_python_sdk.adesk.transports.base import encode_query
+
+try:
+    import httpx # noqa: F401
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Answers every request with the method, path, query and body it received."""
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+        split = urlsplit(self.path)
+        if split.path.endswith("/missing"):
+            payload, status = {"message": "Nope"}, 404
+        else:
+            payload, status = {"method": self.command, "path": split.path, "query": parse_qs(split.query),
+                               "body": body, "token": self.headers.get("X-API-Token")}, 200
+        content = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSharedErrorMapping(unittest.TestCase):
+
+    def test_v1_and_v2_statuses(self):
+        fake = FakeTransport()
+        fake.add("GET", "auth", {"message": "bad token"}, status=401)
+        fake.add("GET", "limited", {"message": "slow down"}, status=429)
+        fake.add("GET", "broken", {"message": "oops"}, status=502)
+        fake.add("GET", "payment", {"code": 21, "message": "Pay"})
+        fake.add("GET", "plain", None, status=418)
+        client = AdeskClient(api_token="token", transport=fake)
+
+        with self.assertRaises(AdeskAuthError):
+            client.get("auth")
+        with self.assertRaises(AdeskRateLimitError):
+            client.get_v2("limited")
+        with self.assertRaises(AdeskServerError):
+            client.get("broken")
+        with self.assertRaises(AdeskPaymentRequiredError):
+            client.get("payment")
+        with self.assertRaises(AdeskNotFoundError):
+            client.get("unknown")
+        with self.assertRaises(AdeskAPIError) as cm:
+            client.get_v2("plain")
+        self.assertEqual(cm.exception.status_code, 418)
+
+    def test_transport_error_is_wrapped(self):
+        class FailingTransport(Transport):
+            def request(self, method, url, **kwargs):
+                raise TransportError("connection refused")
+
+        client = AdeskClient(api_token="token", transport=FailingTransport())
+        with self.assertRaises(AdeskAPIError) as cm:
+            client.get("projects")
+        self.assertIn("connection refused", str(cm.exception))
+
+
+class TestFakeTransport(unittest.TestCase):
+
+    def test_routes_and_calls(self):
+        fake = FakeTransport()
+        fake.add("GET", "transaction/{id}", handler=lambda request, id: {"transaction": {"id": int(id), "amount": "5"}})
+        client = AdeskClient(api_token="token", transport=fake)
+
+        operation = client.operations.get(42)
+
+        self.assertIsInstance(operation, Operation)
+        self.assertEqual(operation.id, 42)
+        self.assertEqual(operation.amount, 5.0)
+        self.assertEqual(fake.calls[0].params["api_token"], "token")
+        self.assertTrue(fake.calls[0].path.endswith("/v1/transaction/42"))
+
+    def test_async_client_methods(self):
+        fake = AsyncFakeTransport()
+        fake.add("POST", "custom-report-values/create", {"data": [{"id": 1}]})
+        client = AdeskClient(api_token="token", async_transport=fake)
+
+        response = asyncio.run(client.apost_v2("custom-report-values/create", json_data=[{"entryId": 1}]))
+
+        self.assertEqual(response, {"data": [{"id": 1}]})
+        self.assertEqual(fake.calls[0].json, [{"entryId": 1}])
+        self.assertEqual(fake.calls[0].headers["X-API-Token"], "token")
+
+    def test_default_async_transport_runs_sync_transport(self):
+        fake = FakeTransport()
+        fake.add("GET", "tags", {"tags": [{"id": 1}]})
+        client = AdeskClient(api_token="token", transport=fake)
+        self.assertEqual(asyncio.run(client.aget("tags")), {"tags": [{"id": 1}]})
+
+
+class TestNetworkTransports(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        host, port = cls.server.server_address
+        cls.base_v1 = f"http://{host}:{port}/v1/"
+        cls.base_v2 = f"http://{host}:{port}/v2/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def check_transport(self, transport):
+        with AdeskClient("token", base_url=self.base_v1, base_url_v2=self.base_v2, transport=transport) as client:
+            echoed = client.get("projects", params={"managers[]": [1, 2]})
+            self.assertEqual(echoed["path"], "/v1/projects")
+            self.assertEqual(echoed["query"], {"managers[]": ["1", "2"], "api_token": ["token"]})
+
+            echoed = client.post("project", data={"name": "X"})
+            self.assertEqual(parse_qs(echoed["body"]), {"name": ["X"], "api_token": ["token"]})
+
+            echoed = client.post_v2("custom-report-groups/create", json_data=[{"name": "G"}])
+            self.assertEqual(json.loads(echoed["body"]), [{"name": "G"}])
+            self.assertEqual(echoed["token"], "token")
+
+            with self.assertRaises(AdeskNotFoundError):
+                client.get_v2("missing")
+
+    def test_urllib3_transport(self):
+        self.check_transport(Urllib3Transport())
+
+    @unittest.skipUnless(HAS_HTTPX, "httpx is not installed")
+    def test_httpx_transport(self):
+        self.check_transport(HTTPXTransport(http2=False))
+
+    @unittest.skipUnless(HAS_HTTPX, "httpx is not installed")
+    def test_http2_transport_falls_back_to_http1(self):
+        with patch("adesk_python_sdk.adesk.transports.httpx_transport.http2_available", return_value=False):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                transport = HTTP2Transport()
+        self.assertTrue(any(issubclass(w.category, RuntimeWarning) for w in caught))
+        self.check_transport(transport)
+
+    def test_encode_query_matches_requests(self):
+        self.assertEqual(encode_query({"a": [1, 2], "b": None, "c": "x y"}), "a=1&a=2&c=x+y")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import asyncio
+import unittest
+
+from adesk_python_sdk.adesk.webhook_buffer import WebhookBuffer, fingerprint
+
+from tests.helpers import FakeClock
+
+
+def event(name, id, version=None, **data):
+    payload = {"event": name, "data": dict(data, id=id)}
+    if version is not None:
+        payload["data"]["updatedAt"] = version
+    return payload
+
+
+class TestWebhookBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.handled = []
+        self.buffer = WebhookBuffer(self.handled.append, window=60, delay=1.0, clock=self.clock)
+
+    def names_and_versions(self, events):
+        return [(e.name, e.data[0]["id"], e.data[0].get("updatedAt")) for e in events]
+
+    def test_duplicates_within_window_are_dropped(self):
+        self.assertTrue(self.buffer.push(event("transaction_updated", 1, "v1")))
+        self.assertFalse(self.buffer.push(event("transaction_updated", 1, "v1")))
+        self.clock.now = 61
+        self.assertTrue(self.buffer.push(event("transaction_updated", 1, "v1"))) # The window has passed.
+        self.assertEqual(self.buffer.stats["duplicates"], 1)
+        self.assertEqual(fingerprint({"a": 1, "b": 2}), fingerprint({"b": 2, "a": 1}))
+
+    def test_reorders_and_collapses_per_entity(self):
+        self.buffer.push(event("transaction_updated", 1, "2024-01-01T10:00:02", amount=3))
+        self.buffer.push(event("transaction_updated", 2, None, amount=9))
+        self.buffer.push(event("transaction_created", 1, "2024-01-01T10:00:00", amount=1))
+        self.buffer.push(event("transaction_updated", 1, "2024-01-01T10:00:01", amount=2))
+
+        self.clock.now = 0.5
+        self.assertEqual(self.buffer.flush(), [])
+        self.clock.now = 1.0
+        emitted = self.buffer.flush()
+
+        self.assertEqual(self.names_and_versions(emitted), [("transaction_updated", 1, "2024-01-01T10:00:02"),
+                                                            ("transaction_updated", 2, None)])
+        self.assertEqual(self.handled, emitted)
+        self.assertEqual(self.buffer.stats["collapsed"], 2)
+
+        # Arriving after a newer version of the same entity was passed on: stale.
+        self.buffer.push(event("transaction_updated", 1, "2024-01-01T10:00:01", amount=2, note="late"))
+        self.clock.now = 2.0
+        self.assertEqual(self.buffer.flush(), [])
+        self.assertEqual(self.buffer.stats["stale"], 1)
+
+    def test_delete_supersedes_updates_and_batches_are_split(self):
+        self.buffer.push({"event": "transaction_updated", "data": [{"id": 1}, {"id": 2}]})
+        self.buffer.push({"event": "transaction_deleted", "data": {"id": 1}})
+        self.buffer.push({"event": "transaction_updated", "data": {"id": 1, "amount": 5}})
+        emitted = self.buffer.flush(force=True)
+        self.assertEqual([(e.name, e.data[0]["id"]) for e in emitted],
+                         [("transaction_deleted", 1), ("transaction_updated", 2)])
+        self.assertEqual(self.buffer.pending, 0)
+
+    def test_unknown_events_pass_through(self):
+        self.buffer.push({"event": "warehouse_updated", "data": {"id": 1}})
+        self.buffer.push({"event": "warehouse_updated", "data": {"id": 2}})
+        self.clock.now = 1.0
+        self.assertEqual(len(self.buffer.flush()), 2)
+
+    def test_run_flushes_periodically_and_on_cancel(self):
+        received = []
+
+        async def handler(event):
+            received.append(event.data[0]["id"])
+
+        async def main():
+            buffer = WebhookBuffer(handler, delay=0.02)
+            task = asyncio.ensure_future(buffer.run())
+            buffer.push(event("project_updated", 1))
+            await asyncio.sleep(0.1)
+            self.assertEqual(received, [1])
+            buffer.push(event("project_updated", 2))
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        asyncio.run(main())
+        self.assertEqual(received, [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import unittest
+from urllib.parse import urlencode
+
+from adesk_python_sdk.adesk.models import Operation, Project
+from adesk_python_sdk.adesk.webhook_server import WebhookReceiver
+
+
+async def post(receiver, body, path="/hooks", content_type="application/json", method="POST"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", receiver.port)
+    body = body.encode("utf-8")
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Type: {content_type}\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return int(response.split(b" ")[1]), response
+
+
+class TestWebhookReceiver(unittest.TestCase):
+
+    def run_with_receiver(self, scenario, **options):
+        async def main():
+            receiver = WebhookReceiver(port=0, path="/hooks", **options)
+            await scenario(receiver)
+        asyncio.run(main())
+
+    def test_events_are_parsed_and_dispatched(self):
+        received = {"transactions": [], "all": [], "async": []}
+
+        async def scenario(receiver):
+            @receiver.on("transaction_*")
+            def on_transaction(event):
+                received["transactions"].extend(event.objects)
+
+            async def on_project(event):
+                received["async"].extend(event.objects)
+
+            receiver.on("project_updated", on_project)
+            receiver.on("*", lambda event: received["all"].append(event.name))
+            await receiver.start()
+
+            status, _ = await post(receiver, json.dumps({"event": "transaction_created",
+                                                         "data": {"id": 1, "amount": "5"}}))
+            self.assertEqual(status, 202)
+            form = urlencode({"event": "project_updated", "project": json.dumps({"id": 2, "name": "P"})})
+            status, _ = await post(receiver, form, content_type="application/x-www-form-urlencoded")
+            self.assertEqual(status, 202)
+            await receiver.stop()
+
+            self.assertEqual(receiver.stats, {"received": 2, "rejected": 0, "processed": 2, "failed": 0})
+
+        self.run_with_receiver(scenario)
+        self.assertIsInstance(received["transactions"][0], Operation)
+        self.assertEqual(received["transactions"][0].amount, 5.0)
+        self.assertIsInstance(received["async"][0], Project)
+        self.assertEqual(sorted(received["all"]), ["project_updated", "transaction_created"])
+
+    def test_backpressure_when_queue_is_full(self):
+        async def scenario(receiver):
+            release = asyncio.Event()
+
+            @receiver.on("*")
+            async def slow(event):
+                await release.wait()
+
+            await receiver.start()
+            body = json.dumps({"event": "transaction_updated", "data": {"id": 1}})
+            self.assertEqual((await post(receiver, body))[0], 202) # Taken by the worker.
+            await asyncio.sleep(0.01)
+            self.assertEqual((await post(receiver, body))[0], 202) # Queued.
+            status, response = await post(receiver, body)
+            self.assertEqual(status, 503)
+            self.assertIn(b"Retry-After: 1", response)
+            release.set()
+            await receiver.stop()
+            self.assertEqual(receiver.stats["processed"], 2)
+            self.assertEqual(receiver.stats["rejected"], 1)
+
+        self.run_with_receiver(scenario, workers=1, queue_size=1, enqueue_timeout=0.05)
+
+    def test_handler_errors_are_reported(self):
+        errors = []
+
+        async def scenario(receiver):
+            receiver.on("*", lambda event: 1 / 0)
+            await receiver.start()
+            await post(receiver, json.dumps({"event": "contractor_deleted", "id": 3}))
+            await receiver.stop()
+            self.assertEqual(receiver.stats["failed"], 1)
+
+        self.run_with_receiver(scenario, on_error=lambda event, e: errors.append((event.data, type(e))))
+        self.assertEqual(errors, [([{"id": 3}], ZeroDivisionError)])
+
+    def test_bad_requests(self):
+        async def scenario(receiver):
+            await receiver.start()
+            self.assertEqual((await post(receiver, "{}", path="/other"))[0], 404)
+            self.assertEqual((await post(receiver, "", method="GET"))[0], 405)
+            self.assertEqual((await post(receiver, "not json"))[0], 400)
+            self.assertEqual((await post(receiver, "x" * 100))[0], 413)
+            await receiver.stop()
+            self.assertEqual(receiver.stats["received"], 0)
+
+        self.run_with_receiver(scenario, max_body_size=50)
+
+    def test_stalled_clients_are_disconnected(self):
+        async def scenario(receiver):
+            await receiver.start()
+            for partial in (b"POST /hooks HTTP/1.1\r\nHost: te",                     # stalls in the head
+                            b"POST /hooks HTTP/1.1\r\nContent-Length: 10\r\n\r\n{"):  # stalls in the body
+                reader, writer = await asyncio.open_connection("127.0.0.1", receiver.port)
+                writer.write(partial)
+                await writer.drain()
+                self.assertEqual(await asyncio.wait_for(reader.read(), 5), b"")
+                writer.close()
+            await receiver.stop()
+            self.assertEqual(receiver.stats["received"], 0)
+
+        self.run_with_receiver(scenario, read_timeout=0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
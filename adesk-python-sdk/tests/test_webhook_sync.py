@@ -0,0 +1,78 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from adesk_python_sdk.adesk.client import AdeskClient
+from adesk_python_sdk.adesk.mirror import LocalMirror
+from adesk_python_sdk.adesk.transports import FakeTransport
+from adesk_python_sdk.adesk.webhook_sync import WebhookApplier
+
+
+class TestWebhookApplier(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.fake = FakeTransport()
+        self.fake.add("GET", "transaction/{id}", handler=lambda request, id: {"transaction": {
+            "id": int(id), "dateIso": "2024-02-01", "amount": "99", "type": 2, "category": {"id": 5}}})
+        self.fake.add("GET", "transaction/404", {"message": "Not found"}, status=404)
+        self.fake.add("GET", "projects", {"projects": [{"id": 3, "name": "Fetched project"}]})
+        self.client = AdeskClient(api_token="token", transport=self.fake)
+        self.mirror = LocalMirror(self.client, os.path.join(self.tmp, "mirror.db"))
+        self.applier = WebhookApplier(self.client, self.mirror)
+
+    def tearDown(self):
+        self.mirror.close()
+        shutil.rmtree(self.tmp)
+
+    def test_complete_payload_is_applied_without_requests(self):
+        change = self.applier.apply(json.dumps({"event": "transaction_created", "data": {
+            "id": 1, "dateIso": "2024-01-15", "amount": "100", "type": 1, "category": {"id": 5},
+            "bankAccount": {"id": 2}, "description": "Invoice 1", "contractor": None, "project": None}}))
+
+        self.assertEqual((change.kind, change.action, change.ids, change.refetched), ("operations", "upsert", [1], []))
+        self.assertEqual(self.fake.calls, [])
+        self.assertEqual([op.amount for op in self.mirror.list_all(category=5)], [100.0])
+
+    def test_partial_payload_is_refetched(self):
+        change = self.applier.apply({"event": "transaction_updated", "transaction": {"id": 7}})
+
+        self.assertEqual((change.ids, change.refetched), ([7], [7]))
+        self.assertEqual(self.mirror.list_all()[0].amount, 99.0)
+
+    def test_payload_missing_mirrored_fields_is_refetched(self):
+        change = self.applier.apply({"event": "transaction_updated", "transaction": {
+            "id": 8, "dateIso": "2024-02-01", "amount": "99", "type": 2, "bankAccount": {"id": 2}}})
+
+        self.assertEqual(change.refetched, [8])
+        self.assertEqual(self.mirror.list_all()[0].category.id, 5)
+
+    def test_deletes(self):
+        self.applier.apply({"event": "transaction_created", "data": [
+            {"id": 1, "date": "15.01.2024", "amount": "1", "type": 1},
+            {"id": 2, "date": "16.01.2024", "amount": "2", "type": 1}]})
+        change = self.applier.apply({"event": "transaction_deleted", "data": {"id": 1}})
+        self.assertEqual((change.action, change.ids), ("delete", [1]))
+        # An update for an operation that no longer exists removes it too.
+        self.applier.apply({"event": "transaction_updated", "data": {"id": 404}})
+        self.assertEqual([op.id for op in self.mirror.list_all()], [2])
+
+    def test_reference_objects(self):
+        self.applier.apply({"event": "contractor_created", "contractor": {"id": 9, "name": "ACME"}})
+        change = self.applier.apply({"event": "project_updated", "project": {"id": 3}})
+        self.assertEqual(change.refetched, [3])
+        self.assertEqual(self.mirror.stats()["contractors"], 1)
+        self.assertEqual(self.mirror.stats()["projects"], 1)
+
+        self.applier.apply({"event": "contractor_deleted", "id": 9})
+        self.assertEqual(self.mirror.stats()["contractors"], 0)
+
+    def test_unknown_events_are_ignored(self):
+        self.assertIsNone(self.applier.apply({"event": "warehouse_updated", "data": {"id": 1}}))
+        self.assertIsNone(self.applier.apply({"event": "transaction_exported", "data": {"id": 1}}))
+
+
+if __name__ == '__main__':
+    unittest.main()